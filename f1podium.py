@@ -1,17 +1,123 @@
 import pandas as pd
 import numpy as np
 from sklearn.metrics import mean_squared_error
+from sklearn.linear_model import Ridge
+from scipy.special import ndtr
 import warnings
 import tkinter as tk
 from tkinter import filedialog, ttk, Scale, messagebox
 import os
 import re
+import json
+import hashlib
+import pickle
+import sqlite3
+import shutil
 import sys
+import time
+import socket
 import traceback
+import threading
+import queue
+from collections import OrderedDict
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
+def _simulate_points_chunk(scores, sigmas, events, n_simulations, seed):
+    """
+    Simulate championship points for one chunk of seasons (worker process entry point)
+    scores: races x drivers, sigmas: per-race score noise,
+    events: list of (race index, points per finishing position)
+    Returns an array of points scored (simulations x drivers)
+    """
+    rng = np.random.default_rng(seed)
+    totals = np.zeros((n_simulations, scores.shape[1]))
+
+    for race_idx, points in events:
+        positions = _draw_finishing_positions(rng, scores[race_idx], sigmas[race_idx], n_simulations)
+        totals += points[positions - 1]
+    return totals
+
+
+_session_worker = None
+
+
+def _init_session_worker(reference_state):
+    """
+    Set up the predictor used to normalize session data in a worker process
+    reference_state holds the name tables and settings the parent predictor
+    normalizes with, so workers standardize names exactly as the serial path does
+    """
+    global _session_worker
+    _session_worker = F1RacePredictor()
+    for name, table in reference_state.items():
+        setattr(_session_worker, name, table)
+
+
+def _normalize_weekend_task(sessions, is_sprint):
+    """
+    Normalize the raw session frames of one weekend (worker process entry point)
+    sessions: dict of session kind to (DataFrame, resolved columns)
+    Returns a dict of session kind to normalized DataFrame
+    """
+    _session_worker.is_sprint_weekend = is_sprint
+    normalizers = {
+        'quali': _session_worker._normalize_quali,
+        'practice': _session_worker._normalize_practice,
+        'sprint': _session_worker._normalize_sprint,
+        'sprint_quali': _session_worker._normalize_sprint_quali
+    }
+    return {kind: normalizers[kind](df, cols) for kind, (df, cols) in sessions.items()}
+
+
+_attached_blocks = {}
+
+
+def _attach_shared_arrays(descriptor):
+    """
+    Attach to arrays published by F1SharedArrays (zero-copy, read-only views)
+    The block is attached once per process and reused by later tasks; blocks of
+    earlier descriptors are closed when a new one arrives, so a long-lived pool
+    keeps only the current mapping
+    """
+    name, layout = descriptor
+    if name not in _attached_blocks:
+        for stale in list(_attached_blocks):
+            block, views = _attached_blocks.pop(stale)
+            del views
+            block.close()
+        block = shared_memory.SharedMemory(name=name)
+        _attached_blocks[name] = (block, F1SharedArrays.views(block, layout))
+    return _attached_blocks[name][1]
+
+
+def _simulate_points_shared(descriptor, events, n_simulations, seed):
+    """
+    Simulate one chunk of seasons reading scores and points tables from shared memory
+    events: list of (race index, name of the points array)
+    """
+    arrays = _attach_shared_arrays(descriptor)
+    events = [(race_idx, arrays[points]) for race_idx, points in events]
+    return _simulate_points_chunk(arrays['scores'], arrays['sigmas'], events, n_simulations, seed)
+
+
+def _draw_finishing_positions(rng, scores, sigma, n_simulations):
+    """
+    Draw finishing positions (1 = winner) for every simulation of one race at once
+    Returns an integer array of shape (simulations, drivers)
+    """
+    n_drivers = len(scores)
+    noisy = scores + sigma * rng.standard_normal((n_simulations, n_drivers))
+    order = np.argsort(-noisy, axis=1)
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, np.arange(1, n_drivers + 1)[None, :], axis=1)
+    return positions
+
+
 class F1RacePredictor:
     """F1 Race Prediction Model for Top 3 Finishers with rain factors and sprint race support"""
     
@@ -19,18 +125,189 @@ class F1RacePredictor:
         """Initialize predictor"""
         # The main prediction class code remains unchanged
         # All the core functionality is kept the same
+        # Raw session frames are only held while load_data merges them into the compact
+        # combined_data, so these stay None once loading is done
         self.quali_data = None
         self.practice_data = None
         self.sprint_data = None  # Sprint results data
         self.sprint_quali_data = None  # Sprint qualifying data
         self.race_name = None
+        self.track = None
         self.combined_data = None
         self.top3_prediction = None
         self.mse = None
         self.rmse = None
         self.rain_probability = 0.0  # Default: dry conditions
+        self.weather_forecast = None  # Rain probability over race time, from a forecast file
         self.is_sprint_weekend = False  # Flag for sprint weekend
-        
+        self.practice_longruns = None  # Long-run pace from lap-level practice data
+        self._csv_cache = {}  # Parsed CSV files keyed by path, mtime, size and columns
+
+        # Column name aliases per session file type, resolved against the header only
+        self.session_columns = {
+            'quali': {
+                'pos': ['POS', 'Pos', 'Position', 'POSITION'],
+                'driver': ['DRIVER', 'Driver', 'NAME', 'Name'],
+                'car': ['CAR', 'Car', 'TEAM', 'Team', 'Constructor'],
+                'q1': ['Q1', 'Q1 Time', 'Q1TIME'],
+                'q2': ['Q2', 'Q2 Time', 'Q2TIME'],
+                'q3': ['Q3', 'Q3 Time', 'Q3TIME'],
+                's1': ['S1', 'S1 Time', 'Sector 1', 'Sector 1 Time', 'Sector1Time', 'SECTOR1', 'SECTOR_1'],
+                's2': ['S2', 'S2 Time', 'Sector 2', 'Sector 2 Time', 'Sector2Time', 'SECTOR2', 'SECTOR_2'],
+                's3': ['S3', 'S3 Time', 'Sector 3', 'Sector 3 Time', 'Sector3Time', 'SECTOR3', 'SECTOR_3']
+            },
+            'practice': {
+                'driver': ['DRIVER', 'Driver', 'NAME', 'Name'],
+                'car': ['CAR', 'Car', 'TEAM', 'Team', 'Constructor'],
+                'p1': ['P1', 'P1 Time', 'FP1', 'Practice 1', 'TIME', 'Time'],
+                'p2': ['P2', 'P2 Time', 'FP2', 'Practice 2'],
+                'p3': ['P3', 'P3 Time', 'FP3', 'Practice 3']
+            },
+            'sprint': {
+                'pos': ['POS', 'Pos', 'Position', 'POSITION'],
+                'driver': ['DRIVER', 'Driver', 'NAME', 'Name'],
+                'car': ['CAR', 'Car', 'TEAM', 'Team', 'Constructor'],
+                'time': ['TIME', 'Time', 'TIME/RETIRED', 'RESULT', 'Result'],
+                'laps': ['LAPS', 'Laps']
+            },
+            'sprint_quali': {
+                'pos': ['POS', 'Pos', 'Position', 'POSITION'],
+                'driver': ['DRIVER', 'Driver', 'NAME', 'Name'],
+                'car': ['CAR', 'Car', 'TEAM', 'Team', 'Constructor'],
+                'q1': ['Q1', 'SQ1', 'SQ1 Time'],
+                'q2': ['Q2', 'SQ2', 'SQ2 Time'],
+                'q3': ['Q3', 'SQ3', 'SQ3 Time']
+            },
+            'practice_laps': {
+                'DRIVER': ['DRIVER', 'Driver', 'NAME', 'Name'],
+                'LAP_TIME': ['LAP_TIME', 'LapTime', 'Lap Time', 'TIME', 'Time'],
+                'LAP': ['LAP', 'Lap', 'LAP_NUMBER', 'LapNumber', 'Lap Number'],
+                'SESSION': ['SESSION', 'Session'],
+                'STINT': ['STINT', 'Stint'],
+                'COMPOUND': ['COMPOUND', 'Compound', 'TYRE', 'Tyre', 'TIRE', 'Tire'],
+                'TYRE_LIFE': ['TYRE_LIFE', 'TyreLife', 'Tyre Life', 'TIRE_AGE', 'Tire Age'],
+                'S1': ['S1', 'S1 Time', 'Sector1Time', 'Sector 1', 'Sector 1 Time', 'SECTOR1', 'SECTOR_1'],
+                'S2': ['S2', 'S2 Time', 'Sector2Time', 'Sector 2', 'Sector 2 Time', 'SECTOR2', 'SECTOR_2'],
+                'S3': ['S3', 'S3 Time', 'Sector3Time', 'Sector 3', 'Sector 3 Time', 'SECTOR3', 'SECTOR_3'],
+                'YEAR': ['YEAR', 'Year', 'SEASON', 'Season'],
+                'EVENT': ['EVENT', 'Event', 'EventName', 'GRAND_PRIX', 'Grand Prix'],
+                'POSITION': ['POSITION', 'Position', 'POS', 'Pos']
+            },
+            'weather': {
+                'time': ['LAP', 'Lap', 'HOUR', 'Hour', 'MINUTE', 'Minute', 'TIME', 'Time'],
+                'rain': ['RAIN', 'Rain', 'RAIN_PROBABILITY', 'PRECIPITATION', 'Precipitation'],
+                'scenario': ['SCENARIO', 'Scenario', 'MEMBER', 'Member']
+            }
+        }
+        # Roles only matched by exact name: their aliases are common substrings of
+        # other timing columns (Session in Sector1SessionTime, Tyre in TyreLife, S1 in
+        # any header that happens to contain those two letters)
+        self.exact_column_roles = {
+            'quali': {'s1', 's2', 's3'},
+            'practice_laps': {'SESSION', 'STINT', 'COMPOUND', 'YEAR', 'EVENT', 'POSITION', 'S1', 'S2', 'S3'}
+        }
+        # Lowercased, de-duplicated aliases so matching does no per-lookup work
+        self._column_aliases = {
+            kind: {role: list(dict.fromkeys(name.lower() for name in names))
+                   for role, names in roles.items()}
+            for kind, roles in self.session_columns.items()
+        }
+        self._fingerprint_cache = {}  # Input file hashes keyed by path, mtime and size
+
+        # Scoring factors in the column order used by the vectorized scorer
+        self.regular_factors = ['position', 'quali', 'p2', 'p3', 'team', 'tire',
+                                'experience', 'wet_driver', 'wet_team']
+        self.sprint_factors = ['position', 'quali', 'sprint', 'p1', 'team', 'tire',
+                               'driver_sprint', 'team_sprint', 'wet_driver', 'wet_team']
+        self.factor_labels = {
+            'position': "Starting position",
+            'quali': "Qualifying pace",
+            'p1': "Practice 1",
+            'p2': "Practice 2 (race pace)",
+            'p3': "Practice 3",
+            'sprint': "Sprint race performance",
+            'team': "Team race pace",
+            'tire': "Tire management",
+            'experience': "Driver experience",
+            'driver_sprint': "Driver sprint ability",
+            'team_sprint': "Team sprint setup",
+            'wet_driver': "Driver wet weather skill",
+            'wet_team': "Team wet weather performance",
+            'ranker': "Learned ranker"
+        }
+        self.factor_contributions = None  # Per-driver contributions to the last race scores
+
+        # Race-day spread of race_score around its predicted value in dry conditions
+        # (rain widens it the same way it widens the position error)
+        self.score_noise = 0.04
+
+        # Precomputed weight vectors per track and rain level (1% steps), rebuilt
+        # whenever the track database changes; changes go through update_track (or
+        # call invalidate_track_tables after editing track_database in place)
+        self.weight_table_steps = 100
+        self._weight_tables = None
+        self._weight_table_version = None
+        self._track_table_version = 0
+
+        # Similarity index over track features for venues missing from the track
+        # database; extra numeric keys (e.g. history-derived ones) can be appended
+        self.track_similarity_features = ['overtaking_difficulty', 'tire_degradation',
+                                          'start_importance', 'is_sprint']
+        self.track_neighbours = 3
+        self.venue_features = {}  # Known features of venues outside the database
+        self._track_index = None
+        self._track_index_version = None
+
+        # Championship points for finishing positions
+        self.race_points = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+        self.sprint_points = [8, 7, 6, 5, 4, 3, 2, 1]
+        self.championship_projection = None
+        self.results_store = None  # F1ResultsStore that records every prediction when set
+
+        # Optional learned ranker (see train_ranker), blended with the heuristic race score
+        self.ranker = None
+        self.ranker_blend = 0.3
+        self.input_paths = ()  # Session files behind the loaded data
+
+        # Random streams: simulations run in fixed-size chunks, each with its own child
+        # stream of the seed, so results do not depend on the number of workers
+        self.simulation_chunk_size = 2500
+        self.error_seed = 42
+
+        # Measurement noise (standard deviation in seconds) of single timing inputs,
+        # used by bootstrap_intervals; long runs use their own lap spread instead
+        self.timing_noise = {'quali': 0.05, 'practice': 0.15}
+
+        # Share of the ideal lap (sum of best sectors) in gap_to_pole and the FP3 time
+        # when sector times are available
+        self.ideal_lap_weight = 0.5
+        self.sector_columns = ['S1', 'S2', 'S3']
+
+        # Long-run detection and correction settings for lap-level practice data
+        self.long_run_settings = {
+            "min_laps": 5,                 # Shortest stint counted as a long run
+            "outlier_threshold": 1.03,     # Laps slower than 103% of the run median are dropped
+            "fuel_per_lap": 0.06,          # Seconds gained per lap as fuel burns off
+            "chunksize": 50000             # Rows read per chunk from lap-level files
+        }
+
+        # Compound pace offsets relative to the medium tire (seconds per lap)
+        # and per-lap degradation at an average track (tire_degradation of 6)
+        self.tire_compound_offsets = {
+            "SOFT": -0.6,
+            "MEDIUM": 0.0,
+            "HARD": 0.5,
+            "INTERMEDIATE": 0.0,
+            "WET": 0.0
+        }
+        self.tire_compound_degradation = {
+            "SOFT": 0.09,
+            "MEDIUM": 0.06,
+            "HARD": 0.04,
+            "INTERMEDIATE": 0.05,
+            "WET": 0.05
+        }
+
         # Driver name mappings (short codes to full names and vice versa)
         self.driver_name_mapping = {
             # Full names to short codes
@@ -102,7 +379,17 @@ class F1RacePredictor:
         self._init_team_characteristics()
         self._init_track_database()
         self._init_driver_data()
-    
+
+        # Form ratings learned from past results replace the static driver ratings once
+        # loaded with load_form (the GUI loads them at start; worker processes never do).
+        # The state is user data, so it lives in the user's home rather than beside the code
+        self.form_state_path = os.path.join(os.path.expanduser("~"), ".f1podium", "driver_form.json")
+        self.form_tracker = None
+
+        # Shared, append-only dictionaries behind the categorical DRIVER/CAR columns
+        self.driver_categories = list(self.driver_experience.keys())
+        self.team_categories = list(self.team_characteristics.keys())
+
     def _init_team_characteristics(self):
         """Initialize team characteristics for 2025 season"""
         self.team_characteristics = {
@@ -426,17 +713,223 @@ class F1RacePredictor:
     
     def set_race(self, race_name):
         """Set the race for prediction and determine if it's a sprint weekend"""
+        if self.weather_forecast is not None and race_name != self.race_name:
+            print("Weather forecast cleared")
+            self.weather_forecast = None
         self.race_name = race_name
-        self.track = self.track_database.get(race_name, self.track_database["Australian Grand Prix"])
+        self.track = self._track_for(race_name)
         self.is_sprint_weekend = self.track.get("is_sprint", False)
         
+        if race_name not in self.track_database:
+            print(f"Warning: {race_name} is not in the track database, using {self.track['name']}")
         if self.is_sprint_weekend:
             print(f"Sprint race weekend selected: {race_name}")
     
+    def _track_for(self, race_name):
+        """
+        Look up track characteristics for a race
+        Renamed races are matched by race or circuit name; venues with features
+        registered through add_venue get a blend of their most similar tracks; with
+        nothing known about a venue every track is equally similar, so it gets the
+        average of the whole database
+        """
+        track = self.track_database.get(race_name)
+        if track is not None:
+            return track
+
+        index = self._similarity_index()
+        matched = index['names'].get(self._track_key(race_name))
+        if matched is not None:
+            return self.track_database[matched]
+        return self._blend_similar_tracks(self.venue_features.get(race_name, {}))
+
+    def add_venue(self, race_name, **features):
+        """
+        Register a venue missing from the track database by whatever features are known
+        (any of track_similarity_features); its characteristics are then blended from
+        the most similar tracks
+        """
+        unknown = [name for name in features if name not in self.track_similarity_features]
+        if unknown:
+            raise ValueError(f"Unknown track features: {', '.join(unknown)}")
+        self.venue_features[race_name] = features
+        return self._track_for(race_name)
+
+    def _track_key(self, name):
+        """Normalized race or circuit name used to match renamed venues"""
+        key = re.sub(r'[^a-z0-9 ]', '', str(name).lower())
+        key = re.sub(r'\bgp\b', 'grand prix', key)
+        return re.sub(r'\s+', '', key)
+
+    def _similarity_index(self):
+        """
+        Standardized track feature matrix and name lookup, rebuilt when the track
+        database or the feature list changes
+        """
+        version = (self._track_table_version, tuple(self.track_similarity_features))
+        if self._track_index_version != version:
+            races = list(self.track_database.keys())
+            features = np.array([
+                [float(self.track_database[race].get(name, 0.0)) for name in self.track_similarity_features]
+                for race in races
+            ])
+            center = features.mean(axis=0)
+            scale = features.std(axis=0)
+            scale[scale == 0] = 1.0
+
+            names = {}
+            for race in races:
+                names[self._track_key(race)] = race
+                names.setdefault(self._track_key(self.track_database[race]['name']), race)
+
+            self._track_index = {
+                'races': races,
+                'matrix': (features - center) / scale,
+                'center': center,
+                'scale': scale,
+                'names': names
+            }
+            self._track_index_version = version
+        return self._track_index
+
+    def similar_tracks(self, features, k=None):
+        """
+        The k tracks closest to a (partial) feature dict, nearest first
+        Distances are Euclidean over the standardized features that are given
+        Returns a list of (race name, distance)
+        """
+        if k is None:
+            k = self.track_neighbours
+        index = self._similarity_index()
+        used = [i for i, name in enumerate(self.track_similarity_features) if name in features]
+        if not used:
+            raise ValueError("No known track features to compare")
+
+        query = np.array([float(features[self.track_similarity_features[i]]) for i in used])
+        query = (query - index['center'][used]) / index['scale'][used]
+        distances = np.sqrt(((index['matrix'][:, used] - query) ** 2).sum(axis=1))
+        k = min(k, len(distances))
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest])]
+        return [(index['races'][i], float(distances[i])) for i in nearest]
+
+    def _blend_similar_tracks(self, features):
+        """
+        Characteristics for an unknown venue: inverse-distance weighted average of its
+        nearest tracks, with the features that are known taken as given (an even
+        average of every track when none are known)
+        """
+        if any(name in features for name in self.track_similarity_features):
+            neighbours = self.similar_tracks(features)
+            name = "Blend of " + ", ".join(self.track_database[race]['name'] for race, _ in neighbours)
+        else:
+            neighbours = [(race, 0.0) for race in self.track_database]
+            name = "Average of all tracks"
+        weights = np.array([1.0 / (distance + 1e-6) for _, distance in neighbours])
+        weights /= weights.sum()
+
+        track = {"name": name}
+        for key in ('overtaking_difficulty', 'tire_degradation', 'start_importance'):
+            values = [self.track_database[race][key] for race, _ in neighbours]
+            track[key] = features.get(key, float(np.dot(weights, values)))
+        track["is_sprint"] = bool(features.get("is_sprint", False))
+        track["similar_to"] = [race for race, _ in neighbours]
+        return track
+
     def set_rain_probability(self, probability):
-        """Set the rain probability for the race (0.0 to 1.0)"""
+        """Set the rain probability for the race (0.0 to 1.0), replacing any loaded forecast"""
+        if self.weather_forecast is not None:
+            print("Weather forecast cleared")
+            self.weather_forecast = None
         self.rain_probability = max(0.0, min(1.0, probability))
         print(f"Rain probability set to {self.rain_probability*100:.0f}%")
+
+    def load_weather_forecast(self, forecast_path):
+        """
+        Load rain probability over race time (per lap, minute or hour) from a CSV file
+        An optional scenario column holds several forecasts (e.g. ensemble members),
+        which are treated as equally likely. Each row covers the time up to the next
+        row; probabilities above 1 are read as percentages.
+        The forecast belongs to the selected race (choosing another race clears it) and
+        its average rain probability becomes the race's rain_probability
+        """
+        forecast, cols = self._read_session_csv(forecast_path, 'weather')
+        if not cols['rain']:
+            raise ValueError("Weather forecast missing rain probability column")
+
+        rain = pd.to_numeric(forecast[cols['rain']], errors='coerce')
+        if rain.max() > 1:
+            rain = rain / 100
+        frame = pd.DataFrame({
+            'time': (forecast[cols['time']].apply(self._forecast_time) if cols['time']
+                     else pd.Series(np.arange(len(forecast)), dtype=float)),
+            'rain': rain.clip(0.0, 1.0),
+            'scenario': forecast[cols['scenario']] if cols['scenario'] else 'forecast'
+        }).dropna(subset=['time', 'rain'])
+        if frame.empty:
+            raise ValueError("Weather forecast has no usable rows")
+
+        # One row per scenario, one column per segment start
+        grid = frame.pivot_table(index='scenario', columns='time', values='rain', aggfunc='mean', sort=True)
+        grid = grid.ffill(axis=1).bfill(axis=1)
+        starts = grid.columns.to_numpy(dtype=float)
+        durations = np.diff(starts)
+        last = np.median(durations) if len(durations) else 1.0
+        durations = np.append(durations, last)
+
+        self.weather_forecast = {
+            'scenarios': list(grid.index),
+            'segment_starts': starts,
+            'segment_weights': durations / durations.sum(),
+            'rain': grid.to_numpy(dtype=float),
+            'fingerprint': self._file_fingerprint(forecast_path)
+        }
+        self.rain_probability = float((self.weather_forecast['rain'] @ self.weather_forecast['segment_weights']).mean())
+        print(f"Weather forecast loaded: {len(starts)} segments, {len(grid.index)} scenarios, "
+              f"{self.rain_probability*100:.0f}% average chance of rain")
+        return self.weather_forecast
+
+    def _forecast_time(self, value):
+        """Forecast time as a number: laps, minutes or hours, or 'HH:MM' converted to hours"""
+        if pd.isna(value):
+            return np.nan
+        value = str(value).strip()
+        match = re.match(r'^(\d{1,2}):(\d{2})(?::\d{2})?$', value)
+        if match:
+            return int(match.group(1)) + int(match.group(2)) / 60
+        try:
+            return float(value)
+        except ValueError:
+            return np.nan
+
+    def _forecast_weights(self, track=None):
+        """
+        Effective factor weights of every forecast scenario (scenarios x factors)
+        Weights of all scenarios and segments come from one batched _factor_weights call
+        and are averaged over the race by segment length; since the race score is linear
+        in the weights this equals averaging the per-segment scores
+        """
+        if track is None:
+            track = self.track
+        forecast = self.weather_forecast
+        segment_weights = self._factor_weights(track, forecast['rain'])
+        return np.einsum('s,csk->ck', forecast['segment_weights'], segment_weights)
+
+    def forecast_scores(self):
+        """
+        Race scores of the loaded grid under every forecast scenario (drivers x scenarios)
+        plus the expected score over all scenarios
+        """
+        if self.combined_data is None:
+            print("Error: No data loaded. Please load data first.")
+            return None
+        if self.weather_forecast is None:
+            raise ValueError("No weather forecast loaded")
+        scores = self._factor_matrix() @ self._forecast_weights().T
+        table = pd.DataFrame(scores, index=list(self.combined_data['DRIVER']),
+                             columns=self.weather_forecast['scenarios'])
+        table['expected'] = scores.mean(axis=1)
+        return table.sort_values('expected', ascending=False)
     
     def _find_column(self, df, possible_names, case_sensitive=False):
         """
@@ -505,30 +998,473 @@ class F1RacePredictor:
         # Return original if no match
         return name
     
-    def _safely_read_csv(self, file_path, encoding_list=None):
+    def _safely_read_csv(self, file_path, encoding_list=None, usecols=None, dtype=None,
+                         use_cache=True, verbose=True):
         """
         Safely read a CSV file trying multiple encodings
         Returns DataFrame and the successful encoding
+        Files already read are served from a cache until they change on disk
+        usecols and dtype are passed through to pandas; bulk loads that read from
+        several threads pass use_cache=False and verbose=False
         """
         if encoding_list is None:
             encoding_list = ['utf-8', 'latin1', 'cp1252', 'ISO-8859-1']
-            
+
+        # Reuse the parsed file while its size and modification time are unchanged
+        stat = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+                     tuple(usecols) if usecols is not None else None)
+        if use_cache and cache_key in self._csv_cache:
+            df, encoding = self._csv_cache[cache_key]
+            if verbose:
+                print(f"Using already parsed file: {os.path.basename(file_path)}")
+            return df.copy(), encoding
+
         for encoding in encoding_list:
             try:
-                print(f"Trying encoding: {encoding}")
-                df = pd.read_csv(file_path, encoding=encoding)
-                print(f"Successfully read with encoding: {encoding}")
-                return df, encoding
+                if verbose:
+                    print(f"Trying encoding: {encoding}")
+                df = pd.read_csv(file_path, encoding=encoding, usecols=usecols, dtype=dtype)
+                if verbose:
+                    print(f"Successfully read with encoding: {encoding}")
+                if not use_cache:
+                    return df, encoding
+                stale_keys = [key for key in self._csv_cache
+                              if key[0] == cache_key[0] and key[1:3] != cache_key[1:3]]
+                for stale_key in stale_keys:
+                    del self._csv_cache[stale_key]
+                self._csv_cache[cache_key] = (df, encoding)
+                return df.copy(), encoding
             except UnicodeDecodeError as e:
-                print(f"Failed with encoding {encoding}: {str(e)}")
+                if verbose:
+                    print(f"Failed with encoding {encoding}: {str(e)}")
             except Exception as e:
-                print(f"Error with encoding {encoding}: {str(e)}")
+                if verbose:
+                    print(f"Error with encoding {encoding}: {str(e)}")
                 
         # If we're here, none of the encodings worked
         raise ValueError(f"Failed to read CSV file {file_path} with any encoding")
-    
-    def load_data(self, quali_path, practice_path, sprint_path=None, sprint_quali_path=None):
-        """Load qualifying, practice, and sprint data (if applicable) with flexible column handling"""
+
+    def _read_csv_header(self, file_path, encoding_list=None, verbose=True):
+        """
+        Read only the header row of a CSV file trying multiple encodings
+        Returns the list of column names and the successful encoding
+        """
+        if encoding_list is None:
+            encoding_list = ['utf-8', 'latin1', 'cp1252', 'ISO-8859-1']
+
+        for encoding in encoding_list:
+            try:
+                header = pd.read_csv(file_path, encoding=encoding, nrows=0)
+                return list(header.columns), encoding
+            except UnicodeDecodeError as e:
+                if verbose:
+                    print(f"Failed with encoding {encoding}: {str(e)}")
+            except Exception as e:
+                if verbose:
+                    print(f"Error with encoding {encoding}: {str(e)}")
+
+        raise ValueError(f"Failed to read CSV header of {file_path} with any encoding")
+
+    def _resolve_columns(self, columns, kind, exact_first=False):
+        """
+        Resolve the columns of one session file type from its header
+        Uses the precomputed lowercase alias map and the same rules as _find_column
+        (first column matching any alias, exactly or as a substring). With
+        exact_first, every role is first matched exactly and only the roles still
+        missing fall back to substrings of the unclaimed columns, so a column is
+        assigned once, for files with similar names side by side (LAP, LAP_TIME,
+        TyreLife). Roles in exact_column_roles never match substrings
+        Returns a dict of role to column name (None when not found)
+        """
+        lowered = [(col, str(col).lower()) for col in columns]
+        aliases_by_role = self._column_aliases[kind]
+        exact_only = self.exact_column_roles.get(kind, set())
+        resolved = dict.fromkeys(aliases_by_role)
+
+        def partial(role, candidates):
+            if role in exact_only:
+                return next((col for alias in aliases_by_role[role] for col, low in candidates if low == alias), None)
+            return next((col for col, low in candidates
+                         if any(alias in low for alias in aliases_by_role[role])), None)
+
+        if not exact_first:
+            for role in aliases_by_role:
+                resolved[role] = partial(role, lowered)
+            return resolved
+
+        for role, aliases in aliases_by_role.items():
+            taken = set(resolved.values())
+            resolved[role] = next((col for alias in aliases for col, low in lowered
+                                   if low == alias and col not in taken), None)
+        for role in aliases_by_role:
+            if resolved[role] is None:
+                taken = set(resolved.values())
+                resolved[role] = partial(role, [(col, low) for col, low in lowered if col not in taken])
+        return resolved
+
+    def _read_session_csv(self, file_path, kind, use_cache=True, verbose=True):
+        """
+        Read a session file parsing only the columns needed for its type
+        The header is sniffed first, columns are resolved with the alias map and
+        the body is parsed with usecols and explicit string dtypes (no inference)
+        Returns the DataFrame and the dict of resolved columns
+        """
+        columns, encoding = self._read_csv_header(file_path, verbose=verbose)
+        resolved = self._resolve_columns(columns, kind)
+        needed = set(col for col in resolved.values() if col)
+        usecols = [col for col in columns if col in needed]
+
+        encodings = [encoding] + [e for e in ['utf-8', 'latin1', 'cp1252', 'ISO-8859-1'] if e != encoding]
+        df, _ = self._safely_read_csv(file_path, encodings, usecols=usecols,
+                                      dtype={col: str for col in usecols},
+                                      use_cache=use_cache, verbose=verbose)
+        return df, resolved
+
+    def _normalize_session_name(self, name):
+        """
+        Convert practice session labels to P1/P2/P3
+        Handles 'FP2', 'P2', 'Practice 2', 'Free Practice 2'
+        """
+        if not isinstance(name, str):
+            return name
+        digits = ''.join(c for c in name if c.isdigit())
+        if digits in ('1', '2', '3'):
+            return f"P{digits}"
+        return name.strip().upper()
+
+    def load_practice_laps(self, laps_path, session=None, chunksize=None):
+        """
+        Stream a lap-level practice file and extract fuel- and tire-corrected long-run pace
+        The file is read in chunks and only the currently open run of each driver is kept,
+        so memory depends on the chunk size rather than on the size of the file.
+        Returns a DataFrame with DRIVER, session, longrun_pace, longrun_laps and longrun_std
+        """
+        if session is None:
+            # FP2 carries the race simulations on a regular weekend, FP1 on a sprint weekend
+            session = 'P1' if self.is_sprint_weekend else 'P2'
+        self.practice_longruns = self._scan_laps(laps_path, {'longruns': session}, chunksize)[0]
+        return self.practice_longruns
+
+    def load_sector_laps(self, laps_path, session='P3', chunksize=None):
+        """
+        Stream a lap-level file with sector times and compute each driver's ideal lap
+        Best sectors and best lap are kept as running group minima per driver, merged
+        chunk by chunk, so memory depends on the number of drivers, not on the file.
+        Returns a DataFrame with DRIVER, session, best_lap, ideal_lap and ideal_gap
+        (None when the file has no sector columns)
+        """
+        return self._scan_laps(laps_path, {'sectors': session}, chunksize)[1]
+
+    def _scan_laps(self, laps_path, sessions, chunksize=None):
+        """
+        Stream a lap-level file once for long runs and/or ideal laps
+        sessions maps 'longruns' and/or 'sectors' to the practice session each is taken
+        from (None: all sessions). A file without a session column is taken as a single
+        session, so asked for two different sessions it only gives the long runs.
+        Returns (long runs, sectors), None for whatever was not computed
+        """
+        sessions = {task: self._normalize_session_name(session) if session else None
+                    for task, session in sessions.items()}
+        resolved, encoding = self._lap_file_columns(laps_path)
+        if 'longruns' in sessions and (not resolved['DRIVER'] or not resolved['LAP_TIME']):
+            raise ValueError("Lap-level practice data missing driver or lap time columns")
+        if 'sectors' in sessions:
+            if not resolved['DRIVER'] or not all(resolved[sector] for sector in self.sector_columns):
+                del sessions['sectors']
+            elif not resolved['SESSION'] and len(set(sessions.values())) > 1:
+                print(f"Warning: {os.path.basename(laps_path)} has no session column, "
+                      f"sector times not used as {sessions['sectors']}")
+                del sessions['sectors']
+        if not sessions:
+            return None, None
+
+        roles = ['DRIVER', 'LAP_TIME', 'SESSION']
+        if 'longruns' in sessions:
+            print(f"Streaming lap-level practice data: {os.path.basename(laps_path)} ({sessions['longruns']})")
+            roles += ['LAP', 'STINT', 'COMPOUND', 'TYRE_LIFE']
+        if 'sectors' in sessions:
+            roles += self.sector_columns
+        wanted = set(sessions.values())
+        stream_sessions = None if None in wanted else wanted
+
+        open_runs = {}  # Driver -> laps of the run still in progress
+        totals = {}     # Driver -> [laps, sum, sum of squares] over completed long runs
+        best = None     # Best lap and sector times per driver
+        time_columns = [role for role in ['LAP_TIME'] + self.sector_columns if resolved.get(role)]
+
+        for chunk in self._stream_laps(laps_path, resolved, encoding, roles, stream_sessions, chunksize):
+            for task, session in sessions.items():
+                laps = chunk
+                if session and len(wanted) > 1 and 'SESSION' in chunk.columns:
+                    laps = chunk[chunk['SESSION'] == session]
+                if task == 'longruns':
+                    laps = laps[laps['LAP_TIME'].notna()]
+                    for driver, driver_laps in laps.groupby('DRIVER', sort=False):
+                        self._extend_long_runs(driver, driver_laps, open_runs, totals)
+                elif not laps.empty:
+                    laps_best = laps.groupby('DRIVER', sort=False)[time_columns].min()
+                    best = laps_best if best is None else pd.concat([best, laps_best]).groupby(level=0, sort=False).min()
+
+        longruns = None
+        if 'longruns' in sessions:
+            # Close the runs that were still open at the end of the file
+            for driver, run in open_runs.items():
+                self._close_long_run(driver, run, totals)
+
+            rows = []
+            for driver, (n, total, total_sq) in totals.items():
+                mean = total / n
+                std = np.sqrt(max(0.0, total_sq / n - mean * mean))
+                rows.append({
+                    'DRIVER': driver,
+                    'session': sessions['longruns'],
+                    'longrun_pace': mean,
+                    'longrun_laps': n,
+                    'longrun_std': std
+                })
+            longruns = pd.DataFrame(
+                rows, columns=['DRIVER', 'session', 'longrun_pace', 'longrun_laps', 'longrun_std']
+            )
+            print(f"Long runs found for {len(longruns)} drivers")
+
+        sectors = None
+        if 'sectors' in sessions:
+            if best is None:
+                sectors = pd.DataFrame(columns=['DRIVER', 'session', 'best_lap', 'ideal_lap', 'ideal_gap'])
+            else:
+                ideal = best[self.sector_columns].sum(axis=1, min_count=len(self.sector_columns))
+                best_lap = best['LAP_TIME'] if 'LAP_TIME' in best.columns else ideal
+                sectors = pd.DataFrame({
+                    'DRIVER': best.index,
+                    'session': sessions['sectors'],
+                    'best_lap': best_lap.to_numpy(),
+                    'ideal_lap': ideal.to_numpy(),
+                    'ideal_gap': (best_lap - ideal).to_numpy()
+                })
+        return longruns, sectors
+
+    def _lap_file_columns(self, laps_path):
+        """Resolve the columns of a lap-level timing file from its header only"""
+        columns, encoding = self._read_csv_header(laps_path)
+        return self._resolve_columns(columns, 'practice_laps', exact_first=True), encoding
+
+    def _stream_laps(self, laps_path, resolved, encoding, roles, session=None, chunksize=None):
+        """
+        Read a lap-level timing file in bounded chunks and yield each chunk normalized
+        Only the columns of the requested roles are parsed; columns are renamed to the
+        role names, sessions normalized to P1/P2/P3 (and filtered when session, a name or
+        a set of names, is given), lap and sector times converted to seconds, positions to
+        numbers (NaN when unclassified) and driver names standardized, each distinct value
+        only once per file
+        """
+        if chunksize is None:
+            chunksize = self.long_run_settings["chunksize"]
+        rename = {resolved[role]: role for role in roles if resolved.get(role)}
+        time_columns = [role for role in ['LAP_TIME'] + self.sector_columns if role in rename.values()]
+        driver_names = {}
+        session_names = {}
+        positions = {}
+
+        reader = pd.read_csv(laps_path, encoding=encoding, usecols=list(rename.keys()),
+                             chunksize=chunksize)
+        for chunk in reader:
+            chunk = chunk.rename(columns=rename)
+
+            if 'SESSION' in chunk.columns:
+                for name in chunk['SESSION'].unique():
+                    if name not in session_names:
+                        session_names[name] = self._normalize_session_name(name)
+                chunk['SESSION'] = chunk['SESSION'].map(session_names)
+                if session:
+                    keep = (chunk['SESSION'].isin(session) if isinstance(session, (set, frozenset, list, tuple))
+                            else chunk['SESSION'] == session)
+                    chunk = chunk[keep]
+                    if chunk.empty:
+                        continue
+
+            for col in time_columns:
+                chunk[col] = self._timing_seconds(chunk[col])
+
+            if 'POSITION' in chunk.columns:
+                if pd.api.types.is_numeric_dtype(chunk['POSITION']):
+                    chunk['POSITION'] = chunk['POSITION'].astype(float)
+                else:
+                    for pos in chunk['POSITION'].unique():
+                        if pos not in positions:
+                            positions[pos] = self._safe_convert_position(pos, unclassified=np.nan)
+                    chunk['POSITION'] = chunk['POSITION'].map(positions).astype(float)
+
+            # Standardize each distinct driver name once per file
+            for name in chunk['DRIVER'].unique():
+                if name not in driver_names:
+                    driver_names[name] = self._standardize_driver_name(name)
+            chunk['DRIVER'] = chunk['DRIVER'].map(driver_names)
+            yield chunk
+
+    def best_lap_times(self, laps_path, chunksize=None):
+        """
+        Best lap time and lap count per driver per session of a (multi-season) lap dump
+        The file is streamed in chunks and each chunk's group minima are merged into
+        running aggregates, so peak memory depends on the chunk size and the number of
+        season/event/session/driver groups, never on the size of the file.
+        Groups by whichever of YEAR, EVENT and SESSION the file has, plus DRIVER;
+        files with a position column also get each driver's best position
+        """
+        resolved, encoding = self._lap_file_columns(laps_path)
+        if not resolved['DRIVER'] or not resolved['LAP_TIME']:
+            raise ValueError("Lap-level data missing driver or lap time columns")
+        keys = [role for role in ('YEAR', 'EVENT', 'SESSION') if resolved.get(role)] + ['DRIVER']
+        aggregates = {'best_lap': ('LAP_TIME', 'min'), 'laps': ('LAP_TIME', 'count')}
+        merge = {'best_lap': 'min', 'laps': 'sum'}
+        roles = keys + ['LAP_TIME']
+        if resolved.get('POSITION'):
+            aggregates['best_position'] = ('POSITION', 'min')
+            merge['best_position'] = 'min'
+            roles.append('POSITION')
+
+        print(f"Streaming lap times: {os.path.basename(laps_path)}")
+        best = None
+        rows = 0
+        for chunk in self._stream_laps(laps_path, resolved, encoding, roles, chunksize=chunksize):
+            rows += len(chunk)
+            chunk_best = chunk.groupby(keys, sort=False, dropna=False).agg(**aggregates)
+            if best is None:
+                best = chunk_best
+            else:
+                best = pd.concat([best, chunk_best]).groupby(level=keys, sort=False, dropna=False).agg(merge)
+
+        if best is None:
+            return pd.DataFrame(columns=keys + list(aggregates))
+        print(f"Aggregated {rows} laps into {len(best)} driver sessions")
+        return best.sort_index().reset_index()
+
+    def _timing_seconds(self, values):
+        """Vectorized conversion of a lap or sector time column to seconds"""
+        if pd.api.types.is_timedelta64_dtype(values):
+            return values.dt.total_seconds()
+        if pd.api.types.is_numeric_dtype(values):
+            return values.astype(float)
+        seconds = pd.to_numeric(values, errors='coerce')
+        text = values.notna() & seconds.isna()
+        # Exported timedeltas ('0 days 00:01:23.456') are parsed in one pass
+        spans = text & values.astype(str).str.contains('days', regex=False)
+        if spans.any():
+            seconds[spans] = pd.to_timedelta(values[spans], errors='coerce').dt.total_seconds()
+            text &= ~spans
+        if text.any():
+            seconds[text] = values[text].map(self._time_to_seconds).astype(float)
+        return seconds.astype(float)
+
+    def _blend_ideal(self, values, ideal):
+        """
+        Blend lap times (or gaps) with their ideal-lap counterparts by ideal_lap_weight
+        Values without an ideal lap are kept as they are
+        """
+        blended = (1 - self.ideal_lap_weight) * values + self.ideal_lap_weight * ideal
+        if isinstance(blended, pd.Series):
+            return blended.fillna(values)
+        return np.where(np.isnan(blended), values, blended)
+
+    def _ideal_laps(self, drivers, sectors):
+        """Each driver's ideal lap: the sum of their best time in every sector (group minima)"""
+        frame = sectors.apply(self._timing_seconds)
+        frame['DRIVER'] = drivers.to_numpy()
+        best = frame.groupby('DRIVER', sort=False).min()
+        return best.sum(axis=1, min_count=sectors.shape[1])
+
+    def _extend_long_runs(self, driver, laps, open_runs, totals):
+        """Append a driver's laps from one chunk to their open run, closing finished runs"""
+        n = len(laps)
+        times = laps['LAP_TIME'].to_numpy(dtype=float)
+        previous = open_runs.get(driver)
+
+        if 'LAP' in laps.columns:
+            lap_numbers = pd.to_numeric(laps['LAP'], errors='coerce').to_numpy(dtype=float)
+        else:
+            # Without lap numbers the file order is taken as consecutive laps
+            start = previous['lap'][-1] + 1 if previous is not None else 1
+            lap_numbers = np.arange(start, start + n, dtype=float)
+        stints = (pd.to_numeric(laps['STINT'], errors='coerce').to_numpy(dtype=float)
+                  if 'STINT' in laps.columns else np.zeros(n))
+        compounds = (laps['COMPOUND'].astype(str).str.upper().str.strip().to_numpy()
+                     if 'COMPOUND' in laps.columns else np.full(n, 'MEDIUM', dtype=object))
+        tyre_life = (pd.to_numeric(laps['TYRE_LIFE'], errors='coerce').to_numpy(dtype=float)
+                     if 'TYRE_LIFE' in laps.columns else np.full(n, np.nan))
+
+        # Prepend the open run carried over from earlier chunks
+        if previous is not None:
+            lap_numbers = np.concatenate([previous['lap'], lap_numbers])
+            times = np.concatenate([previous['time'], times])
+            stints = np.concatenate([previous['stint'], stints])
+            compounds = np.concatenate([previous['compound'], compounds])
+            tyre_life = np.concatenate([previous['tyre_life'], tyre_life])
+
+        # A run ends at a lap gap, a new stint, a compound change or a fresh set of tires
+        breaks = np.zeros(len(times), dtype=bool)
+        breaks[1:] = ((np.diff(lap_numbers) != 1) |
+                      (stints[1:] != stints[:-1]) |
+                      (compounds[1:] != compounds[:-1]) |
+                      (np.diff(tyre_life) < 0))
+        starts = np.flatnonzero(breaks)
+        bounds = np.concatenate([[0], starts, [len(times)]])
+
+        for start, end in zip(bounds[:-2], bounds[1:-1]):
+            run = {
+                'lap': lap_numbers[start:end],
+                'time': times[start:end],
+                'stint': stints[start:end],
+                'compound': compounds[start:end],
+                'tyre_life': tyre_life[start:end]
+            }
+            self._close_long_run(driver, run, totals)
+
+        last = bounds[-2]
+        open_runs[driver] = {
+            'lap': lap_numbers[last:],
+            'time': times[last:],
+            'stint': stints[last:],
+            'compound': compounds[last:],
+            'tyre_life': tyre_life[last:]
+        }
+
+    def _close_long_run(self, driver, run, totals):
+        """Correct a finished run for fuel and tires and add it to the driver totals"""
+        settings = self.long_run_settings
+        times = run['time']
+        if len(times) < settings["min_laps"]:
+            return
+
+        # Drop in/out laps, traffic and cool-down laps
+        keep = times <= np.median(times) * settings["outlier_threshold"]
+        if keep.sum() < settings["min_laps"]:
+            return
+
+        laps_into_run = np.arange(len(times), dtype=float)
+        tyre_age = np.where(np.isnan(run['tyre_life']), laps_into_run, run['tyre_life'])
+        compound = run['compound'][0]
+
+        # Degradation scales with the track's tire wear (6 is an average track)
+        track_degradation = self.track['tire_degradation'] / 6 if self.track else 1.0
+        degradation = self.tire_compound_degradation.get(compound, 0.06) * track_degradation
+        offset = self.tire_compound_offsets.get(compound, 0.0)
+
+        # Add back the time gained from burning fuel, remove tire wear and compound offset
+        corrected = (times + settings["fuel_per_lap"] * laps_into_run
+                     - degradation * tyre_age - offset)[keep]
+
+        driver_totals = totals.setdefault(driver, [0, 0.0, 0.0])
+        driver_totals[0] += len(corrected)
+        driver_totals[1] += corrected.sum()
+        driver_totals[2] += (corrected * corrected).sum()
+
+    def load_data(self, quali_path, practice_path, sprint_path=None, sprint_quali_path=None,
+                  practice_laps_path=None):
+        """
+        Load qualifying, practice, and sprint data (if applicable) with flexible column handling
+        When practice_laps_path points at a lap-level practice file, long-run pace from it
+        replaces the single FP2 time (FP1 on sprint weekends) for race pace scoring
+        """
         print(f"Loading data files...")
         print(f"Qualifying data: {os.path.basename(quali_path)}")
         print(f"Practice data: {os.path.basename(practice_path)}")
@@ -539,39 +1475,128 @@ class F1RacePredictor:
             if sprint_quali_path:
                 print(f"Sprint qualifying data: {os.path.basename(sprint_quali_path)}")
         
-        # Load qualifying data with encoding detection
-        self.quali_data, _ = self._safely_read_csv(quali_path)
+        # Load only the needed qualifying columns, resolved from the header
+        self.quali_data, quali_cols = self._read_session_csv(quali_path, 'quali')
         print(f"Qualifying data columns: {list(self.quali_data.columns)}")
         
-        # Find key columns in qualifying data
-        pos_col = self._find_column(self.quali_data, ['POS', 'Pos', 'Position', 'POSITION'])
-        driver_col = self._find_column(self.quali_data, ['DRIVER', 'Driver', 'NAME', 'Name'])
-        car_col = self._find_column(self.quali_data, ['CAR', 'Car', 'TEAM', 'Team', 'Constructor'])
-        q1_col = self._find_column(self.quali_data, ['Q1', 'Q1 Time', 'Q1TIME'])
-        q2_col = self._find_column(self.quali_data, ['Q2', 'Q2 Time', 'Q2TIME'])
-        q3_col = self._find_column(self.quali_data, ['Q3', 'Q3 Time', 'Q3TIME'])
+        self._normalize_quali(self.quali_data, quali_cols)
+        
+        # Load only the needed practice columns, resolved from the header
+        self.practice_data, practice_cols = self._read_session_csv(practice_path, 'practice')
+        print(f"Practice data columns: {list(self.practice_data.columns)}")
+        self._normalize_practice(self.practice_data, practice_cols)
+        
+        # Load sprint data if it's a sprint weekend and path is provided
+        if self.is_sprint_weekend and sprint_path:
+            self.sprint_data, sprint_cols = self._read_session_csv(sprint_path, 'sprint')
+            print(f"Sprint data columns: {list(self.sprint_data.columns)}")
+            self._normalize_sprint(self.sprint_data, sprint_cols)
+
+        # Load sprint qualifying data if available and path is provided
+        if self.is_sprint_weekend and sprint_quali_path:
+            self.sprint_quali_data, sprint_quali_cols = self._read_session_csv(sprint_quali_path, 'sprint_quali')
+            print(f"Sprint qualifying data columns: {list(self.sprint_quali_data.columns)}")
+            self._normalize_sprint_quali(self.sprint_quali_data, sprint_quali_cols)
+        
+        # Build a compact combined frame holding only the columns the scorer needs,
+        # keyed by standardized names; the session frames themselves are not copied
+        combined_data = pd.DataFrame({
+            'DRIVER': self._categorical_names(self.quali_data['DRIVER_STD'], self.driver_categories),
+            'CAR': self._categorical_names(self.quali_data['CAR_STD'], self.team_categories),
+            'position': self._float32_column(self.quali_data['position']),
+            'best_quali_time': self._float32_column(self.quali_data['best_quali_time']),
+            'gap_to_pole': self._float32_column(self.quali_data['gap_to_pole'])
+        })
+        if 'ideal_quali_time' in self.quali_data.columns:
+            combined_data['ideal_quali_time'] = self._float32_column(self.quali_data['ideal_quali_time'])
+        drivers = self.quali_data['DRIVER_STD']
+        
+        # Add practice session times using standardized driver names
+        self._merge_session_columns(combined_data, drivers, self.practice_data,
+                                    ['p1_seconds', 'p2_seconds', 'p3_seconds'])
+        for col in ['p1_seconds', 'p2_seconds', 'p3_seconds']:
+            if col not in combined_data.columns:
+                combined_data[col] = np.float32(np.nan)
+        
+        # Add long-run pace from lap-level practice data if provided
+        # (and ideal FP3 laps from sector times, if the file has them, in the same pass)
+        if practice_laps_path:
+            sessions = {'longruns': 'P1' if self.is_sprint_weekend else 'P2'}
+            if not self.is_sprint_weekend:
+                sessions['sectors'] = 'P3'
+            longruns, sectors = self._scan_laps(practice_laps_path, sessions)
+            self.practice_longruns = longruns
+            longrun_col = 'p1_longrun_seconds' if self.is_sprint_weekend else 'p2_longrun_seconds'
+            combined_data[longrun_col] = self._float32_column(
+                drivers.map(longruns.set_index('DRIVER')['longrun_pace'])
+            )
+            
+            if sectors is not None and sectors['ideal_lap'].notna().any():
+                combined_data['p3_ideal_seconds'] = self._float32_column(
+                    drivers.map(sectors.set_index('DRIVER')['ideal_lap'])
+                )
+        
+        # Add sprint and sprint qualifying data if available
+        if self.is_sprint_weekend:
+            self._merge_session_columns(combined_data, drivers, self.sprint_data,
+                                        ['sprint_position', 'sprint_time_seconds'])
+            self._merge_session_columns(combined_data, drivers, self.sprint_quali_data,
+                                        ['sprint_quali_position', 'gap_to_sprint_pole',
+                                         'best_sprint_quali_time'])
+        
+        # Calculate practice session performance (different for sprint vs regular)
+        if self.is_sprint_weekend:
+            self._calculate_sprint_weekend_performance(combined_data)
+        else:
+            self._calculate_regular_weekend_performance(combined_data)
+        
+        # Add team and driver characteristics
+        self._add_characteristics(combined_data)
+        
+        # Store derived times and scores as float32
+        for col in combined_data.columns:
+            if combined_data[col].dtype == np.float64:
+                combined_data[col] = combined_data[col].astype(np.float32)
+        
+        self.combined_data = combined_data
+        self.quali_data = self.practice_data = self.sprint_data = self.sprint_quali_data = None
+        self.input_paths = tuple(path for path in (quali_path, practice_path, sprint_path,
+                                                   sprint_quali_path, practice_laps_path) if path)
+        print(f"Data loaded for {len(self.combined_data)} drivers\n")
+
+        return self.combined_data
+
+    def _normalize_quali(self, df, cols):
+        """Standardize names, convert times and derive best time and gap to pole for qualifying data"""
+        # Key columns in qualifying data
+        pos_col = cols['pos']
+        driver_col = cols['driver']
+        car_col = cols['car']
+        q1_col = cols['q1']
+        q2_col = cols['q2']
+        q3_col = cols['q3']
         
         if not pos_col or not driver_col:
             raise ValueError("Qualifying data missing required columns for position or driver")
             
         # Create standardized columns
-        self.quali_data['DRIVER_STD'] = self.quali_data[driver_col].apply(self._standardize_driver_name)
+        df['DRIVER_STD'] = df[driver_col].apply(self._standardize_driver_name)
         if car_col:
-            self.quali_data['CAR_STD'] = self.quali_data[car_col].apply(self._standardize_team_name)
+            df['CAR_STD'] = df[car_col].apply(self._standardize_team_name)
         else:
             print("Warning: Car/team information missing from qualifying data")
-            self.quali_data['CAR_STD'] = 'Unknown'
+            df['CAR_STD'] = 'Unknown'
             
         # Process qualifying times
         for q_col, std_name in zip([q1_col, q2_col, q3_col], ['Q1', 'Q2', 'Q3']):
             if q_col:
-                self.quali_data[f'{std_name}_seconds'] = self.quali_data[q_col].apply(self._time_to_seconds)
+                df[f'{std_name}_seconds'] = df[q_col].apply(self._time_to_seconds)
             else:
                 print(f"Warning: {std_name} data missing from qualifying data")
-                self.quali_data[f'{std_name}_seconds'] = None
+                df[f'{std_name}_seconds'] = None
         
         # Calculate best qualifying time
-        self.quali_data['best_quali_time'] = self.quali_data.apply(
+        df['best_quali_time'] = df.apply(
             lambda row: min(
                 [t for t in [row['Q1_seconds'], row['Q2_seconds'], row['Q3_seconds']] 
                  if not pd.isna(t) and t is not None], 
@@ -581,240 +1606,556 @@ class F1RacePredictor:
         )
         
         # Handle positions (DNS, DNF, etc.)
-        self.quali_data['position'] = self.quali_data[pos_col].apply(self._safe_convert_position)
+        df['position'] = df[pos_col].apply(self._safe_convert_position)
         
         # Calculate gap to pole
-        valid_times = self.quali_data['best_quali_time'].dropna()
+        valid_times = df['best_quali_time'].dropna()
         if len(valid_times) > 0:
             pole_time = valid_times.min()
-            self.quali_data['gap_to_pole'] = self.quali_data['best_quali_time'].apply(
+            df['gap_to_pole'] = df['best_quali_time'].apply(
                 lambda x: x - pole_time if not pd.isna(x) else None
             )
         else:
-            self.quali_data['gap_to_pole'] = None
+            df['gap_to_pole'] = None
         
-        # Load practice data with encoding detection
-        self.practice_data, _ = self._safely_read_csv(practice_path)
-        print(f"Practice data columns: {list(self.practice_data.columns)}")
+        # Blend in the gap between ideal laps (best sectors) when sector times are given
+        sector_cols = [cols.get(sector) for sector in ('s1', 's2', 's3')]
+        if all(sector_cols):
+            ideal = df['DRIVER_STD'].map(self._ideal_laps(df['DRIVER_STD'], df[sector_cols]))
+            df['ideal_quali_time'] = ideal
+            df['ideal_gap'] = pd.to_numeric(df['best_quali_time'], errors='coerce') - ideal
+            df['gap_to_pole'] = self._blend_ideal(pd.to_numeric(df['gap_to_pole'], errors='coerce'),
+                                                  ideal - ideal.min())
         
-        # Find key columns in practice data
-        p_driver_col = self._find_column(self.practice_data, ['DRIVER', 'Driver', 'NAME', 'Name'])
-        p_car_col = self._find_column(self.practice_data, ['CAR', 'Car', 'TEAM', 'Team', 'Constructor'])
+        return df
+
+    def _normalize_practice(self, df, cols):
+        """Standardize names and convert session times for practice data"""
+        # Key columns in practice data
+        p_driver_col = cols['driver']
+        p_car_col = cols['car']
         
-        # Find time columns based on format
-        # For standard format with P1, P2, P3 columns
-        p1_col = self._find_column(self.practice_data, ['P1', 'P1 Time', 'FP1', 'Practice 1', 'TIME', 'Time'])
-        p2_col = self._find_column(self.practice_data, ['P2', 'P2 Time', 'FP2', 'Practice 2'])
-        p3_col = self._find_column(self.practice_data, ['P3', 'P3 Time', 'FP3', 'Practice 3'])
+        # Time columns for standard format with P1, P2, P3 columns
+        p1_col = cols['p1']
+        p2_col = cols['p2']
+        p3_col = cols['p3']
         
         if not p_driver_col:
             raise ValueError("Practice data missing driver column")
             
         # Create standardized columns
-        self.practice_data['DRIVER_STD'] = self.practice_data[p_driver_col].apply(self._standardize_driver_name)
+        df['DRIVER_STD'] = df[p_driver_col].apply(self._standardize_driver_name)
         if p_car_col:
-            self.practice_data['CAR_STD'] = self.practice_data[p_car_col].apply(self._standardize_team_name)
+            df['CAR_STD'] = df[p_car_col].apply(self._standardize_team_name)
             
         # Process practice times for sprint and regular weekends
         if self.is_sprint_weekend:
             # Sprint weekend - we mainly need P1
             if p1_col:
-                self.practice_data['p1_seconds'] = self.practice_data[p1_col].apply(self._time_to_seconds)
+                df['p1_seconds'] = df[p1_col].apply(self._time_to_seconds)
             else:
                 print("Warning: Practice 1 time data missing")
-                self.practice_data['p1_seconds'] = None
+                df['p1_seconds'] = None
                 # Still process P2 and P3 if available
             if p2_col:
-                self.practice_data['p2_seconds'] = self.practice_data[p2_col].apply(self._time_to_seconds)
+                df['p2_seconds'] = df[p2_col].apply(self._time_to_seconds)
             if p3_col:
-                self.practice_data['p3_seconds'] = self.practice_data[p3_col].apply(self._time_to_seconds)
+                df['p3_seconds'] = df[p3_col].apply(self._time_to_seconds)
         else:
             # Regular weekend - look for all practice sessions
             if p1_col:
-                self.practice_data['p1_seconds'] = self.practice_data[p1_col].apply(self._time_to_seconds)
+                df['p1_seconds'] = df[p1_col].apply(self._time_to_seconds)
             if p2_col:
-                self.practice_data['p2_seconds'] = self.practice_data[p2_col].apply(self._time_to_seconds)
+                df['p2_seconds'] = df[p2_col].apply(self._time_to_seconds)
             else:
                 print("Warning: Practice 2 time data missing for regular race weekend")
-                self.practice_data['p2_seconds'] = None
+                df['p2_seconds'] = None
             if p3_col:
-                self.practice_data['p3_seconds'] = self.practice_data[p3_col].apply(self._time_to_seconds)
+                df['p3_seconds'] = df[p3_col].apply(self._time_to_seconds)
             else:
                 print("Warning: Practice 3 time data missing for regular race weekend")
-                self.practice_data['p3_seconds'] = None
+                df['p3_seconds'] = None
         
-        # Load sprint data if it's a sprint weekend and path is provided
-        if self.is_sprint_weekend and sprint_path:
-            self.sprint_data, _ = self._safely_read_csv(sprint_path)
-            print(f"Sprint data columns: {list(self.sprint_data.columns)}")
-            
-            # Find key columns in sprint data
-            s_pos_col = self._find_column(self.sprint_data, ['POS', 'Pos', 'Position', 'POSITION'])
-            s_driver_col = self._find_column(self.sprint_data, ['DRIVER', 'Driver', 'NAME', 'Name'])
-            s_car_col = self._find_column(self.sprint_data, ['CAR', 'Car', 'TEAM', 'Team', 'Constructor'])
-            s_time_col = self._find_column(self.sprint_data, ['TIME', 'Time', 'TIME/RETIRED', 'RESULT', 'Result'])
-            
-            if not s_pos_col or not s_driver_col:
-                print("Warning: Sprint data missing position or driver columns")
-            else:
-                # Create standardized columns
-                self.sprint_data['DRIVER_STD'] = self.sprint_data[s_driver_col].apply(self._standardize_driver_name)
-                if s_car_col:
-                    self.sprint_data['CAR_STD'] = self.sprint_data[s_car_col].apply(self._standardize_team_name)
-                    
-                # Process sprint positions
-                self.sprint_data['sprint_position'] = self.sprint_data[s_pos_col].apply(self._safe_convert_position)
-                
-                # Process sprint times if available
-                if s_time_col:
-                    self.sprint_data['sprint_time_seconds'] = self.sprint_data[s_time_col].apply(self._parse_race_time)
+        return df
 
-        # Load sprint qualifying data if available and path is provided
-        if self.is_sprint_weekend and sprint_quali_path:
-            self.sprint_quali_data, _ = self._safely_read_csv(sprint_quali_path)
-            print(f"Sprint qualifying data columns: {list(self.sprint_quali_data.columns)}")
-            
-            # Find key columns in sprint qualifying data
-            sq_pos_col = self._find_column(self.sprint_quali_data, ['POS', 'Pos', 'Position', 'POSITION'])
-            sq_driver_col = self._find_column(self.sprint_quali_data, ['DRIVER', 'Driver', 'NAME', 'Name'])
-            sq_car_col = self._find_column(self.sprint_quali_data, ['CAR', 'Car', 'TEAM', 'Team', 'Constructor'])
-            sq1_col = self._find_column(self.sprint_quali_data, ['Q1', 'SQ1', 'SQ1 Time'])
-            sq2_col = self._find_column(self.sprint_quali_data, ['Q2', 'SQ2', 'SQ2 Time'])
-            sq3_col = self._find_column(self.sprint_quali_data, ['Q3', 'SQ3', 'SQ3 Time'])
-            
-            if not sq_pos_col or not sq_driver_col:
-                print("Warning: Sprint qualifying data missing position or driver columns")
-            else:
-                # Create standardized columns
-                self.sprint_quali_data['DRIVER_STD'] = self.sprint_quali_data[sq_driver_col].apply(self._standardize_driver_name)
-                if sq_car_col:
-                    self.sprint_quali_data['CAR_STD'] = self.sprint_quali_data[sq_car_col].apply(self._standardize_team_name)
-                
-                # Process sprint qualifying positions
-                self.sprint_quali_data['sprint_quali_position'] = self.sprint_quali_data[sq_pos_col].apply(self._safe_convert_position)
-                
-                # Process sprint qualifying times
-                for sq_col, std_name in zip([sq1_col, sq2_col, sq3_col], ['SQ1', 'SQ2', 'SQ3']):
-                    if sq_col:
-                        self.sprint_quali_data[f'{std_name}_seconds'] = self.sprint_quali_data[sq_col].apply(self._time_to_seconds)
+    def _normalize_sprint(self, df, cols):
+        """Standardize names and convert positions and times for sprint results"""
+        # Key columns in sprint data
+        s_pos_col = cols['pos']
+        s_driver_col = cols['driver']
+        s_car_col = cols['car']
+        s_time_col = cols['time']
+        
+        if not s_pos_col or not s_driver_col:
+            print("Warning: Sprint data missing position or driver columns")
+        else:
+            # Create standardized columns
+            df['DRIVER_STD'] = df[s_driver_col].apply(self._standardize_driver_name)
+            if s_car_col:
+                df['CAR_STD'] = df[s_car_col].apply(self._standardize_team_name)
                 
-                # Calculate best sprint qualifying time
-                if sq1_col or sq2_col or sq3_col:
-                    self.sprint_quali_data['best_sprint_quali_time'] = self.sprint_quali_data.apply(
-                        lambda row: min(
-                            [t for t in [
-                                row.get('SQ1_seconds'), 
-                                row.get('SQ2_seconds'), 
-                                row.get('SQ3_seconds')
-                            ] if not pd.isna(t) and t is not None], 
-                            default=None
-                        ),
-                        axis=1
-                    )
-                    
-                    # Calculate gap to sprint pole
-                    valid_times = self.sprint_quali_data['best_sprint_quali_time'].dropna()
-                    if len(valid_times) > 0:
-                        sprint_pole_time = valid_times.min()
-                        self.sprint_quali_data['gap_to_sprint_pole'] = self.sprint_quali_data['best_sprint_quali_time'].apply(
-                            lambda x: x - sprint_pole_time if not pd.isna(x) else None
-                        )
-        
-        # Merge data using standardized driver names
-        combined_data = self.quali_data.copy()
-        
-        # Standardize original column names
-        if driver_col and driver_col != 'DRIVER':
-            combined_data.rename(columns={driver_col: 'DRIVER'}, inplace=True)
-        if car_col and car_col != 'CAR':
-            combined_data.rename(columns={car_col: 'CAR'}, inplace=True)
+            # Process sprint positions
+            df['sprint_position'] = df[s_pos_col].apply(self._safe_convert_position)
             
-        # Use standardized driver and car names
-        combined_data['DRIVER'] = combined_data['DRIVER_STD']
-        combined_data['CAR'] = combined_data['CAR_STD']
-        
-        # Add practice times to combined data using standardized driver names
-        practice_data_copy = self.practice_data.copy()
+            # Process sprint times if available, rebuilding absolute times from the gaps
+            if s_time_col:
+                laps = df[cols['laps']] if cols.get('laps') else None
+                df['sprint_time_seconds'] = self._race_times(df[s_time_col], laps,
+                                                             positions=df['sprint_position'])
         
-        # Rename columns for consistency
-        if p_driver_col and p_driver_col != 'DRIVER':
-            practice_data_copy.rename(columns={p_driver_col: 'DRIVER'}, inplace=True)
-        
-        # Use standardized driver names for joining
-        practice_data_copy['DRIVER'] = practice_data_copy['DRIVER_STD']
+        return df
+
+    def _normalize_sprint_quali(self, df, cols):
+        """Standardize names, convert times and derive gap to sprint pole for sprint qualifying data"""
+        # Key columns in sprint qualifying data
+        sq_pos_col = cols['pos']
+        sq_driver_col = cols['driver']
+        sq_car_col = cols['car']
+        sq1_col = cols['q1']
+        sq2_col = cols['q2']
+        sq3_col = cols['q3']
         
-        # Add practice session data
-        for _, practice_row in practice_data_copy.iterrows():
-            driver = practice_row['DRIVER']
-            combined_idx = combined_data[combined_data['DRIVER'] == driver].index
+        if not sq_pos_col or not sq_driver_col:
+            print("Warning: Sprint qualifying data missing position or driver columns")
+        else:
+            # Create standardized columns
+            df['DRIVER_STD'] = df[sq_driver_col].apply(self._standardize_driver_name)
+            if sq_car_col:
+                df['CAR_STD'] = df[sq_car_col].apply(self._standardize_team_name)
             
-            if len(combined_idx) > 0:
-                # Add available practice session data
-                if 'p1_seconds' in practice_row and not pd.isna(practice_row['p1_seconds']):
-                    combined_data.loc[combined_idx, 'p1_seconds'] = practice_row['p1_seconds']
-                if 'p2_seconds' in practice_row and not pd.isna(practice_row['p2_seconds']):
-                    combined_data.loc[combined_idx, 'p2_seconds'] = practice_row['p2_seconds']
-                if 'p3_seconds' in practice_row and not pd.isna(practice_row['p3_seconds']):
-                    combined_data.loc[combined_idx, 'p3_seconds'] = practice_row['p3_seconds']
-        
-        # Add sprint data if available
-        if self.is_sprint_weekend and self.sprint_data is not None:
-            sprint_data_copy = self.sprint_data.copy()
+            # Process sprint qualifying positions
+            df['sprint_quali_position'] = df[sq_pos_col].apply(self._safe_convert_position)
             
-            # Add sprint data using standardized driver names
-            for _, sprint_row in sprint_data_copy.iterrows():
-                if 'DRIVER_STD' not in sprint_row:
-                    continue
-                    
-                driver = sprint_row['DRIVER_STD']
-                combined_idx = combined_data[combined_data['DRIVER'] == driver].index
-                
-                if len(combined_idx) > 0:
-                    # Add sprint position
-                    if 'sprint_position' in sprint_row:
-                        combined_data.loc[combined_idx, 'sprint_position'] = sprint_row['sprint_position']
-                    # Add sprint time if available
-                    if 'sprint_time_seconds' in sprint_row:
-                        combined_data.loc[combined_idx, 'sprint_time_seconds'] = sprint_row['sprint_time_seconds']
-        
-        # Add sprint qualifying data if available
-        if self.is_sprint_weekend and self.sprint_quali_data is not None:
-            sprint_quali_copy = self.sprint_quali_data.copy()
+            # Process sprint qualifying times
+            for sq_col, std_name in zip([sq1_col, sq2_col, sq3_col], ['SQ1', 'SQ2', 'SQ3']):
+                if sq_col:
+                    df[f'{std_name}_seconds'] = df[sq_col].apply(self._time_to_seconds)
             
-            # Add sprint qualifying data using standardized driver names
-            for _, sq_row in sprint_quali_copy.iterrows():
-                if 'DRIVER_STD' not in sq_row:
-                    continue
-                    
-                driver = sq_row['DRIVER_STD']
-                combined_idx = combined_data[combined_data['DRIVER'] == driver].index
+            # Calculate best sprint qualifying time
+            if sq1_col or sq2_col or sq3_col:
+                df['best_sprint_quali_time'] = df.apply(
+                    lambda row: min(
+                        [t for t in [
+                            row.get('SQ1_seconds'), 
+                            row.get('SQ2_seconds'), 
+                            row.get('SQ3_seconds')
+                        ] if not pd.isna(t) and t is not None], 
+                        default=None
+                    ),
+                    axis=1
+                )
                 
-                if len(combined_idx) > 0:
-                    # Add sprint qualifying position
-                    if 'sprint_quali_position' in sq_row:
-                        combined_data.loc[combined_idx, 'sprint_quali_position'] = sq_row['sprint_quali_position']
-                    # Add gap to sprint pole if available
-                    if 'gap_to_sprint_pole' in sq_row:
-                        combined_data.loc[combined_idx, 'gap_to_sprint_pole'] = sq_row['gap_to_sprint_pole']
-                    # Add best sprint quali time
-                    if 'best_sprint_quali_time' in sq_row:
-                        combined_data.loc[combined_idx, 'best_sprint_quali_time'] = sq_row['best_sprint_quali_time']
-        
-        # Calculate practice session performance (different for sprint vs regular)
-        if self.is_sprint_weekend:
-            self._calculate_sprint_weekend_performance(combined_data)
-        else:
-            self._calculate_regular_weekend_performance(combined_data)
-        
-        # Add team and driver characteristics
-        self._add_characteristics(combined_data)
-        
-        self.combined_data = combined_data
-        print(f"Data loaded for {len(self.combined_data)} drivers\n")
-        
-        return self.combined_data
+                # Calculate gap to sprint pole
+                valid_times = df['best_sprint_quali_time'].dropna()
+                if len(valid_times) > 0:
+                    sprint_pole_time = valid_times.min()
+                    df['gap_to_sprint_pole'] = df['best_sprint_quali_time'].apply(
+                        lambda x: x - sprint_pole_time if not pd.isna(x) else None
+                    )
         
-    def predict_top3(self):
+        return df
+
+    def _classify_session_file(self, filename):
+        """
+        Guess the session type of a CSV file from its name
+        Returns 'quali', 'practice', 'sprint', 'sprint_quali' or None (lap files and others)
+        """
+        name = os.path.splitext(os.path.basename(filename))[0].lower()
+        if 'lap' in name:
+            return None
+        if 'sprint' in name and ('quali' in name or 'shootout' in name):
+            return 'sprint_quali'
+        if 'shootout' in name:
+            return 'sprint_quali'
+        if 'sprint' in name:
+            return 'sprint'
+        if 'quali' in name:
+            return 'quali'
+        if 'practice' in name or re.search(r'(^|[^a-z])f?p[123]([^a-z]|$)', name):
+            return 'practice'
+        return None
+
+    def _discover_weekends(self, root_dir):
+        """
+        Find weekend folders below root_dir (one subdirectory per weekend)
+        Returns a dict of weekend name to {session kind: file path}
+        """
+        weekends = {}
+        for entry in sorted(os.listdir(root_dir)):
+            weekend_dir = os.path.join(root_dir, entry)
+            if not os.path.isdir(weekend_dir):
+                continue
+            sessions = {}
+            for filename in sorted(os.listdir(weekend_dir)):
+                if not filename.lower().endswith('.csv'):
+                    continue
+                kind = self._classify_session_file(filename)
+                if kind is None:
+                    continue
+                if kind in sessions:
+                    print(f"Warning: {entry} has more than one {kind} file, using {os.path.basename(sessions[kind])}")
+                    continue
+                sessions[kind] = os.path.join(weekend_dir, filename)
+            if sessions:
+                weekends[entry] = sessions
+        return weekends
+
+    def load_weekends(self, root_dir, max_threads=None, max_processes=None):
+        """
+        Load every weekend folder below root_dir concurrently
+        Files are read on a thread pool (I/O bound) and each weekend is normalized on a
+        process pool (CPU bound) as soon as all of its files have been read, so parsing
+        and normalization overlap. A weekend with sprint or sprint qualifying files is
+        treated as a sprint weekend. Lap-level files are left to load_practice_laps.
+        Returns a dict of weekend name to {session kind: normalized DataFrame};
+        weekends that fail to load are reported and left out
+        """
+        weekends = self._discover_weekends(root_dir)
+        if not weekends:
+            print(f"Warning: No weekend folders with session files found in {root_dir}")
+            return {}
+        print(f"Loading {len(weekends)} weekends from {root_dir}...")
+
+        reference_state = {
+            'team_name_mapping': self.team_name_mapping,
+            'driver_name_mapping': self.driver_name_mapping,
+            'driver_experience': self.driver_experience,
+            'team_characteristics': self.team_characteristics,
+            'ideal_lap_weight': self.ideal_lap_weight
+        }
+        pending = {weekend: len(sessions) for weekend, sessions in weekends.items()}
+        raw = {weekend: {} for weekend in weekends}
+        failed = set()
+        normalize_futures = {}
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=max_threads) as readers, \
+                ProcessPoolExecutor(max_workers=max_processes, initializer=_init_session_worker,
+                                    initargs=(reference_state,)) as normalizers:
+            read_futures = {
+                readers.submit(self._read_session_csv, path, kind, False, False): (weekend, kind)
+                for weekend, sessions in weekends.items()
+                for kind, path in sessions.items()
+            }
+            for future in as_completed(read_futures):
+                weekend, kind = read_futures[future]
+                try:
+                    raw[weekend][kind] = future.result()
+                except Exception as e:
+                    print(f"Warning: Could not read {kind} data for {weekend}: {str(e)}")
+                    failed.add(weekend)
+                pending[weekend] -= 1
+                if pending[weekend] == 0 and weekend not in failed:
+                    is_sprint = 'sprint' in raw[weekend] or 'sprint_quali' in raw[weekend]
+                    normalize_futures[normalizers.submit(_normalize_weekend_task, raw.pop(weekend),
+                                                         is_sprint)] = weekend
+
+            for future in as_completed(normalize_futures):
+                weekend = normalize_futures[future]
+                try:
+                    results[weekend] = future.result()
+                except Exception as e:
+                    print(f"Warning: Could not process {weekend}: {str(e)}")
+                    failed.add(weekend)
+
+        print(f"Loaded {len(results)} of {len(weekends)} weekends")
+        return {weekend: results[weekend] for weekend in weekends if weekend in results}
+
+    def _categorical_names(self, names, categories):
+        """
+        Encode standardized names as a categorical over a shared dictionary
+        The dictionary only ever grows, so codes stay comparable across weekends
+        """
+        for name in pd.unique(names.dropna()):
+            if name not in categories:
+                categories.append(name)
+        return pd.Categorical(names, categories=categories)
+    
+    def _float32_column(self, values):
+        """Convert a column holding numbers, None or NaN to float32"""
+        return pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float32)
+    
+    def _merge_session_columns(self, combined_data, drivers, session_data, columns):
+        """
+        Add per-driver session columns to the combined data by standardized driver name
+        When a driver appears more than once, the last non-empty value is used
+        """
+        if session_data is None or 'DRIVER_STD' not in session_data.columns:
+            return
+        present = [col for col in columns if col in session_data.columns]
+        if not present:
+            return
+        
+        session_values = session_data[['DRIVER_STD'] + present].copy()
+        for col in present:
+            session_values[col] = pd.to_numeric(session_values[col], errors='coerce')
+        latest = session_values.groupby('DRIVER_STD')[present].last()
+        for col in present:
+            combined_data[col] = self._float32_column(drivers.map(latest[col]))
+
+    def load_form(self, state_path=None):
+        """Read persisted form ratings and use them in place of the static driver ratings"""
+        if state_path is None:
+            state_path = self.form_state_path
+        self.form_tracker = F1FormTracker(state_path)
+        self.form_tracker.apply(self)
+        return self.form_tracker
+
+    def update_form(self, results_path, session='race', wet=False):
+        """
+        Update the form ratings from one race or sprint result file and save them
+        Every driver's experience rating moves towards their result; the wet rating
+        only moves on wet races and the sprint rating only on sprints
+        """
+        if self.form_tracker is None:
+            self.form_tracker = F1FormTracker(self.form_state_path)
+
+        fingerprint = self._file_fingerprint(results_path)
+        if self.form_tracker.has_applied(fingerprint):
+            print(f"Warning: {os.path.basename(results_path)} was already applied to the form ratings")
+            return self.form_tracker
+
+        positions = self._result_positions(results_path)
+        updated = self.form_tracker.update(positions.index, positions, self, session, wet, fingerprint)
+        self.form_tracker.save()
+        self.form_tracker.apply(self)
+        print(f"Form ratings updated for {updated} drivers from {os.path.basename(results_path)}")
+        return self.form_tracker
+
+    def _result_positions(self, results_path):
+        """
+        Finishing position by standardized driver name from a race or sprint result file
+        Drivers who were not classified (DNF, DNS, DSQ, ...) get NaN
+        """
+        results, cols = self._read_session_csv(results_path, 'sprint', verbose=False)
+        if not cols['pos'] or not cols['driver']:
+            raise ValueError("Result data missing required columns for position or driver")
+        drivers = results[cols['driver']].apply(self._standardize_driver_name)
+        positions = results[cols['pos']].apply(lambda pos: self._safe_convert_position(pos, unclassified=np.nan))
+        positions = pd.Series(positions.to_numpy(dtype=float), index=drivers.to_numpy())
+        return positions[~positions.index.duplicated()]
+
+    def train_ranker(self, archive, results, model_path=None, alpha=1.0):
+        """
+        Train the learned ranker on archived weekends and cache it on disk
+        results maps weekend name to its race result file (or to a dict of driver to
+        finishing position). The features are the factor columns the heuristic scorer
+        uses, so both models can be evaluated with one matrix product; a ridge
+        regression per weekend type learns the finishing-position relevance
+        exp(-0.15 * (finish - 1)), the same shape as the grid position factor
+        """
+        samples = {False: ([], []), True: ([], [])}
+        for weekend in archive.list_weekends():
+            if weekend not in results:
+                continue
+            race_name = archive.weekends[weekend]["race"]
+            is_sprint = self._track_for(race_name).get("is_sprint", False) if race_name else False
+            positions = results[weekend]
+            if not isinstance(positions, dict):
+                positions = self._result_positions(positions)
+
+            data = archive.to_frame(weekend)
+            finish = pd.to_numeric(data['DRIVER'].astype(object).map(positions), errors='coerce').to_numpy(dtype=float)
+            keep = ~np.isnan(finish)
+            if not keep.any():
+                print(f"Warning: No finishing positions matched the drivers of {weekend}")
+                continue
+            samples[is_sprint][0].append(self._factor_matrix(data, is_sprint)[keep])
+            samples[is_sprint][1].append(np.exp(-0.15 * (finish[keep] - 1)))
+
+        models = {}
+        for is_sprint, (features, targets) in samples.items():
+            if not features:
+                continue
+            model = Ridge(alpha=alpha).fit(np.vstack(features), np.concatenate(targets))
+            models['sprint' if is_sprint else 'regular'] = {
+                'coef': model.coef_.astype(float),
+                'intercept': float(model.intercept_),
+                'weekends': len(features)
+            }
+        if not models:
+            raise ValueError("No archived weekends with results to train on")
+
+        digest = hashlib.sha1(pickle.dumps(models)).hexdigest()[:16]
+        self.ranker = {
+            'models': models,
+            'factors': {'regular': list(self.regular_factors), 'sprint': list(self.sprint_factors)},
+            'fingerprint': digest
+        }
+        if model_path:
+            with open(model_path, 'wb') as f:
+                pickle.dump(self.ranker, f)
+        print("Ranker trained on " + ", ".join(
+            f"{info['weekends']} {kind} weekends" for kind, info in models.items()))
+        return self.ranker
+
+    def load_ranker(self, model_path):
+        """Load a ranker cached by train_ranker"""
+        with open(model_path, 'rb') as f:
+            ranker = pickle.load(f)
+        if ranker['factors'] != {'regular': list(self.regular_factors), 'sprint': list(self.sprint_factors)}:
+            raise ValueError("Cached ranker was trained on different factors, please retrain it")
+        self.ranker = ranker
+        return self.ranker
+
+    def _ranker_model(self, is_sprint=None):
+        """The trained model for a weekend type, or None"""
+        if self.ranker is None:
+            return None
+        if is_sprint is None:
+            is_sprint = self.is_sprint_weekend
+        return self.ranker['models'].get('sprint' if is_sprint else 'regular')
+
+    def _blend_scores(self, heuristic, learned):
+        """
+        Blend heuristic and learned scores along the driver axis
+        Both are standardized per race so their scales do not matter, and the result
+        is mapped back onto the heuristic's scale
+        """
+        def standardize(values):
+            spread = values.std(axis=-1, keepdims=True)
+            return (values - values.mean(axis=-1, keepdims=True)) / np.where(spread > 0, spread, 1.0)
+
+        blended = (1 - self.ranker_blend) * standardize(heuristic) + self.ranker_blend * standardize(learned)
+        return heuristic.mean(axis=-1, keepdims=True) + heuristic.std(axis=-1, keepdims=True) * blended
+
+    def _blend_contributions(self, contributions, is_sprint=None):
+        """
+        Attribution of the blended score when a ranker is loaded for the weekend type
+        The blend is linear in the heuristic score, so the weighted factors are scaled by
+        (1 - ranker_blend) and the rest of the blended score becomes a 'ranker' column;
+        rows keep summing to the score they explain. Works on (drivers x factors) and
+        (scenarios x drivers x factors). Returns (contributions, factor names)
+        """
+        if is_sprint is None:
+            is_sprint = self.is_sprint_weekend
+        factors = list(self.sprint_factors if is_sprint else self.regular_factors)
+        model = self._ranker_model(is_sprint)
+        if model is None or self.ranker_blend <= 0:
+            return contributions, factors
+
+        learned = self._factor_matrix(is_sprint=is_sprint) @ model['coef'] + model['intercept']
+        heuristic = contributions.sum(axis=-1)
+        kept = 1 - self.ranker_blend
+        ranker = self._blend_scores(heuristic, learned) - kept * heuristic
+        return np.concatenate([kept * contributions, ranker[..., None]], axis=-1), factors + ['ranker']
+
+    def ensemble_scores(self, rain_probability=None):
+        """
+        Heuristic, learned and blended scores of the loaded grid
+        rain_probability may be an array of scenarios; the heuristic weights of every
+        scenario and the ranker's coefficients are stacked into one matrix, so all
+        models for all scenarios come from a single matrix product
+        Returns (heuristic, learned, blended), heuristic and blended shaped scenarios x drivers
+        """
+        model = self._ranker_model()
+        if model is None:
+            raise ValueError("No ranker trained for this weekend type")
+        if rain_probability is None:
+            weights = np.atleast_2d(self._race_weights(is_sprint=self.is_sprint_weekend))
+        else:
+            weights = np.atleast_2d(self._factor_weights(self.track, rain_probability, self.is_sprint_weekend))
+        scores = self._factor_matrix() @ np.vstack([weights, model['coef']]).T
+        heuristic = scores[:, :-1].T
+        learned = scores[:, -1] + model['intercept']
+        return heuristic, learned, self._blend_scores(heuristic, learned)
+
+    def save_to_archive(self, archive, weekend):
+        """Store the loaded weekend in an F1SessionArchive partition"""
+        if self.combined_data is None:
+            raise ValueError("No data loaded. Please load data first.")
+        archive.write_weekend(weekend, self.combined_data, self.race_name)
+        print(f"Archived {len(self.combined_data)} drivers as {weekend}")
+        
+    def reference_version(self):
+        """
+        Fingerprint of the reference tables (teams, drivers, tracks) and scoring settings
+        Anything derived from them (cached results, weight tables) is tied to this value
+        """
+        reference = {
+            "teams": self.team_characteristics,
+            "team_names": self.team_name_mapping,
+            "driver_names": self.driver_name_mapping,
+            "driver_experience": self.driver_experience,
+            "driver_wet_performance": self.driver_wet_performance,
+            "driver_sprint_performance": self.driver_sprint_performance,
+            "tracks": self.track_database,
+            "venues": self.venue_features,
+            "long_run_settings": self.long_run_settings,
+            "tire_compound_offsets": self.tire_compound_offsets,
+            "tire_compound_degradation": self.tire_compound_degradation,
+            "ideal_lap_weight": self.ideal_lap_weight,
+            "timing_noise": self.timing_noise,
+            "score_noise": self.score_noise,
+            "error_seed": self.error_seed,
+            "weight_table_steps": self.weight_table_steps,
+            "track_similarity_features": self.track_similarity_features,
+            "track_neighbours": self.track_neighbours
+        }
+        encoded = json.dumps(reference, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha1(encoded).hexdigest()[:16]
+
+    def _file_fingerprint(self, file_path):
+        """Content hash of an input file, recomputed only when the file changes on disk"""
+        if not file_path:
+            return None
+        stat = os.stat(file_path)
+        stamp = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        if stamp not in self._fingerprint_cache:
+            digest = hashlib.sha1()
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            self._fingerprint_cache[stamp] = digest.hexdigest()
+        return self._fingerprint_cache[stamp]
+
+    def predict_cached(self, cache, quali_path, practice_path, sprint_path=None, sprint_quali_path=None,
+                       practice_laps_path=None):
+        """
+        Predict the top 3 through an F1PredictionCache
+        Results are keyed by race, rain probability (quantized to the cache's step),
+        reference-table version and input file hashes (lap-level practice file included);
+        a hit skips load_data and predict_top3 and restores the combined data and factor
+        attribution behind the cached podium. A miss predicts at the quantized rain
+        probability and leaves the caller's rain probability as it was
+        """
+        rain_probability = cache.quantize_rain(self.rain_probability)
+        key = (
+            self.race_name,
+            rain_probability,
+            self.weather_forecast['fingerprint'] if self.weather_forecast is not None else None,
+            (self.ranker['fingerprint'], self.ranker_blend) if self.ranker is not None else None,
+            self.reference_version(),
+            tuple(self._file_fingerprint(path)
+                  for path in (quali_path, practice_path, sprint_path, sprint_quali_path, practice_laps_path))
+        )
+
+        cached = cache.get(key)
+        if cached is not None:
+            print(f"Using cached prediction for {self.race_name} ({rain_probability*100:.0f}% rain)")
+            self.top3_prediction = cached['top3'].copy()
+            self.mse = cached['mse']
+            self.rmse = cached['rmse']
+            # Entries from older versions carry no frames; leave nothing stale behind
+            for name in ('combined_data', 'factor_contributions'):
+                frame = cached.get(name)
+                setattr(self, name, frame.copy() if frame is not None else None)
+            return self.top3_prediction
+
+        requested_rain = self.rain_probability
+        self.rain_probability = rain_probability
+        try:
+            self.load_data(quali_path, practice_path, sprint_path, sprint_quali_path, practice_laps_path)
+            top3 = self.predict_top3()
+        finally:
+            self.rain_probability = requested_rain
+        if top3 is not None:
+            cache.put(key, {'top3': top3.copy(), 'mse': self.mse, 'rmse': self.rmse,
+                            'combined_data': self.combined_data.copy(),
+                            'factor_contributions': self.factor_contributions.copy()})
+        return top3
+
+    def predict_top3(self):
         """Predict top 3 finishers"""
         if self.combined_data is None:
             print("Error: No data loaded. Please load data first.")
@@ -823,32 +2164,22 @@ class F1RacePredictor:
         print(f"Predicting top 3 finishers for {self.race_name}...")
         if self.is_sprint_weekend:
             print(f"Sprint race weekend")
-        if self.rain_probability > 0:
+        if self.weather_forecast is not None:
+            print(f"Weather conditions: forecast over {len(self.weather_forecast['segment_starts'])} segments, "
+                  f"{self.rain_probability*100:.0f}% average chance of rain")
+        elif self.rain_probability > 0:
             print(f"Weather conditions: {self.rain_probability*100:.0f}% chance of rain")
         else:
             print("Weather conditions: Dry")
         
-        # Get track characteristics
-        track = self.track
-        overtaking_difficulty = track['overtaking_difficulty'] / 10
-        tire_degradation = track['tire_degradation'] / 10
-        start_importance = track['start_importance'] / 10
-        
-        # Calculate race scores
-        if self.is_sprint_weekend:
-            self.combined_data['race_score'] = self.combined_data.apply(
-                lambda row: self._calculate_sprint_weekend_race_score(
-                    row, overtaking_difficulty, tire_degradation, start_importance
-                ),
-                axis=1
-            )
-        else:
-            self.combined_data['race_score'] = self.combined_data.apply(
-                lambda row: self._calculate_regular_weekend_race_score(
-                    row, overtaking_difficulty, tire_degradation, start_importance
-                ),
-                axis=1
-            )
+        # Calculate race scores: one weight-table lookup (or the forecast's race-averaged
+        # weights); the weighted factors, with the learned ranker's share when one is
+        # trained for this weekend type, are kept as the attribution and summed per driver
+        contributions, columns = self._blend_contributions(self._factor_contributions(self._race_weights()))
+        self.factor_contributions = pd.DataFrame(
+            contributions, index=list(self.combined_data['DRIVER']), columns=columns
+        )
+        self.combined_data['race_score'] = contributions.sum(axis=1)
         
         # Sort by race score to get predicted order
         predicted_results = self.combined_data.sort_values('race_score', ascending=False).reset_index(drop=True)
@@ -866,190 +2197,689 @@ class F1RacePredictor:
         # Print results to console
         self._print_prediction()
         
+        if self.results_store is not None:
+            self.results_store.record(self)
+        
         return self.top3_prediction
-    def _calculate_regular_weekend_race_score(self, driver, overtaking_difficulty, tire_degradation, start_importance):
-        """Calculate race performance score for regular race weekend with rain factors"""
-        try:
-            # Starting position factor
-            position_weight = 0.30 + (0.05 * overtaking_difficulty)
-            # In wet conditions, starting position becomes less important
-            position_weight = position_weight * (1 - (self.rain_probability * 0.3))
-            
-            position = float(driver['position']) if not pd.isna(driver['position']) else 20.0
-            position_factor = np.exp(-0.15 * (position - 1))
-            position_score = position_factor * position_weight
-            
-            # Qualifying pace factor
-            quali_weight = 0.15 - (0.05 * overtaking_difficulty)
-            # In wet conditions, qualifying pace becomes less important
-            quali_weight = quali_weight * (1 - (self.rain_probability * 0.3))
-            
-            quali_factor = 1.0 if pd.isna(driver['gap_to_pole']) else max(0.7, 1 - (driver['gap_to_pole'] * 0.5))
-            quali_score = quali_factor * quali_weight
-            
-            # Practice 2 factor (race pace)
-            p2_weight = 0.25 + (0.05 * tire_degradation)
-            # In wet conditions, practice pace is less representative
-            p2_weight = p2_weight * (1 - (self.rain_probability * 0.4))
-            
-            p2_factor = driver['p2_score'] if 'p2_score' in driver and not pd.isna(driver['p2_score']) else 0.75
-            p2_score = p2_factor * p2_weight
-            
-            # Practice 3 factor (qualifying simulation)
-            p3_weight = 0.10
-            # In wet conditions, practice pace is less representative
-            p3_weight = p3_weight * (1 - (self.rain_probability * 0.4))
-            
-            p3_factor = driver['p3_score'] if 'p3_score' in driver and not pd.isna(driver['p3_score']) else 0.75
-            p3_score = p3_factor * p3_weight
-            
-            # Team race pace factor
-            team_weight = 0.10
-            # Team race pace slightly less relevant in wet conditions
-            team_weight = team_weight * (1 - (self.rain_probability * 0.2))
-            
-            team_factor = driver['race_pace_factor'] if 'race_pace_factor' in driver else 1.0
-            team_score = team_factor * team_weight
-            
-            # Tire management factor
-            tire_weight = 0.10 + (0.05 * tire_degradation)
-            # In wet conditions, tire management becomes more important
-            tire_weight = tire_weight * (1 + (self.rain_probability * 0.2))
-            
-            tire_factor = driver['tire_mgmt'] / 10 if 'tire_mgmt' in driver else 0.7
-            tire_score = tire_factor * tire_weight
-            
-            # Driver experience factor
-            exp_weight = 0.10 + (0.02 * tire_degradation)
-            # In wet conditions, experience becomes more important
-            exp_weight = exp_weight * (1 + (self.rain_probability * 0.3))
-            
-            exp_factor = driver['driver_experience'] if 'driver_experience' in driver else 0.85
-            exp_score = exp_factor * exp_weight
-            
-            # Calculate wet performance factors (only applies when rain probability > 0)
-            wet_driver_score = 0
-            wet_team_score = 0
-            
-            if self.rain_probability > 0:
-                # Driver wet performance factor (increases with rain probability)
-                wet_driver_weight = 0.35 * self.rain_probability
-                wet_driver_factor = driver['driver_wet_performance'] / 10 if 'driver_wet_performance' in driver else 0.75
-                wet_driver_score = wet_driver_factor * wet_driver_weight
-                
-                # Team wet performance factor (increases with rain probability)
-                wet_team_weight = 0.25 * self.rain_probability
-                wet_team_factor = driver['wet_performance'] / 10 if 'wet_performance' in driver else 0.7
-                wet_team_score = wet_team_factor * wet_team_weight
-            
-            # Total score
-            total_weight = (position_weight + quali_weight + p2_weight + p3_weight + 
-                           team_weight + tire_weight + exp_weight + 
-                           (0.35 * self.rain_probability) + (0.25 * self.rain_probability))
-            
-            race_score = (position_score + quali_score + p2_score + p3_score + 
-                         team_score + tire_score + exp_score + 
-                         wet_driver_score + wet_team_score) / total_weight
-            
-            return race_score
-        except Exception as e:
-            print(f"Error calculating race score: {e}")
-            return 0.1
-            
-    def _calculate_sprint_weekend_race_score(self, driver, overtaking_difficulty, tire_degradation, start_importance):
-        """Calculate race performance score for sprint race weekend with rain factors"""
-        try:
-            # Starting position factor
-            position_weight = 0.25 + (0.05 * overtaking_difficulty)
-            # In wet conditions, starting position becomes less important
-            position_weight = position_weight * (1 - (self.rain_probability * 0.3))
-            
-            position = float(driver['position']) if not pd.isna(driver['position']) else 20.0
-            position_factor = np.exp(-0.15 * (position - 1))
-            position_score = position_factor * position_weight
-            
-            # Qualifying pace factor
-            quali_weight = 0.15 - (0.05 * overtaking_difficulty)
-            # In wet conditions, qualifying pace becomes less important
-            quali_weight = quali_weight * (1 - (self.rain_probability * 0.3))
-            
-            quali_factor = 1.0 if pd.isna(driver['gap_to_pole']) else max(0.7, 1 - (driver['gap_to_pole'] * 0.5))
-            quali_score = quali_factor * quali_weight
-            
-            # Sprint race performance factor (specific to sprint weekends)
-            sprint_weight = 0.20
-            # Sprint performance slightly less relevant in wet race conditions
-            sprint_weight = sprint_weight * (1 - (self.rain_probability * 0.2))
-            
-            sprint_factor = driver['sprint_position_score'] if 'sprint_position_score' in driver and not pd.isna(driver['sprint_position_score']) else 0.75
-            sprint_score = sprint_factor * sprint_weight
-            
-            # Practice 1 factor (only practice in sprint weekend)
-            p1_weight = 0.10
-            # In wet conditions, practice pace is less representative
-            p1_weight = p1_weight * (1 - (self.rain_probability * 0.4))
-            
-            p1_factor = driver['p1_score'] if 'p1_score' in driver and not pd.isna(driver['p1_score']) else 0.75
-            p1_score = p1_factor * p1_weight
-            
-            # Team race pace factor
-            team_weight = 0.10
-            # Team race pace slightly less relevant in wet conditions
-            team_weight = team_weight * (1 - (self.rain_probability * 0.2))
-            
-            team_factor = driver['race_pace_factor'] if 'race_pace_factor' in driver else 1.0
-            team_score = team_factor * team_weight
-            
-            # Tire management factor
-            tire_weight = 0.10 + (0.05 * tire_degradation)
-            # In wet conditions, tire management becomes more important
-            tire_weight = tire_weight * (1 + (self.rain_probability * 0.2))
-            
-            tire_factor = driver['tire_mgmt'] / 10 if 'tire_mgmt' in driver else 0.7
-            tire_score = tire_factor * tire_weight
-            
-            # Driver sprint performance factor
-            driver_sprint_weight = 0.15
-            # Sprint performance becomes more important in wet conditions (different skill set)
-            driver_sprint_weight = driver_sprint_weight * (1 + (self.rain_probability * 0.1))
-            
-            driver_sprint_factor = driver['driver_sprint_performance'] / 10 if 'driver_sprint_performance' in driver else 0.75
-            driver_sprint_score = driver_sprint_factor * driver_sprint_weight
-            
-            # Team sprint performance factor
-            team_sprint_weight = 0.05
-            team_sprint_factor = driver['sprint_performance'] / 10 if 'sprint_performance' in driver else 0.75
-            team_sprint_score = team_sprint_factor * team_sprint_weight
-            
-            # Calculate wet performance factors (only applies when rain probability > 0)
-            wet_driver_score = 0
-            wet_team_score = 0
-            
-            if self.rain_probability > 0:
-                # Driver wet weather skill
-                wet_driver_weight = 0.35 * self.rain_probability
-                wet_driver_factor = driver['driver_wet_performance'] / 10 if 'driver_wet_performance' in driver else 0.75
-                wet_driver_score = wet_driver_factor * wet_driver_weight
-                
-                # Team wet weather performance
-                wet_team_weight = 0.25 * self.rain_probability
-                wet_team_factor = driver['wet_performance'] / 10 if 'wet_performance' in driver else 0.7
-                wet_team_score = wet_team_factor * wet_team_weight
-            
-            # Total score
-            total_weight = (position_weight + quali_weight + sprint_weight + p1_weight + 
-                           team_weight + tire_weight + driver_sprint_weight + team_sprint_weight + 
-                           (0.35 * self.rain_probability) + (0.25 * self.rain_probability))
-            
-            race_score = (position_score + quali_score + sprint_score + p1_score + 
-                         team_score + tire_score + driver_sprint_score + team_sprint_score + 
-                         wet_driver_score + wet_team_score) / total_weight
-            
-            return race_score
-        except Exception as e:
-            print(f"Error calculating sprint weekend race score: {e}")
-            return 0.1
-    
+
+    def share_feature_arrays(self):
+        """
+        Publish the loaded weekend's numeric features in shared memory for worker processes
+        Holds every numeric column of combined_data plus the factor matrix ('factors');
+        pass the returned F1SharedArrays' descriptor to workers, which read the arrays
+        with _attach_shared_arrays. Close it (or use it as a context manager) when done
+        """
+        if self.combined_data is None:
+            raise ValueError("No data loaded. Please load data first.")
+        arrays = {col: self.combined_data[col].to_numpy()
+                  for col in self.combined_data.columns
+                  if pd.api.types.is_numeric_dtype(self.combined_data[col])}
+        arrays['factors'] = self._factor_matrix()
+        return F1SharedArrays(arrays)
+
+    def _factor_matrix(self, data=None, is_sprint=None):
+        """
+        Build the per-driver factor values (drivers x factors) used by the race score
+        Columns follow self.sprint_factors or self.regular_factors; missing inputs get
+        the same defaults as the row-by-row scorers
+        """
+        if data is None:
+            data = self.combined_data
+        if is_sprint is None:
+            is_sprint = self.is_sprint_weekend
+
+        def column(name, default):
+            if name in data.columns:
+                values = pd.to_numeric(data[name], errors='coerce').to_numpy(dtype=float)
+                return np.where(np.isnan(values), default, values)
+            return np.full(len(data), default, dtype=float)
+
+        position = column('position', 20.0)
+        position_factor = np.exp(-0.15 * (position - 1))
+        gap_to_pole = column('gap_to_pole', np.nan)
+        quali_factor = np.where(np.isnan(gap_to_pole), 1.0, np.maximum(0.7, 1 - (gap_to_pole * 0.5)))
+        team_factor = column('race_pace_factor', 1.0)
+        tire_factor = column('tire_mgmt', 7.0) / 10
+        wet_driver_factor = column('driver_wet_performance', 7.5) / 10
+        wet_team_factor = column('wet_performance', 7.0) / 10
+
+        if is_sprint:
+            factors = [
+                position_factor,
+                quali_factor,
+                column('sprint_position_score', 0.75),
+                column('p1_score', 0.75),
+                team_factor,
+                tire_factor,
+                column('driver_sprint_performance', 7.5) / 10,
+                column('sprint_performance', 7.5) / 10,
+                wet_driver_factor,
+                wet_team_factor
+            ]
+        else:
+            factors = [
+                position_factor,
+                quali_factor,
+                column('p2_score', 0.75),
+                column('p3_score', 0.75),
+                team_factor,
+                tire_factor,
+                column('driver_experience', 0.85),
+                wet_driver_factor,
+                wet_team_factor
+            ]
+        return np.column_stack(factors)
+
+    def _factor_contributions(self, weights, data=None, is_sprint=None):
+        """
+        Weighted factor values, i.e. each factor's contribution to each driver's score
+        weights of shape (factors,) give (drivers x factors); a batch of weights
+        (scenarios x factors) gives (scenarios x drivers x factors). Summing over the
+        last axis gives the race scores
+        """
+        factors = self._factor_matrix(data, is_sprint)
+        weights = np.asarray(weights, dtype=float)
+        return factors * weights[..., None, :]
+
+    def factor_attribution(self, rain_probability=None, race_name=None):
+        """
+        Per-driver, per-factor contributions to the race score for the whole grid
+        A scalar rain probability gives a DataFrame (drivers x factors); an array of
+        rain probabilities gives an array (scenarios x drivers x factors) in one pass.
+        With a ranker loaded the scores are the blended ones and a last 'ranker'
+        column holds the learned model's share
+        """
+        if self.combined_data is None:
+            print("Error: No data loaded. Please load data first.")
+            return None
+        if race_name is None:
+            race_name = self.race_name
+        track = self._track_for(race_name) if race_name != self.race_name else self.track
+
+        # The loaded weekend decides the factor set, whatever the other race's format
+        is_sprint = self.is_sprint_weekend
+        if np.ndim(rain_probability) == 0:
+            weights = self._race_weights(race_name, rain_probability, track, is_sprint)
+            contributions, columns = self._blend_contributions(
+                self._factor_contributions(weights, is_sprint=is_sprint), is_sprint)
+            return pd.DataFrame(contributions, index=list(self.combined_data['DRIVER']), columns=columns)
+        weights = self._factor_weights(track, rain_probability, is_sprint)
+        return self._blend_contributions(self._factor_contributions(weights, is_sprint=is_sprint), is_sprint)[0]
+
+    def _factor_weights(self, track=None, rain_probability=None, is_sprint=None):
+        """
+        Normalized factor weights for a track and rain probability
+        rain_probability may be an array, giving weights of shape rain.shape + (factors,)
+        """
+        if track is None:
+            track = self.track
+        if rain_probability is None:
+            rain_probability = self.rain_probability
+        if is_sprint is None:
+            is_sprint = track.get("is_sprint", False)
+
+        overtaking_difficulty = track['overtaking_difficulty'] / 10
+        tire_degradation = track['tire_degradation'] / 10
+        rain = np.asarray(rain_probability, dtype=float)
+        ones = np.ones_like(rain)
+
+        position_weight = (0.30 + (0.05 * overtaking_difficulty)) * (1 - (rain * 0.3))
+        quali_weight = (0.15 - (0.05 * overtaking_difficulty)) * (1 - (rain * 0.3))
+        team_weight = 0.10 * (1 - (rain * 0.2))
+        tire_weight = (0.10 + (0.05 * tire_degradation)) * (1 + (rain * 0.2))
+        wet_driver_weight = 0.35 * rain
+        wet_team_weight = 0.25 * rain
+
+        if is_sprint:
+            position_weight = (0.25 + (0.05 * overtaking_difficulty)) * (1 - (rain * 0.3))
+            weights = [
+                position_weight,
+                quali_weight,
+                0.20 * (1 - (rain * 0.2)),         # Sprint race result
+                0.10 * (1 - (rain * 0.4)),         # Practice 1
+                team_weight,
+                tire_weight,
+                0.15 * (1 + (rain * 0.1)),         # Driver sprint ability
+                0.05 * ones,                       # Team sprint setup
+                wet_driver_weight,
+                wet_team_weight
+            ]
+        else:
+            weights = [
+                position_weight,
+                quali_weight,
+                (0.25 + (0.05 * tire_degradation)) * (1 - (rain * 0.4)),   # Practice 2
+                0.10 * (1 - (rain * 0.4)),                                  # Practice 3
+                team_weight,
+                tire_weight,
+                (0.10 + (0.02 * tire_degradation)) * (1 + (rain * 0.3)),   # Driver experience
+                wet_driver_weight,
+                wet_team_weight
+            ]
+        weights = np.stack(weights, axis=-1)
+        return weights / weights.sum(axis=-1, keepdims=True)
+
+    def _build_weight_tables(self):
+        """
+        Precompute normalized weights for every track at every quantized rain level
+        One (rain levels x factors) array per race, built once per track table version
+        """
+        rain_levels = np.linspace(0.0, 1.0, self.weight_table_steps + 1)
+        self._weight_tables = {
+            race: self._factor_weights(track, rain_levels)
+            for race, track in self.track_database.items()
+        }
+        self._weight_table_version = self._track_table_version
+
+    def update_track(self, race_name, **characteristics):
+        """
+        Add a race to the track database or change characteristics of an existing one
+        New races need name, overtaking_difficulty, tire_degradation and start_importance
+        """
+        track = dict(self.track_database.get(race_name, {"is_sprint": False}))
+        track.update(characteristics)
+        missing = [key for key in ('name', 'overtaking_difficulty', 'tire_degradation', 'start_importance')
+                   if key not in track]
+        if missing:
+            raise ValueError(f"Track {race_name} missing characteristics: {', '.join(missing)}")
+        self.track_database[race_name] = track
+        self.invalidate_track_tables()
+        if race_name == self.race_name:
+            self.track = track
+        return track
+
+    def invalidate_track_tables(self):
+        """Mark the weight tables and similarity index stale after a track database change"""
+        self._track_table_version += 1
+
+    def _weights_for(self, race_name, rain_probability, track=None, is_sprint=None):
+        """
+        Normalized factor weights for a race, looked up from the precomputed table
+        Falls back to computing them directly for tracks outside the database, for
+        rain probabilities between table steps and when is_sprint overrides the
+        track's own weekend format
+        """
+        if track is None:
+            track = self._track_for(race_name)
+        if is_sprint is not None and is_sprint != track.get("is_sprint", False):
+            return self._factor_weights(track, rain_probability, is_sprint)
+        if self._weight_table_version != self._track_table_version:
+            self._build_weight_tables()
+
+        table = self._weight_tables.get(race_name)
+        level = rain_probability * self.weight_table_steps
+        step = int(round(level))
+        if table is not None and track is self.track_database[race_name] and abs(level - step) < 1e-9:
+            return table[step]
+        return self._factor_weights(track, rain_probability)
+
+    def _race_weights(self, race_name=None, rain_probability=None, track=None, is_sprint=None):
+        """
+        Factor weights behind every prediction of a race (selected race by default)
+        Without an explicit rain probability the selected race uses the loaded weather
+        forecast's race-averaged weights, and any race the current rain probability;
+        everything that scores a race goes through here so all outputs agree
+        """
+        if race_name is None:
+            race_name = self.race_name
+        if track is None and race_name == self.race_name:
+            track = self.track
+        if rain_probability is None:
+            if self.weather_forecast is not None and race_name == self.race_name and \
+                    (is_sprint is None or is_sprint == self.track.get("is_sprint", False)):
+                return self._forecast_weights(track).mean(axis=0)
+            rain_probability = self.rain_probability
+        return self._weights_for(race_name, rain_probability, track, is_sprint)
+
+    def _score_sigma(self, rain_probability):
+        """Race-day spread of race_score, widened by rain"""
+        return self.score_noise * (1.0 + (np.asarray(rain_probability, dtype=float) * 0.5))
+
+    def _pairwise_probabilities(self, scores, rain_probability):
+        """
+        Closed-form P(row driver finishes ahead of column driver)
+        With independent normal race-day noise on each score, the difference of two
+        drivers' scores is normal too, so every pair is one CDF evaluation.
+        scores has shape (..., drivers) and the result (..., drivers, drivers)
+        """
+        scores = np.asarray(scores, dtype=float)
+        sigma = self._score_sigma(rain_probability)
+        sigma = np.reshape(sigma, np.shape(sigma) + (1, 1))
+        diff = scores[..., :, None] - scores[..., None, :]
+        probabilities = ndtr(diff / (sigma * np.sqrt(2.0)))
+        idx = np.arange(scores.shape[-1])
+        probabilities[..., idx, idx] = np.nan
+        return probabilities
+
+    def _podium_probabilities(self, scores, rain_probability, places=3, nodes=24):
+        """
+        P(each driver finishes in the top places) with normal race-day noise on the scores
+        Given a driver's own noise the rivals beat them independently, so the number of
+        drivers ahead follows a Poisson binomial (a short recurrence over the rivals) and
+        the driver's noise is integrated out by Gauss-Hermite quadrature. Exact up to the
+        quadrature (24 nodes: within 0.001), with no sampling error; scores has shape
+        (..., drivers)
+        """
+        scores = np.asarray(scores, dtype=float)
+        sigma = self._score_sigma(rain_probability)
+        sigma = np.reshape(sigma, np.shape(sigma) + (1, 1))
+        x, w = np.polynomial.hermite_e.hermegauss(nodes)
+        w = w / w.sum()
+
+        # ahead[k]: probability that exactly k rivals are ahead so far (..., drivers, nodes)
+        ahead = np.zeros((places,) + scores.shape + (nodes,))
+        ahead[0] = 1.0
+        own = scores[..., :, None] / sigma + x
+        beats = np.empty_like(own)
+        change = np.empty_like(own)
+        for j in range(scores.shape[-1]):
+            np.subtract(scores[..., j, None, None] / sigma, own, out=beats)
+            ndtr(beats, out=beats)
+            beats[..., j, :] = 0.0
+            for k in range(places - 1, 0, -1):
+                np.subtract(ahead[k - 1], ahead[k], out=change)
+                change *= beats
+                ahead[k] += change
+            np.multiply(ahead[0], beats, out=change)
+            ahead[0] -= change
+        return ahead.sum(axis=0) @ w
+
+    def _calendar_scores(self, races, rain_probability=None):
+        """
+        Race scores of the loaded grid at every race in one pass (races x drivers)
+        rain_probability may be a scalar or a dict of race name to probability; races
+        without one are scored as _race_weights does (forecast for the selected race)
+        Returns the scores and each race's rain probability
+        """
+        if rain_probability is None:
+            per_race = {}
+        elif isinstance(rain_probability, dict):
+            per_race = rain_probability
+        else:
+            per_race = dict.fromkeys(races, rain_probability)
+        rains = np.array([per_race.get(race, self.rain_probability) for race in races], dtype=float)
+
+        tracks = [self._track_for(race) for race in races]
+        scores = np.empty((len(races), len(self.combined_data)))
+
+        # Regular and sprint weekends use different factor sets, so score each group once
+        for is_sprint in (False, True):
+            rows = [i for i, track in enumerate(tracks) if track.get("is_sprint", False) == is_sprint]
+            if not rows:
+                continue
+            factors = self._factor_matrix(is_sprint=is_sprint)
+            weights = np.stack([self._race_weights(races[i], per_race.get(races[i]), tracks[i]) for i in rows])
+            scores[rows] = weights @ factors.T
+        return scores, rains
+
+    def head_to_head_matrix(self, race_name=None, rain_probability=None):
+        """
+        Pairwise win-probability matrix for the loaded grid
+        Entry [A, B] is P(driver A finishes ahead of driver B); the diagonal is NaN
+        """
+        if self.combined_data is None:
+            print("Error: No data loaded. Please load data first.")
+            return None
+        if race_name is None:
+            race_name = self.race_name
+
+        scores, rains = self._calendar_scores([race_name], rain_probability)
+        probabilities = self._pairwise_probabilities(scores[0], rains[0])
+        drivers = list(self.combined_data['DRIVER'])
+        return pd.DataFrame(probabilities, index=drivers, columns=drivers)
+
+    def head_to_head_calendar(self, races=None, rain_probability=None):
+        """
+        Pairwise win-probability matrices for a whole calendar in one batched call
+        Returns a dict of race name to matrix (see head_to_head_matrix)
+        """
+        if self.combined_data is None:
+            print("Error: No data loaded. Please load data first.")
+            return None
+        if races is None:
+            races = list(self.track_database.keys())
+
+        scores, rains = self._calendar_scores(races, rain_probability)
+        probabilities = self._pairwise_probabilities(scores, rains)
+        drivers = list(self.combined_data['DRIVER'])
+        return {
+            race: pd.DataFrame(probabilities[i], index=drivers, columns=drivers)
+            for i, race in enumerate(races)
+        }
+
+    def simulate_race(self, n_simulations=10000, rain_probability=None, seed=None):
+        """
+        Draw finishing positions of the loaded grid for the selected race
+        Returns an integer array of shape (simulations, drivers), 1 = winner
+        """
+        if self.combined_data is None:
+            print("Error: No data loaded. Please load data first.")
+            return None
+        scores = self._factor_matrix() @ self._race_weights(rain_probability=rain_probability)
+        if rain_probability is None:
+            rain_probability = self.rain_probability
+        rng = np.random.default_rng(seed)
+        return _draw_finishing_positions(rng, scores, self._score_sigma(rain_probability), n_simulations)
+
+    def constructor_outlook(self, n_simulations=10000, rain_probability=None, seed=None):
+        """
+        Team-level outlook for the selected weekend from driver-level simulations
+        Returns a DataFrame with expected constructor points, P(at least one car on
+        the podium) and P(double podium), aggregated with grouped reductions
+        """
+        if self.combined_data is None:
+            print("Error: No data loaded. Please load data first.")
+            return None
+        scores = self._factor_matrix() @ self._race_weights(rain_probability=rain_probability)
+        if rain_probability is None:
+            rain_probability = self.rain_probability
+        sigma = self._score_sigma(rain_probability)
+        n_drivers = len(scores)
+        rng = np.random.default_rng(seed)
+
+        positions = _draw_finishing_positions(rng, scores, sigma, n_simulations)
+        driver_points = self._points_vector(self.race_points, n_drivers)[positions - 1]
+        if self.is_sprint_weekend:
+            # The sprint is a separate race with its own finishing order
+            sprint_positions = _draw_finishing_positions(rng, scores, sigma, n_simulations)
+            driver_points = driver_points + self._points_vector(self.sprint_points, n_drivers)[sprint_positions - 1]
+
+        # Sum each team's cars for every simulation in one matrix product
+        membership, teams = self._team_membership()
+        team_points = driver_points @ membership
+        team_podiums = (positions <= 3).astype(float) @ membership
+
+        outlook = pd.DataFrame({
+            'CAR': teams,
+            'expected_points': team_points.mean(axis=0),
+            'podium_probability': (team_podiums >= 1).mean(axis=0),
+            'double_podium_probability': (team_podiums >= 2).mean(axis=0),
+            'win_probability': ((positions == 1).astype(float) @ membership).mean(axis=0)
+        }).sort_values('expected_points', ascending=False).reset_index(drop=True)
+
+        print("\nCONSTRUCTOR OUTLOOK:")
+        for _, row in outlook.head(5).iterrows():
+            print(f"{row['CAR']}: {row['expected_points']:.1f} pts, "
+                  f"podium {row['podium_probability']*100:.1f}%, "
+                  f"double podium {row['double_podium_probability']*100:.1f}%")
+
+        return outlook
+
+    def _timing_replicates(self, rng, times, sd, n_replicates):
+        """
+        Jittered copies of a timing column (replicates x drivers); missing times stay missing
+        sd is a scalar or a per-driver array of standard deviations in seconds
+        """
+        times = pd.to_numeric(times, errors='coerce').to_numpy(dtype=float)
+        return times + np.asarray(sd, dtype=float) * rng.standard_normal((n_replicates, len(times)))
+
+    def _gap_replicates(self, times):
+        """Gap of every time to each replicate's fastest time"""
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return times - np.nanmin(times, axis=-1, keepdims=True)
+
+    def _gap_score_replicates(self, gaps, slope, floor=0.7, missing=0.75):
+        """Vectorized max(floor, 1 - gap * slope), missing gaps scored as missing"""
+        scores = np.maximum(floor, 1 - gaps * slope)
+        return np.where(np.isnan(scores), missing, scores)
+
+    def _longrun_noise(self, column, default_sd):
+        """
+        Per-driver standard error of the long-run pace (lap spread / sqrt(laps))
+        Drivers without a long run fall back to default_sd
+        """
+        sd = np.full(len(self.combined_data), default_sd)
+        if self.practice_longruns is None or column not in self.combined_data.columns:
+            return sd
+        runs = self.practice_longruns.set_index('DRIVER')
+        drivers = self.combined_data['DRIVER'].astype(object)
+        stderr = (drivers.map(runs['longrun_std']) / np.sqrt(drivers.map(runs['longrun_laps']))).to_numpy(dtype=float)
+        return np.where(np.isfinite(stderr) & (stderr > 0), stderr, sd)
+
+    def bootstrap_intervals(self, n_replicates=2000, rain_probability=None, confidence=0.9, seed=None):
+        """
+        Confidence intervals on each driver's race score and podium probability
+        Qualifying and practice times are jittered by their measurement noise
+        (self.timing_noise, or the standard error of the long run when lap-level data
+        was loaded) and the timing-based factors are recomputed for all replicates in one
+        array pass. Every replicate's podium probability is computed in closed form
+        (_podium_probabilities), so the podium interval only reflects timing uncertainty.
+        Returns a DataFrame sorted by median score
+        """
+        if self.combined_data is None:
+            print("Error: No data loaded. Please load data first.")
+            return None
+        weights = self._race_weights(rain_probability=rain_probability)
+        if rain_probability is None:
+            rain_probability = self.rain_probability
+
+        data = self.combined_data
+        rng = np.random.default_rng(seed)
+        is_sprint = self.is_sprint_weekend
+        factor_names = self.sprint_factors if is_sprint else self.regular_factors
+        factors = np.broadcast_to(self._factor_matrix(), (n_replicates,) + (len(data), len(factor_names))).copy()
+
+        # Qualifying: gap to the replicate's pole time, blended with the ideal-lap gap
+        # (both laps jittered by the same draw) as in _normalize_quali
+        noise = self.timing_noise['quali'] * rng.standard_normal((n_replicates, len(data)))
+        gaps = self._gap_replicates(pd.to_numeric(data['best_quali_time'], errors='coerce').to_numpy(dtype=float) + noise)
+        if 'ideal_quali_time' in data.columns:
+            ideal = pd.to_numeric(data['ideal_quali_time'], errors='coerce').to_numpy(dtype=float) + noise
+            gaps = self._blend_ideal(gaps, self._gap_replicates(ideal))
+        factors[:, :, factor_names.index('quali')] = self._gap_score_replicates(gaps, 0.5, missing=1.0)
+
+        # Practice pace, from long runs when they were loaded and FP3 blended with the
+        # ideal lap (same choices as the scorers)
+        p3_times = data['p3_seconds']
+        if 'p3_ideal_seconds' in data.columns:
+            p3_times = self._blend_ideal(pd.to_numeric(p3_times, errors='coerce'),
+                                         pd.to_numeric(data['p3_ideal_seconds'], errors='coerce'))
+        practice = [('p1', data['p1_seconds'], 'p1_longrun_seconds', 0.4)] if is_sprint else [
+            ('p2', data['p2_seconds'], 'p2_longrun_seconds', 0.4), ('p3', p3_times, None, 0.5)
+        ]
+        for factor, times, longrun_column, slope in practice:
+            sd = self.timing_noise['practice']
+            if longrun_column in data.columns and data[longrun_column].notna().any():
+                times = data[longrun_column]
+                sd = self._longrun_noise(longrun_column, sd)
+            times = self._timing_replicates(rng, times, sd, n_replicates)
+            factors[:, :, factor_names.index(factor)] = self._gap_score_replicates(self._gap_replicates(times), slope)
+
+        scores = factors @ weights
+
+        # Podium probability of every replicate, without race simulation noise
+        podiums = self._podium_probabilities(scores, rain_probability)
+
+        tail = (1 - confidence) / 2 * 100
+        intervals = pd.DataFrame({
+            'DRIVER': list(data['DRIVER']),
+            'CAR': list(data['CAR']),
+            'score_median': np.median(scores, axis=0),
+            'score_low': np.percentile(scores, tail, axis=0),
+            'score_high': np.percentile(scores, 100 - tail, axis=0),
+            'podium_probability': podiums.mean(axis=0),
+            'podium_low': np.percentile(podiums, tail, axis=0),
+            'podium_high': np.percentile(podiums, 100 - tail, axis=0)
+        }).sort_values('score_median', ascending=False).reset_index(drop=True)
+
+        print(f"\nSCORE INTERVALS ({confidence*100:.0f}%, {n_replicates} replicates):")
+        for _, row in intervals.head(5).iterrows():
+            print(f"{row['DRIVER']}: {row['score_median']:.3f} "
+                  f"({row['score_low']:.3f}-{row['score_high']:.3f}), "
+                  f"podium {row['podium_low']*100:.0f}-{row['podium_high']*100:.0f}%")
+
+        return intervals
+
+    def _remaining_races(self):
+        """Races from the selected one to the end of the calendar"""
+        races = list(self.track_database.keys())
+        if self.race_name in races:
+            return races[races.index(self.race_name):]
+        return races
+
+    def _points_vector(self, points, n_drivers):
+        """Points for every finishing position of an n-driver field"""
+        vector = np.zeros(n_drivers)
+        count = min(len(points), n_drivers)
+        vector[:count] = points[:count]
+        return vector
+
+    def _team_codes(self, data=None):
+        """Integer team code per driver and the list of teams, for grouped reductions"""
+        if data is None:
+            data = self.combined_data
+        codes, teams = pd.factorize(data['CAR'].astype(str))
+        return codes, list(teams)
+
+    def _team_membership(self, data=None):
+        """
+        Driver-to-team membership matrix (drivers x teams) and the list of teams
+        Multiplying driver-level simulation arrays by it sums each team's cars
+        """
+        codes, teams = self._team_codes(data)
+        membership = np.zeros((len(codes), len(teams)))
+        membership[np.arange(len(codes)), codes] = 1.0
+        return membership, teams
+
+    def project_championship(self, current_points=None, current_team_points=None, races=None,
+                             n_simulations=10000, rain_probability=None, workers=None, seed=None,
+                             use_shared_memory=True):
+        """
+        Simulate the rest of the season and return championship probability distributions
+        Every remaining Grand Prix (and sprint on sprint weekends) is scored with its own
+        track characteristics, finishing orders are drawn for all simulations at once and
+        fixed-size chunks of simulations run in parallel processes. A seeded run gives
+        the same result for any number of workers. With use_shared_memory the score and
+        points arrays are published once and workers attach to them instead of
+        receiving pickled copies with every chunk.
+        Returns a dict with 'drivers', 'constructors' and 'driver_positions' DataFrames
+        """
+        if self.combined_data is None:
+            print("Error: No data loaded. Please load data first.")
+            return None
+        if races is None:
+            races = self._remaining_races()
+        if current_points is None:
+            current_points = {}
+        if current_team_points is None:
+            current_team_points = {}
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        print(f"Projecting championship over {len(races)} races ({n_simulations} simulations)...")
+        scores, rains = self._calendar_scores(races, rain_probability)
+        sigmas = self._score_sigma(rains)
+        n_drivers = scores.shape[1]
+
+        race_points = self._points_vector(self.race_points, n_drivers)
+        sprint_points = self._points_vector(self.sprint_points, n_drivers)
+        events = []
+        for i, race in enumerate(races):
+            if self._track_for(race).get("is_sprint", False):
+                events.append((i, 'sprint_points'))
+            events.append((i, 'race_points'))
+        points_tables = {'race_points': race_points, 'sprint_points': sprint_points}
+
+        # Split simulations into fixed-size chunks, each with its own child random stream;
+        # the chunks do not depend on the worker count, so a seeded run is reproducible
+        chunk_size = self.simulation_chunk_size
+        n_chunks = max(1, -(-n_simulations // chunk_size))
+        chunk_sizes = [min(chunk_size, n_simulations - i * chunk_size) for i in range(n_chunks)]
+        seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+        workers = min(workers, n_chunks)
+
+        if workers == 1:
+            season_points = np.concatenate([
+                _simulate_points_chunk(
+                    scores, sigmas, [(i, points_tables[name]) for i, name in events], size, chunk_seed
+                )
+                for size, chunk_seed in zip(chunk_sizes, seeds)
+            ])
+        elif use_shared_memory:
+            with F1SharedArrays(dict(points_tables, scores=scores, sigmas=sigmas)) as shared, \
+                    ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = executor.map(
+                    _simulate_points_shared,
+                    [shared.descriptor] * n_chunks, [events] * n_chunks, chunk_sizes, seeds
+                )
+                season_points = np.concatenate(list(chunks))
+        else:
+            events = [(i, points_tables[name]) for i, name in events]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = executor.map(
+                    _simulate_points_chunk,
+                    [scores] * n_chunks, [sigmas] * n_chunks, [events] * n_chunks,
+                    chunk_sizes, seeds
+                )
+                season_points = np.concatenate(list(chunks))
+
+        drivers = list(self.combined_data['DRIVER'])
+        start_points = np.array([current_points.get(driver, 0) for driver in drivers], dtype=float)
+        driver_totals = season_points + start_points
+
+        # Championship position of every driver in every simulation
+        order = np.argsort(-driver_totals, axis=1)
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(n_drivers)[None, :], axis=1)
+        position_counts = np.zeros((n_drivers, n_drivers))
+        np.add.at(position_counts, (np.broadcast_to(np.arange(n_drivers), ranks.shape), ranks), 1)
+        position_probs = position_counts / len(driver_totals)
+
+        driver_table = pd.DataFrame({
+            'DRIVER': drivers,
+            'CAR': list(self.combined_data['CAR']),
+            'current_points': start_points,
+            'expected_points': driver_totals.mean(axis=0),
+            'points_p5': np.percentile(driver_totals, 5, axis=0),
+            'points_p95': np.percentile(driver_totals, 95, axis=0),
+            'title_probability': position_probs[:, 0]
+        }).sort_values('expected_points', ascending=False).reset_index(drop=True)
+
+        # Constructors: sum both cars per simulation with one grouped reduction
+        membership, teams = self._team_membership()
+        team_start = np.array([current_team_points.get(team, 0) for team in teams], dtype=float)
+        team_totals = season_points @ membership + team_start
+        team_champion = np.bincount(np.argmax(team_totals, axis=1), minlength=len(teams))
+
+        team_table = pd.DataFrame({
+            'CAR': teams,
+            'current_points': team_start,
+            'expected_points': team_totals.mean(axis=0),
+            'points_p5': np.percentile(team_totals, 5, axis=0),
+            'points_p95': np.percentile(team_totals, 95, axis=0),
+            'title_probability': team_champion / len(team_totals)
+        }).sort_values('expected_points', ascending=False).reset_index(drop=True)
+
+        self.championship_projection = {
+            'drivers': driver_table,
+            'constructors': team_table,
+            'driver_positions': pd.DataFrame(
+                position_probs, index=drivers, columns=range(1, n_drivers + 1)
+            )
+        }
+        self._print_championship_projection()
+        return self.championship_projection
+
+    def _print_championship_projection(self):
+        """Print projected championship leaders to console"""
+        projection = self.championship_projection
+        print("\n" + "="*50)
+        print("CHAMPIONSHIP PROJECTION")
+        print("="*50)
+
+        print("\nDRIVERS:")
+        for i, (_, row) in enumerate(projection['drivers'].head(5).iterrows()):
+            print(f"{i+1}. {row['DRIVER']} - {row['expected_points']:.0f} pts "
+                  f"({row['points_p5']:.0f}-{row['points_p95']:.0f}), "
+                  f"title {row['title_probability']*100:.1f}%")
+
+        print("\nCONSTRUCTORS:")
+        for i, (_, row) in enumerate(projection['constructors'].head(5).iterrows()):
+            print(f"{i+1}. {row['CAR']} - {row['expected_points']:.0f} pts "
+                  f"({row['points_p5']:.0f}-{row['points_p95']:.0f}), "
+                  f"title {row['title_probability']*100:.1f}%")
+
     def _calculate_prediction_error(self):
         """Calculate prediction error metrics"""
         # Base position variance by track predictability
@@ -1062,9 +2892,9 @@ class F1RacePredictor:
         score_spread = self.top3_prediction['race_score'].max() - self.top3_prediction['race_score'].min()
         adjusted_variance = base_variance * weather_uncertainty * (1 + (0.5 - min(0.5, score_spread)))
         
-        # Simulate errors
-        np.random.seed(42)  # For reproducibility
-        simulated_errors = np.random.normal(0, adjusted_variance, len(self.top3_prediction))
+        # Simulate errors with a private generator (the global NumPy state is left alone)
+        rng = np.random.default_rng(self.error_seed)
+        simulated_errors = rng.normal(0, adjusted_variance, len(self.top3_prediction))
         
         # Calculate simulated positions
         simulated_positions = np.clip(
@@ -1114,179 +2944,73 @@ class F1RacePredictor:
         print(f"Prediction Confidence: {confidence:.1f}%")
         
         print("\nKEY FACTORS FOR WINNER:")
-        winner = self.top3_prediction.iloc[0]
-        
-        # Get track characteristics
-        track = self.track
-        overtaking_difficulty = track['overtaking_difficulty'] / 10
-        tire_degradation = track['tire_degradation'] / 10
-        
-        # Calculate factors based on weekend type
-        if self.is_sprint_weekend:
-            self._print_sprint_weekend_factors(winner, overtaking_difficulty, tire_degradation)
-        else:
-            self._print_regular_weekend_factors(winner, overtaking_difficulty, tire_degradation)
-    
-    def _print_regular_weekend_factors(self, winner, overtaking_difficulty, tire_degradation):
-        """Print key factors for winner in regular race weekend"""
-        # Starting position
-        position_weight = 0.30 + (0.05 * overtaking_difficulty)
-        position_weight = position_weight * (1 - (self.rain_probability * 0.3))
-        position_factor = np.exp(-0.15 * (float(winner['position']) - 1)) * position_weight
-        
-        # Qualifying pace
-        quali_weight = 0.15 - (0.05 * overtaking_difficulty)
-        quali_weight = quali_weight * (1 - (self.rain_probability * 0.3))
-        quali_factor = (1.0 if pd.isna(winner['gap_to_pole']) else 
-                       max(0.7, 1 - (winner['gap_to_pole'] * 0.5))) * quali_weight
-        
-        # Practice 2 (race pace)
-        p2_weight = 0.25 + (0.05 * tire_degradation)
-        p2_weight = p2_weight * (1 - (self.rain_probability * 0.4))
-        p2_factor = (winner['p2_score'] if 'p2_score' in winner and 
-                    not pd.isna(winner['p2_score']) else 0.75) * p2_weight
-        
-        # Practice 3
-        p3_weight = 0.10
-        p3_weight = p3_weight * (1 - (self.rain_probability * 0.4))
-        p3_factor = (winner['p3_score'] if 'p3_score' in winner and 
-                    not pd.isna(winner['p3_score']) else 0.75) * p3_weight
-        
-        # Team race pace
-        team_weight = 0.10 * (1 - (self.rain_probability * 0.2))
-        team_factor = winner['race_pace_factor'] * team_weight
-        
-        # Tire management
-        tire_weight = (0.10 + (0.05 * tire_degradation)) * (1 + (self.rain_probability * 0.2))
-        tire_factor = (winner['tire_mgmt'] / 10) * tire_weight
-        
-        # Driver experience
-        exp_weight = (0.10 + (0.02 * tire_degradation)) * (1 + (self.rain_probability * 0.3))
-        exp_factor = winner['driver_experience'] * exp_weight
-        
-        # Wet performance factors
-        wet_driver_factor = 0
-        wet_team_factor = 0
-        
-        if self.rain_probability > 0:
-            # Driver wet weather skill
-            wet_driver_weight = 0.35 * self.rain_probability
-            wet_driver_factor = (winner['driver_wet_performance'] / 10) * wet_driver_weight
-            
-            # Team wet weather performance
-            wet_team_weight = 0.25 * self.rain_probability
-            wet_team_factor = (winner['wet_performance'] / 10) * wet_team_weight
-        
-        # Calculate total and normalize percentages
-        total = (position_factor + quali_factor + p2_factor + p3_factor + 
-                team_factor + tire_factor + exp_factor + wet_driver_factor + wet_team_factor)
-        
-        # Print factor percentages in the format shown in the example
-        print(f"Starting position: {(position_factor / total * 100):.1f}%")
-        print(f"Qualifying pace: {(quali_factor / total * 100):.1f}%")
-        print(f"Practice 2 (race pace): {(p2_factor / total * 100):.1f}%")
-        print(f"Practice 3: {(p3_factor / total * 100):.1f}%")
-        print(f"Team race pace: {(team_factor / total * 100):.1f}%")
-        print(f"Tire management: {(tire_factor / total * 100):.1f}%")
-        print(f"Driver experience: {(exp_factor / total * 100):.1f}%")
-        
-        # Only show wet factors if rain probability > 0
-        if self.rain_probability > 0:
-            print(f"Driver wet weather skill: {(wet_driver_factor / total * 100):.1f}%")
-            print(f"Team wet weather performance: {(wet_team_factor / total * 100):.1f}%")
+        self._print_factor_shares(self.top3_prediction.iloc[0]['DRIVER'])
     
-    def _print_sprint_weekend_factors(self, winner, overtaking_difficulty, tire_degradation):
-        """Print key factors for winner in sprint race weekend"""
-        # Starting position
-        position_weight = 0.25 + (0.05 * overtaking_difficulty)
-        position_weight = position_weight * (1 - (self.rain_probability * 0.3))
-        position_factor = np.exp(-0.15 * (float(winner['position']) - 1)) * position_weight
-        
-        # Qualifying pace
-        quali_weight = 0.15 - (0.05 * overtaking_difficulty)
-        quali_weight = quali_weight * (1 - (self.rain_probability * 0.3))
-        quali_factor = (1.0 if pd.isna(winner['gap_to_pole']) else 
-                       max(0.7, 1 - (winner['gap_to_pole'] * 0.5))) * quali_weight
-        
-        # Sprint race performance
-        sprint_weight = 0.20 * (1 - (self.rain_probability * 0.2))
-        sprint_position_factor = (winner['sprint_position_score'] if 'sprint_position_score' in winner and 
-                                 not pd.isna(winner['sprint_position_score']) else 0.75) * sprint_weight
-        
-        # Practice 1
-        p1_weight = 0.10 * (1 - (self.rain_probability * 0.4))
-        p1_factor = (winner['p1_score'] if 'p1_score' in winner and 
-                    not pd.isna(winner['p1_score']) else 0.75) * p1_weight
-        
-        # Team race pace
-        team_weight = 0.10 * (1 - (self.rain_probability * 0.2))
-        team_factor = winner['race_pace_factor'] * team_weight
+    def _print_factor_shares(self, driver):
+        """Print each factor's share of a driver's race score from the last prediction"""
+        contributions = self.factor_contributions.loc[[driver]].iloc[0]
+        total = contributions.sum()
+        show_wet = self.rain_probability > 0 or self.weather_forecast is not None
         
-        # Tire management
-        tire_weight = (0.10 + (0.05 * tire_degradation)) * (1 + (self.rain_probability * 0.2))
-        tire_factor = (winner['tire_mgmt'] / 10) * tire_weight
-        
-        # Driver sprint performance
-        driver_sprint_weight = 0.15 * (1 + (self.rain_probability * 0.1))
-        driver_sprint_factor = (winner['driver_sprint_performance'] / 10) * driver_sprint_weight
-        
-        # Team sprint performance
-        team_sprint_weight = 0.05
-        team_sprint_factor = (winner['sprint_performance'] / 10) * team_sprint_weight
-        
-        # Wet performance factors
-        wet_driver_factor = 0
-        wet_team_factor = 0
-        
-        if self.rain_probability > 0:
-            # Driver wet weather skill
-            wet_driver_weight = 0.35 * self.rain_probability
-            wet_driver_factor = (winner['driver_wet_performance'] / 10) * wet_driver_weight
-            
-            # Team wet weather performance
-            wet_team_weight = 0.25 * self.rain_probability
-            wet_team_factor = (winner['wet_performance'] / 10) * wet_team_weight
-        
-        # Calculate total and normalize percentages
-        total = (position_factor + quali_factor + sprint_position_factor + p1_factor + 
-                team_factor + tire_factor + driver_sprint_factor + team_sprint_factor + 
-                wet_driver_factor + wet_team_factor)
-        
-        # Print factor percentages in the format shown in the example
-        print(f"Starting position: {(position_factor / total * 100):.1f}%")
-        print(f"Qualifying pace: {(quali_factor / total * 100):.1f}%")
-        print(f"Sprint race performance: {(sprint_position_factor / total * 100):.1f}%")
-        print(f"Practice 1: {(p1_factor / total * 100):.1f}%")
-        print(f"Team race pace: {(team_factor / total * 100):.1f}%")
-        print(f"Tire management: {(tire_factor / total * 100):.1f}%")
-        print(f"Driver sprint ability: {(driver_sprint_factor / total * 100):.1f}%")
-        print(f"Team sprint setup: {(team_sprint_factor / total * 100):.1f}%")
-        
-        # Only show wet factors if rain probability > 0
-        if self.rain_probability > 0:
-            print(f"Driver wet weather skill: {(wet_driver_factor / total * 100):.1f}%")
-            print(f"Team wet weather performance: {(wet_team_factor / total * 100):.1f}%")
+        for factor, value in contributions.items():
+            # Only show wet factors if rain is possible
+            if factor in ('wet_driver', 'wet_team') and not show_wet:
+                continue
+            print(f"{self.factor_labels[factor]}: {(value / total * 100):.1f}%")
             
-    def _parse_race_time(self, time_str):
+    def _parse_race_time(self, time_str, leader_time=None, leader_laps=None):
         """
         Parse race time string, handling various formats including:
-        - '1:23.456'
-        - '+12.345'
+        - '1:23.456' or '1:02:03.456'
+        - '+12.345' (needs leader_time) and '+1 Lap' (needs leader_time and leader_laps)
         - 'DNF', 'DNS', etc.
         """
         if pd.isna(time_str) or not isinstance(time_str, str):
             return None
-        
-        # Handle DNF, DNS, etc.
-        if any(x in time_str.upper() for x in ['DNF', 'DNS', 'DSQ', 'NC', 'DQ', 'RETIRED']):
-            return None
-            
-        # Remove leading '+' for gap times
-        if time_str.startswith('+'):
-            return None  # We can't use gap times directly
-            
-        # Try standard time format
-        return self._time_to_seconds(time_str)
+        seconds = self._race_times(pd.Series([time_str]), leader_time=leader_time,
+                                   leader_laps=leader_laps)[0]
+        return None if np.isnan(seconds) else float(seconds)
+
+    def _race_times(self, times, laps=None, leader_time=None, leader_laps=None, positions=None):
+        """
+        Absolute race times in seconds for a whole classification at once
+        Absolute times need a clock format ('30:12.345', '1:02:03.456'); the leader's is
+        taken from position 1 when positions are given, else the fastest one.
+        '+12.345s' gaps (also without the '+') are added to it and '+1 Lap' entries get
+        the leader's average lap time per lap down (from the laps column).
+        DNF/DNS and the like become NaN
+        """
+        text = times.astype('string').str.strip()
+
+        # Absolute times: [h:]mm:ss.sss
+        absolute = text.str.extract(r'^(?:(\d+):)?(\d+):(\d+(?:\.\d+)?)$')
+        absolute = absolute.apply(pd.to_numeric, errors='coerce')
+        absolute_seconds = absolute[0].fillna(0) * 3600 + absolute[1] * 60 + absolute[2]
+
+        # Gaps to the leader: +12.345s, 12.345s or +1:02.345
+        gap = text.str.extract(r'^(?:\+\s*(\d+):|\+?\s*)(\d+(?:\.\d+)?)\s*s?$', flags=re.IGNORECASE)
+        gap = gap.apply(pd.to_numeric, errors='coerce')
+        gap_seconds = gap[0].fillna(0) * 60 + gap[1]
+        laps_down = pd.to_numeric(
+            text.str.extract(r'^\+?\s*(\d+)\s*laps?$', flags=re.IGNORECASE)[0], errors='coerce'
+        )
+
+        if leader_time is None and absolute_seconds.notna().any():
+            leader_idx = absolute_seconds.idxmin()
+            if positions is not None:
+                winners = absolute_seconds[pd.Series(np.asarray(positions), index=times.index) == 1].dropna()
+                if not winners.empty:
+                    leader_idx = winners.index[0]
+            leader_time = absolute_seconds[leader_idx]
+            if leader_laps is None and laps is not None:
+                leader_laps = pd.to_numeric(pd.Series(laps, index=times.index), errors='coerce')[leader_idx]
+        if leader_time is None or pd.isna(leader_time):
+            return absolute_seconds.to_numpy(dtype=float)
+
+        result = absolute_seconds.fillna(leader_time + gap_seconds)
+        if leader_laps is not None and not pd.isna(leader_laps) and leader_laps > 0:
+            result = result.fillna(leader_time + laps_down * (leader_time / leader_laps))
+        return result.to_numpy(dtype=float)
     
     def _time_to_seconds(self, time_str):
         """
@@ -1294,6 +3018,7 @@ class F1RacePredictor:
         - '1:23.456' (minutes:seconds.milliseconds)
         - '83.456' (seconds.milliseconds)
         - '1m23.456s' (alternative format)
+        - '0 days 00:01:23.456' and '1:01:23.456' (timedelta / hours)
         """
         if pd.isna(time_str) or not isinstance(time_str, str):
             return None
@@ -1317,6 +3042,9 @@ class F1RacePredictor:
                     minutes = int(parts[0])
                     seconds = float(parts[1])
                     return minutes * 60 + seconds
+                # Format: 0 days 00:01:23.456 (exported timedelta) or 1:01:23.456
+                if len(parts) == 3:
+                    return pd.to_timedelta(time_str).total_seconds()
                     
             # Format: 1m23.456s
             elif 'm' in time_str and 's' in time_str:
@@ -1338,24 +3066,26 @@ class F1RacePredictor:
             print(f"Error converting time '{time_str}': {e}")
             return None
     
-    def _safe_convert_position(self, pos):
+    def _safe_convert_position(self, pos, unclassified=20):
         """
         Safely convert position to number, handling:
         - DNS, DNF, DSQ, etc.
         - P1, P2, etc. format
         - 1st, 2nd, etc. format
+        Missing and non-classified positions become unclassified (back of the grid
+        by default; results pass NaN)
         """
         if isinstance(pos, (int, float)):
             return pos
         
         if not isinstance(pos, str):
-            return 20  # Default to back of grid for None, etc.
+            return unclassified  # Default to back of grid for None, etc.
             
         pos = pos.strip()
             
         # Handle empty strings
         if pos == '' or pos == '-':
-            return 20
+            return unclassified
             
         # Handle 'P1', 'P2', etc.
         if pos.startswith('P') and len(pos) > 1 and pos[1:].isdigit():
@@ -1370,7 +3100,7 @@ class F1RacePredictor:
         except:
             # Handle DNS, DNF, etc.
             if any(x in pos.upper() for x in ['DNS', 'DNF', 'DSQ', 'NC', 'DQ', 'RETIRED']):
-                return 20  # Back of the grid
+                return unclassified  # Back of the grid
             
             # Try to extract digits if mixed format
             digits = ''.join(c for c in pos if c.isdigit())
@@ -1380,15 +3110,18 @@ class F1RacePredictor:
                 except:
                     pass
                     
-            return 20  # Default to back of grid
+            return unclassified  # Default to back of grid
     
     def _calculate_regular_weekend_performance(self, data):
         """Calculate performance metrics from practice sessions for regular race weekend"""
-        # FP2 performance (race pace)
-        valid_p2_times = data['p2_seconds'].dropna()
+        # FP2 performance (race pace), from long runs when lap-level data was loaded
+        p2_col = 'p2_seconds'
+        if 'p2_longrun_seconds' in data.columns and data['p2_longrun_seconds'].notna().any():
+            p2_col = 'p2_longrun_seconds'
+        valid_p2_times = data[p2_col].dropna()
         if len(valid_p2_times) > 0:
             best_p2_time = valid_p2_times.min()
-            data['p2_gap'] = data['p2_seconds'].apply(
+            data['p2_gap'] = data[p2_col].apply(
                 lambda x: x - best_p2_time if not pd.isna(x) else None
             )
             data['p2_score'] = data['p2_gap'].apply(
@@ -1397,11 +3130,15 @@ class F1RacePredictor:
         else:
             data['p2_score'] = 0.75
         
-        # FP3 performance (qualifying simulation)
-        valid_p3_times = data['p3_seconds'].dropna()
+        # FP3 performance (qualifying simulation), blended with the ideal lap when available
+        p3_times = data['p3_seconds']
+        if 'p3_ideal_seconds' in data.columns:
+            p3_times = self._blend_ideal(pd.to_numeric(p3_times, errors='coerce'),
+                                         pd.to_numeric(data['p3_ideal_seconds'], errors='coerce'))
+        valid_p3_times = p3_times.dropna()
         if len(valid_p3_times) > 0:
             best_p3_time = valid_p3_times.min()
-            data['p3_gap'] = data['p3_seconds'].apply(
+            data['p3_gap'] = p3_times.apply(
                 lambda x: x - best_p3_time if not pd.isna(x) else None
             )
             data['p3_score'] = data['p3_gap'].apply(
@@ -1412,11 +3149,14 @@ class F1RacePredictor:
     
     def _calculate_sprint_weekend_performance(self, data):
         """Calculate performance metrics for sprint race weekend"""
-        # FP1 performance (only practice session in sprint weekend)
-        valid_p1_times = data['p1_seconds'].dropna()
+        # FP1 performance (only practice session in sprint weekend), from long runs when available
+        p1_col = 'p1_seconds'
+        if 'p1_longrun_seconds' in data.columns and data['p1_longrun_seconds'].notna().any():
+            p1_col = 'p1_longrun_seconds'
+        valid_p1_times = data[p1_col].dropna()
         if len(valid_p1_times) > 0:
             best_p1_time = valid_p1_times.min()
-            data['p1_gap'] = data['p1_seconds'].apply(
+            data['p1_gap'] = data[p1_col].apply(
                 lambda x: x - best_p1_time if not pd.isna(x) else None
             )
             data['p1_score'] = data['p1_gap'].apply(
@@ -1433,13 +3173,25 @@ class F1RacePredictor:
             )
         else:
             data['sprint_position_score'] = 0.7
+        
+        # Sprint pace: deficit to the winner's race time, averaged with the position score
+        if 'sprint_time_seconds' in data.columns and data['sprint_time_seconds'].notna().sum() > 1:
+            sprint_times = pd.to_numeric(data['sprint_time_seconds'], errors='coerce')
+            deficit = (sprint_times - sprint_times.min()) / sprint_times.min()
+            data['sprint_pace_score'] = (1 - deficit * 20).clip(lower=0.6)
+            data['sprint_position_score'] = np.where(
+                data['sprint_pace_score'].notna(),
+                (data['sprint_position_score'] + data['sprint_pace_score']) / 2,
+                data['sprint_position_score']
+            )
     
     def _add_characteristics(self, data):
         """Add team and driver characteristics"""
-        # Add team characteristics
-        for team, chars in self.team_characteristics.items():
-            for char, value in chars.items():
-                data.loc[data['CAR'] == team, char] = value
+        # Add team characteristics, one lookup per characteristic
+        teams = pd.DataFrame.from_dict(self.team_characteristics, orient='index')
+        cars = data['CAR'].astype(object)
+        for char in teams.columns:
+            data[char] = cars.map(teams[char]).astype(float)
         
         # Fill missing values with defaults
         data['race_pace_factor'] = data['race_pace_factor'].fillna(1.0)
@@ -1449,29 +3201,786 @@ class F1RacePredictor:
         data['sprint_performance'] = data['sprint_performance'].fillna(7.5)
         
         # Add driver experience
-        data['driver_experience'] = data['DRIVER'].map(self.driver_experience).fillna(0.85)
+        drivers = data['DRIVER'].astype(object)
+        data['driver_experience'] = drivers.map(self.driver_experience).astype(float).fillna(0.85)
         
         # Add driver wet weather performance
-        data['driver_wet_performance'] = data['DRIVER'].map(self.driver_wet_performance).fillna(7.5)
+        data['driver_wet_performance'] = drivers.map(self.driver_wet_performance).astype(float).fillna(7.5)
         
         # Add driver sprint performance
-        data['driver_sprint_performance'] = data['DRIVER'].map(self.driver_sprint_performance).fillna(7.5)
+        data['driver_sprint_performance'] = drivers.map(self.driver_sprint_performance).astype(float).fillna(7.5)
     
+class F1SessionArchive:
+    """
+    Columnar on-disk archive of normalized session data, one partition per weekend
+    Drivers and teams are dictionary-encoded as integers shared by the whole archive,
+    numeric columns are stored as float32 arrays and read back with memory mapping
+    """
+
+    def __init__(self, archive_dir):
+        """Open (or create) an archive directory"""
+        self.archive_dir = archive_dir
+        os.makedirs(archive_dir, exist_ok=True)
+        self.index_path = os.path.join(archive_dir, "archive.json")
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        else:
+            index = {"drivers": [], "teams": [], "weekends": {}}
+
+        self.drivers = index["drivers"]
+        self.teams = index["teams"]
+        self.weekends = index["weekends"]
+        self._driver_codes = {name: code for code, name in enumerate(self.drivers)}
+        self._team_codes = {name: code for code, name in enumerate(self.teams)}
+
+    def _save_index(self):
+        """Write the dictionaries and partition list atomically"""
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"drivers": self.drivers, "teams": self.teams, "weekends": self.weekends}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _encode(self, values, names, codes):
+        """Dictionary-encode names, extending the shared dictionary with unseen ones"""
+        encoded = np.empty(len(values), dtype=np.int16)
+        for i, value in enumerate(values):
+            value = str(value)
+            if value not in codes:
+                codes[value] = len(names)
+                names.append(value)
+            encoded[i] = codes[value]
+        return encoded
+
+    def write_weekend(self, weekend, data, race_name=None):
+        """
+        Store one weekend of normalized session data (e.g. F1RacePredictor.combined_data)
+        DRIVER/CAR become int16 codes, every numeric column becomes a float32 column
+        """
+        partition = os.path.join(self.archive_dir, weekend)
+        tmp_partition = partition + ".tmp"
+        if os.path.exists(tmp_partition):
+            shutil.rmtree(tmp_partition)
+        os.makedirs(tmp_partition)
+
+        columns = []
+        np.save(os.path.join(tmp_partition, "DRIVER.npy"),
+                self._encode(data["DRIVER"], self.drivers, self._driver_codes))
+        columns.append("DRIVER")
+        if "CAR" in data.columns:
+            np.save(os.path.join(tmp_partition, "CAR.npy"),
+                    self._encode(data["CAR"], self.teams, self._team_codes))
+            columns.append("CAR")
+
+        for col in data.columns:
+            if col in ("DRIVER", "CAR") or not pd.api.types.is_numeric_dtype(data[col]):
+                continue
+            values = pd.to_numeric(data[col], errors="coerce").to_numpy(dtype=np.float32)
+            np.save(os.path.join(tmp_partition, f"{col}.npy"), values)
+            columns.append(col)
+
+        # Swap the finished partition in so readers never see a half-written weekend
+        if os.path.exists(partition):
+            shutil.rmtree(partition)
+        os.replace(tmp_partition, partition)
+
+        self.weekends[weekend] = {
+            "race": race_name,
+            "rows": len(data),
+            "columns": columns
+        }
+        self._save_index()
+
+    def list_weekends(self, race_name=None):
+        """List archived weekends in insertion order, optionally for one race"""
+        return [weekend for weekend, info in self.weekends.items()
+                if race_name is None or info["race"] == race_name]
+
+    def read_weekend(self, weekend, columns=None):
+        """
+        Return a dict of memory-mapped column arrays for one weekend
+        Arrays are read-only views onto the files, nothing is parsed or copied
+        """
+        if weekend not in self.weekends:
+            raise KeyError(f"Weekend not in archive: {weekend}")
+
+        info = self.weekends[weekend]
+        partition = os.path.join(self.archive_dir, weekend)
+        if columns is None:
+            columns = info["columns"]
+
+        arrays = {}
+        for col in columns:
+            if col not in info["columns"]:
+                continue
+            arrays[col] = np.load(os.path.join(partition, f"{col}.npy"), mmap_mode="r")
+        return arrays
+
+    def scan(self, columns, race_name=None):
+        """Iterate (weekend, arrays) over every archived weekend without parsing any text"""
+        for weekend in self.list_weekends(race_name):
+            yield weekend, self.read_weekend(weekend, columns)
+
+    def to_frame(self, weekend, columns=None):
+        """Decode one weekend into a DataFrame with categorical DRIVER/CAR columns"""
+        arrays = self.read_weekend(weekend, columns)
+        frame = {}
+        for col, values in arrays.items():
+            if col == "DRIVER":
+                frame[col] = pd.Categorical.from_codes(values, categories=self.drivers)
+            elif col == "CAR":
+                frame[col] = pd.Categorical.from_codes(values, categories=self.teams)
+            else:
+                frame[col] = values
+        return pd.DataFrame(frame)
+
+
+class F1PredictionCache:
+    """
+    LRU memoization of prediction results with an optional persistent tier
+    Keys are built by F1RacePredictor.predict_cached; values are pickled to
+    persist_dir when it is given, so results survive restarts
+    """
+
+    def __init__(self, max_entries=256, persist_dir=None, rain_step=0.01):
+        """Create a cache holding up to max_entries results in memory"""
+        self.max_entries = max_entries
+        self.persist_dir = persist_dir
+        self.rain_step = rain_step
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+
+    def quantize_rain(self, rain_probability):
+        """Round a rain probability to the cache's step so nearby requests share results"""
+        steps = round(rain_probability / self.rain_step)
+        return round(steps * self.rain_step, 6)
+
+    def _persist_path(self, key):
+        """File holding the persisted result for a key"""
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.persist_dir, f"{digest}.pkl")
+
+    def get(self, key):
+        """Return the cached result for key, or None on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        if self.persist_dir:
+            path = self._persist_path(key)
+            if os.path.exists(path):
+                try:
+                    with open(path, "rb") as f:
+                        value = pickle.load(f)
+                except Exception as e:
+                    print(f"Warning: Could not read cached result {path}: {e}")
+                else:
+                    with self._lock:
+                        self.persistent_hits += 1
+                        self._store(key, value)
+                    return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """Store a result in memory and, if enabled, on disk"""
+        with self._lock:
+            self._store(key, value)
+
+        if self.persist_dir:
+            path = self._persist_path(key)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f)
+            os.replace(tmp_path, path)
+
+    def _store(self, key, value):
+        """Insert into the in-memory tier, evicting the least recently used entry"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop the in-memory tier and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.persistent_hits = self.misses = 0
+
+    def stats(self):
+        """Hit/miss statistics"""
+        with self._lock:
+            lookups = self.hits + self.persistent_hits + self.misses
+            return {
+                "hits": self.hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.persistent_hits) / lookups if lookups else 0.0,
+                "entries": len(self._entries)
+            }
+
+
+class F1FormTracker:
+    """
+    Exponentially weighted driver form ratings updated one result at a time
+    Each result moves a driver's rating a fraction alpha towards the rating implied
+    by their finishing position, so an update is O(drivers) and the full history is
+    never re-read. Ratings and the fingerprints of applied files are kept in a small
+    JSON state file
+    """
+
+    # Rating scales: the range a last-to-first result maps onto
+    scales = {
+        'experience': (0.80, 1.00),
+        'wet': (7.0, 10.0),
+        'sprint': (7.0, 10.0)
+    }
+
+    # Fingerprints of applied result files kept to reject duplicates (newest last)
+    max_applied = 500
+
+    # Predictor attribute and default value behind each rating
+    sources = {
+        'experience': ('driver_experience', 0.85),
+        'wet': ('driver_wet_performance', 7.5),
+        'sprint': ('driver_sprint_performance', 7.5)
+    }
+
+    def __init__(self, state_path, alpha=0.15):
+        """Open the form state at state_path (empty when the file does not exist)"""
+        self.state_path = state_path
+        self.alpha = alpha
+        self.ratings = {rating: {} for rating in self.scales}
+        self.applied = []
+        self.results = 0
+
+        if state_path and os.path.exists(state_path):
+            with open(state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            self.alpha = state.get("alpha", alpha)
+            self.ratings.update(state.get("ratings", {}))
+            self.applied = state.get("applied", [])
+            self.results = state.get("results", 0)
+
+    def has_applied(self, fingerprint):
+        """Whether a result file with this fingerprint was already counted"""
+        return fingerprint is not None and fingerprint in self.applied
+
+    def update(self, drivers, positions, predictor, session='race', wet=False, fingerprint=None):
+        """
+        Move the ratings of every classified driver towards their result
+        Drivers without a rating yet start from the predictor's static value;
+        unclassified drivers (no position) are left unchanged
+        Returns the number of drivers updated
+        """
+        positions = pd.to_numeric(pd.Series(list(positions)), errors='coerce').to_numpy(dtype=float)
+        classified = ~np.isnan(positions)
+        n_classified = classified.sum()
+        if n_classified == 0:
+            return 0
+
+        # Finishing position as a 0 (last classified) to 1 (winner) performance
+        ranks = pd.Series(positions).rank(method='first').to_numpy()
+        performance = 1 - (ranks - 1) / max(1, n_classified - 1)
+
+        moved = ['experience']
+        if wet:
+            moved.append('wet')
+        if session == 'sprint':
+            moved.append('sprint')
+
+        for driver, ok, perf in zip(drivers, classified, performance):
+            if not ok or pd.isna(driver):
+                continue
+            for rating in moved:
+                low, high = self.scales[rating]
+                attribute, default = self.sources[rating]
+                table = self.ratings[rating]
+                current = table.get(driver, getattr(predictor, attribute).get(driver, default))
+                table[driver] = round(current + self.alpha * (low + perf * (high - low) - current), 4)
+
+        if fingerprint is not None:
+            self.applied.append(fingerprint)
+            del self.applied[:-self.max_applied]
+        self.results += 1
+        return int(n_classified)
+
+    def apply(self, predictor):
+        """Write the current ratings into the predictor's driver rating tables"""
+        for rating, (attribute, _) in self.sources.items():
+            getattr(predictor, attribute).update(self.ratings[rating])
+
+    def save(self):
+        """Write the state file atomically, creating its directory if needed"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "alpha": self.alpha,
+                "results": self.results,
+                "ratings": self.ratings,
+                "applied": self.applied
+            }, f, separators=(",", ":"))
+        os.replace(tmp_path, self.state_path)
+
+
+class F1LiveTiming:
+    """
+    Running podium prediction from a stream of timing messages
+    Messages are JSON objects, one per line, from a replay file or a local socket:
+      {"type": "start", "laps": 57}
+      {"type": "position", "driver": "...", "position": 3, "gap": 4.2}
+      {"type": "gap", "driver": "...", "gap": 4.2}
+      {"type": "pit", "driver": "..."}
+      {"type": "retired", "driver": "..."}
+      {"type": "lap", "lap": 12}
+    Each message updates one driver's state in O(1); the podium is recomputed
+    once per completed lap. Pre-race scores come from the same factors and weights
+    as predict_top3, and the live position and gap (allowing for pit stops still
+    to come) take over from grid position and qualifying pace as the race goes on
+    """
+
+    def __init__(self, predictor, race_laps=60, pit_loss=20.0, gap_scale=0.01):
+        """Take the pre-race state of the predictor's loaded weekend"""
+        if predictor.combined_data is None:
+            raise ValueError("No data loaded. Please load data first.")
+        data = predictor.combined_data
+        factor_names = predictor.sprint_factors if predictor.is_sprint_weekend else predictor.regular_factors
+        factors = predictor._factor_matrix()
+        weights = predictor._race_weights()
+
+        self.predictor = predictor
+        self.drivers = list(data['DRIVER'])
+        self._driver_index = {driver: i for i, driver in enumerate(self.drivers)}
+        self._name_cache = {}
+        self.race_laps = race_laps
+        self.pit_loss = pit_loss
+        self.gap_scale = gap_scale
+
+        self.base_score = factors @ weights
+        self._position_weight = weights[factor_names.index('position')]
+        self._gap_weight = weights[factor_names.index('quali')]
+        self._grid_factor = factors[:, factor_names.index('position')]
+        self._quali_factor = factors[:, factor_names.index('quali')]
+
+        # One slot per driver, updated in place message by message
+        n_drivers = len(self.drivers)
+        self.position = pd.to_numeric(data['position'], errors='coerce').to_numpy(dtype=float)
+        self.position = np.where(np.isnan(self.position), 20.0, self.position)
+        self.gap = np.zeros(n_drivers)
+        self.pit_stops = np.zeros(n_drivers, dtype=int)
+        self.retired = np.zeros(n_drivers, dtype=bool)
+        self.expected_stops = 2 if predictor.track.get('tire_degradation', 5) >= 7 else 1
+        self._delta = np.zeros(n_drivers)  # Live score change relative to the pre-race score
+
+        self.lap = 0
+        self.messages = 0
+        self.history = []
+        for i in range(n_drivers):
+            self._update_driver(i)
+
+    def _driver(self, name):
+        """Index of a driver in the loaded grid (None for unknown drivers)"""
+        if name not in self._name_cache:
+            self._name_cache[name] = self._driver_index.get(self.predictor._standardize_driver_name(name))
+        return self._name_cache[name]
+
+    def _update_driver(self, i):
+        """Recompute one driver's live score change from their current position and gap"""
+        position_factor = np.exp(-0.15 * (self.position[i] - 1))
+        pending_stops = max(0, self.expected_stops - self.pit_stops[i])
+        gap = self.gap[i] + self.pit_loss * pending_stops
+        gap_factor = max(0.7, 1 - (gap * self.gap_scale))
+        self._delta[i] = (self._position_weight * (position_factor - self._grid_factor[i]) +
+                          self._gap_weight * (gap_factor - self._quali_factor[i]))
+
+    def process(self, message):
+        """
+        Apply one timing message
+        Returns the podium after a completed lap, None otherwise
+        """
+        self.messages += 1
+        kind = message.get('type')
+        if kind == 'lap':
+            self.lap = int(message['lap'])
+            podium = self.podium()
+            self.history.append((self.lap, podium))
+            return podium
+        if kind == 'start':
+            self.race_laps = int(message.get('laps', self.race_laps))
+            return None
+
+        i = self._driver(message.get('driver'))
+        if i is None:
+            return None
+        if kind == 'position':
+            self.position[i] = float(message['position'])
+            if 'gap' in message:
+                self.gap[i] = float(message['gap'])
+        elif kind == 'gap':
+            self.gap[i] = float(message['gap'])
+        elif kind == 'pit':
+            self.pit_stops[i] += 1
+        elif kind == 'retired':
+            self.retired[i] = True
+        self._update_driver(i)
+        return None
+
+    def scores(self):
+        """Current race scores: the live changes weigh in with race progress"""
+        progress = min(1.0, self.lap / self.race_laps) if self.race_laps else 0.0
+        scores = self.base_score + progress * self._delta
+        return np.where(self.retired, -np.inf, scores)
+
+    def podium(self):
+        """Predicted top 3 as a list of (driver, score); shorter when fewer drivers are loaded"""
+        scores = self.scores()
+        if len(scores) == 0:
+            return []
+        top3 = np.argpartition(-scores, min(2, len(scores) - 1))[:3]
+        top3 = top3[np.argsort(-scores[top3])]
+        return [(self.drivers[i], float(scores[i])) for i in top3]
+
+    def _consume(self, lines, speed=None, on_lap=None):
+        """
+        Process a stream of JSON lines; with speed, messages carrying a time 't'
+        (seconds) are paced at that multiple of real time
+        """
+        started = time.monotonic()
+        first_time = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Warning: Skipping malformed timing message: {line[:80]}")
+                continue
+
+            if speed and 't' in message:
+                if first_time is None:
+                    first_time = message['t']
+                wait = (message['t'] - first_time) / speed - (time.monotonic() - started)
+                if wait > 0:
+                    time.sleep(wait)
+
+            podium = self.process(message)
+            if podium is not None:
+                if on_lap is not None:
+                    on_lap(self.lap, podium)
+                else:
+                    print(f"Lap {self.lap}: " + ", ".join(
+                        f"{i+1}. {driver}" for i, (driver, _) in enumerate(podium)))
+        return self.podium()
+
+    def replay(self, replay_path, speed=None, on_lap=None):
+        """Replay a recorded feed file (as fast as possible unless speed is given)"""
+        with open(replay_path, encoding='utf-8') as f:
+            return self._consume(f, speed, on_lap)
+
+    def listen(self, host='127.0.0.1', port=9999, on_lap=None):
+        """Consume a live feed from a local socket until the sender closes it"""
+        with socket.create_connection((host, port)) as connection:
+            with connection.makefile('r', encoding='utf-8') as stream:
+                return self._consume(stream, None, on_lap)
+
+
+class F1ResultsStore:
+    """
+    SQLite store of predictions: one row per prediction and one per driver with the
+    full predicted order, race score, podium probability and per-factor scores
+    Indexed on race, driver and date so reporting queries stay fast over many runs;
+    bulk loads go through a single transaction
+    """
+
+    schema = [
+        """CREATE TABLE IF NOT EXISTS predictions (
+            id INTEGER PRIMARY KEY,
+            race TEXT NOT NULL,
+            race_date TEXT,
+            created_at TEXT NOT NULL,
+            rain_probability REAL NOT NULL,
+            is_sprint INTEGER NOT NULL,
+            reference_version TEXT,
+            input_hash TEXT,
+            source TEXT,
+            mse REAL,
+            rmse REAL
+        )""",
+        """CREATE TABLE IF NOT EXISTS prediction_drivers (
+            prediction_id INTEGER NOT NULL REFERENCES predictions(id) ON DELETE CASCADE,
+            driver TEXT NOT NULL,
+            team TEXT,
+            predicted_position INTEGER NOT NULL,
+            race_score REAL,
+            podium_probability REAL,
+            factor_scores TEXT
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_predictions_race ON predictions (race, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_predictions_created ON predictions (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_predictions_race_date ON predictions (race_date)",
+        "CREATE INDEX IF NOT EXISTS idx_drivers_driver ON prediction_drivers (driver, prediction_id)",
+        "CREATE INDEX IF NOT EXISTS idx_drivers_prediction ON prediction_drivers (prediction_id)"
+    ]
+
+    def __init__(self, db_path):
+        """Open (or create) the database at db_path"""
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        with self.connection:
+            for statement in self.schema:
+                self.connection.execute(statement)
+
+    def _weekend_record(self, predictor, data, race_name, rain_probability, is_sprint,
+                        input_hash=None, source=None, race_date=None, contributions=None,
+                        metrics=(None, None)):
+        """
+        Build the rows for one scored weekend
+        Every driver gets the contribution of each factor to their score and the podium
+        probability the predictor reports (closed form, no sampling). contributions (a drivers x factors DataFrame,
+        as kept by predict_top3) are stored as given; without them the weekend is scored
+        with the heuristic weights. metrics is the (mse, rmse) of the prediction, if any
+        """
+        if contributions is None:
+            track = predictor._track_for(race_name)
+            weights = predictor._race_weights(race_name, rain_probability, track, is_sprint)
+            contributions = pd.DataFrame(
+                predictor._factor_contributions(weights, data, is_sprint),
+                columns=predictor.sprint_factors if is_sprint else predictor.regular_factors
+            )
+        factor_names = list(contributions.columns)
+        contributions = contributions.to_numpy(dtype=float)
+        scores = contributions.sum(axis=1)
+
+        podium = predictor._podium_probabilities(scores, rain_probability)
+
+        order = np.argsort(-scores, kind='stable')
+        drivers = data['DRIVER'].astype(object).to_numpy()
+        teams = data['CAR'].astype(object).to_numpy() if 'CAR' in data.columns else [None] * len(data)
+        rows = [
+            (str(drivers[i]), None if teams[i] is None else str(teams[i]), rank + 1,
+             float(scores[i]), float(podium[i]),
+             json.dumps(dict(zip(factor_names, np.round(contributions[i], 6).tolist()))))
+            for rank, i in enumerate(order)
+        ]
+        return {
+            'race': race_name,
+            'race_date': race_date,
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'rain_probability': float(rain_probability),
+            'is_sprint': int(bool(is_sprint)),
+            'reference_version': predictor.reference_version(),
+            'input_hash': input_hash,
+            'source': source,
+            'mse': None if metrics[0] is None else float(metrics[0]),
+            'rmse': None if metrics[1] is None else float(metrics[1]),
+            'drivers': rows
+        }
+
+    def _insert(self, record):
+        """Insert one record inside the caller's transaction"""
+        cursor = self.connection.execute(
+            "INSERT INTO predictions (race, race_date, created_at, rain_probability, is_sprint, "
+            "reference_version, input_hash, source, mse, rmse) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (record['race'], record['race_date'], record['created_at'], record['rain_probability'],
+             record['is_sprint'], record['reference_version'], record['input_hash'],
+             record['source'], record['mse'], record['rmse'])
+        )
+        prediction_id = cursor.lastrowid
+        self.connection.executemany(
+            "INSERT INTO prediction_drivers (prediction_id, driver, team, predicted_position, "
+            "race_score, podium_probability, factor_scores) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(prediction_id,) + row for row in record['drivers']]
+        )
+        return prediction_id
+
+    def record(self, predictor, race_date=None):
+        """
+        Store the predictor's last prediction with the scores predict_top3 ranked by
+        (forecast weights and the ranker blend included); returns the new prediction id
+        """
+        if predictor.combined_data is None:
+            raise ValueError("No data loaded. Please load data first.")
+        if predictor.factor_contributions is None:
+            raise ValueError("No prediction made. Please run predict_top3 first.")
+        fingerprints = [predictor._file_fingerprint(path) for path in predictor.input_paths]
+        input_hash = hashlib.sha1("|".join(fingerprints).encode("utf-8")).hexdigest() if fingerprints else None
+        record = self._weekend_record(
+            predictor, predictor.combined_data, predictor.race_name, predictor.rain_probability,
+            predictor.is_sprint_weekend, input_hash, "predict_top3", race_date,
+            contributions=predictor.factor_contributions, metrics=(predictor.mse, predictor.rmse)
+        )
+        with self._lock, self.connection:
+            return self._insert(record)
+
+    def record_many(self, records):
+        """Insert prebuilt records (see _weekend_record) in one transaction"""
+        with self._lock, self.connection:
+            return [self._insert(record) for record in records]
+
+    def import_archive(self, archive, predictor, rain_probability=0.0, race_dates=None):
+        """
+        Score every weekend of an F1SessionArchive and store them in one transaction
+        race_dates optionally maps weekend name to its race date. No prediction error
+        metrics are stored for these weekends (mse and rmse are NULL)
+        Returns the number of weekends stored
+        """
+        if race_dates is None:
+            race_dates = {}
+        records = []
+        for weekend in archive.list_weekends():
+            race_name = archive.weekends[weekend]["race"]
+            if race_name is None:
+                print(f"Warning: Archived weekend {weekend} has no race name, skipped")
+                continue
+            data = archive.to_frame(weekend)
+            is_sprint = predictor._track_for(race_name).get("is_sprint", False)
+            records.append(self._weekend_record(
+                predictor, data, race_name, rain_probability, is_sprint,
+                source=f"archive:{weekend}", race_date=race_dates.get(weekend)
+            ))
+        self.record_many(records)
+        print(f"Stored {len(records)} archived weekends in {os.path.basename(self.db_path)}")
+        return len(records)
+
+    def driver_predictions(self, driver, race=None, min_rain=None, since=None):
+        """
+        Every stored prediction for one driver, newest first
+        e.g. driver_predictions("Max Verstappen", min_rain=0.5) for wet races
+        """
+        query = ("SELECT p.id, p.race, p.race_date, p.created_at, p.rain_probability, p.is_sprint, "
+                 "d.predicted_position, d.race_score, d.podium_probability "
+                 "FROM prediction_drivers d JOIN predictions p ON p.id = d.prediction_id "
+                 "WHERE d.driver = ?")
+        params = [driver]
+        if race is not None:
+            query += " AND p.race = ?"
+            params.append(race)
+        if min_rain is not None:
+            query += " AND p.rain_probability >= ?"
+            params.append(min_rain)
+        if since is not None:
+            query += " AND p.created_at >= ?"
+            params.append(since)
+        query += " ORDER BY p.created_at DESC, p.id DESC"
+        with self._lock:
+            return pd.read_sql_query(query, self.connection, params=params)
+
+    def prediction_order(self, prediction_id):
+        """Full predicted order of one stored prediction"""
+        with self._lock:
+            return pd.read_sql_query(
+                "SELECT predicted_position, driver, team, race_score, podium_probability, factor_scores "
+                "FROM prediction_drivers WHERE prediction_id = ? ORDER BY predicted_position",
+                self.connection, params=[prediction_id]
+            )
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+
+class F1SharedArrays:
+    """
+    Named numeric arrays copied once into a single shared memory block
+    Worker processes receive only the small picklable descriptor and map the
+    same memory (see _attach_shared_arrays), so large inputs are neither
+    duplicated per core nor serialized for every task
+    """
+
+    def __init__(self, arrays):
+        """Copy a dict of name to array into a new shared memory block"""
+        layout = {}
+        offset = 0
+        for name, values in arrays.items():
+            values = np.ascontiguousarray(values)
+            offset = -(-offset // 64) * 64  # keep every array cache-line aligned
+            layout[name] = (offset, values.shape, values.dtype.str)
+            offset += values.nbytes
+
+        self.block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self.layout = layout
+        self.descriptor = (self.block.name, layout)
+        views = view = None
+        try:
+            views = self.views(self.block, layout, writeable=True)
+            for name, view in views.items():
+                view[...] = arrays[name]
+        except BaseException:
+            # Drop the views exporting the block's buffer so it can be released
+            views = view = None
+            self.close()
+            raise
+
+    @staticmethod
+    def views(block, layout, writeable=False):
+        """Array views over a shared memory block for the given layout"""
+        arrays = {}
+        for name, (offset, shape, dtype) in layout.items():
+            view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+            view.flags.writeable = writeable
+            arrays[name] = view
+        return arrays
+
+    def arrays(self):
+        """Read-only views of the published arrays in this process"""
+        return self.views(self.block, self.layout)
+
+    def close(self):
+        """Release the shared memory block"""
+        if self.block is not None:
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
 class F1TerminalFileSelector:
     """GUI for selecting data files, race, and rain probability with terminal output"""
     
     def __init__(self, root):
         self.root = root
         self.root.title("F1 Race Top 3 Predictor")
-        self.root.geometry("700x350")  # Reduced height since we don't need log output in GUI
+        self.root.geometry("700x450")  # Room for the predicted podium below the controls
         
         self.predictor = F1RacePredictor()
+        if os.path.exists(self.predictor.form_state_path):
+            self.predictor.load_form()
         self.quali_path = None
         self.practice_path = None
         self.sprint_path = None
         self.sprint_quali_path = None
         self.rain_value = tk.DoubleVar(value=0)
         self.is_sprint_weekend = False
+
+        # Predictions run on a worker thread and report back through this queue
+        self.message_queue = queue.Queue()
+        self.worker = None
+
+        # Rain-independent factors of the last prediction, rescored live by the rain slider
+        self.preview = None
+        self._preview_job = None
         
         self._create_ui()
     
@@ -1535,17 +4044,21 @@ class F1TerminalFileSelector:
         
         rain_slider = Scale(rain_frame, from_=0, to=100, orient=tk.HORIZONTAL, 
                            variable=self.rain_value, length=380,
-                           label="", showvalue=True)
+                           label="", showvalue=True, command=self._on_rain_change)
         rain_slider.pack(side=tk.LEFT)
         ttk.Label(rain_frame, text="%").pack(side=tk.LEFT, padx=(0, 5))
         
         # Predict button
-        predict_button = ttk.Button(frame, text="Predict Top 3", command=self._run_prediction)
-        predict_button.grid(row=7, column=0, columnspan=3, pady=15)
+        self.predict_button = ttk.Button(frame, text="Predict Top 3", command=self._run_prediction)
+        self.predict_button.grid(row=7, column=0, columnspan=3, pady=15)
         
         # Status label
         self.status_label = ttk.Label(frame, text="Ready", font=("Arial", 10, "italic"))
         self.status_label.grid(row=8, column=0, columnspan=3, pady=(0, 10))
+
+        # Predicted podium of the latest run
+        self.result_label = ttk.Label(frame, text="", font=("Arial", 11), justify=tk.LEFT)
+        self.result_label.grid(row=9, column=0, columnspan=3, pady=(0, 10))
         
         # Initialize race selection
         self._on_race_select(None)
@@ -1558,6 +4071,10 @@ class F1TerminalFileSelector:
             
         # Check if it's a sprint weekend
         self.is_sprint_weekend = self.predictor.track_database[selected_race].get("is_sprint", False)
+
+        # A preview only applies to the race whose data was loaded
+        if self.preview is not None and self.preview['race'] != selected_race:
+            self.preview = None
         
         if self.is_sprint_weekend:
             # Show sprint data fields
@@ -1631,9 +4148,9 @@ class F1TerminalFileSelector:
             self.sprint_quali_var.set(filepath)
     
     def _run_prediction(self):
-        """Run the prediction with selected files"""
-        self.status_label.config(text="Processing...")
-        self.root.update()
+        """Validate inputs and start the prediction on a worker thread"""
+        if self.worker is not None and self.worker.is_alive():
+            return
         
         if not self.quali_path:
             self.status_label.config(text="Error: Please select a qualifying data file.")
@@ -1664,25 +4181,117 @@ class F1TerminalFileSelector:
                 self.status_label.config(text="Ready")
                 return
         
+        # Tk variables may only be read on the main thread, so take them here
+        request = {
+            'race': race,
+            'rain_prob': self.rain_value.get() / 100,
+            'quali_path': self.quali_path,
+            'practice_path': self.practice_path,
+            'sprint_path': self.sprint_path if self.is_sprint_weekend else None,
+            'sprint_quali_path': self.sprint_quali_path if self.is_sprint_weekend else None
+        }
+        
+        self.status_label.config(text="Processing...")
+        self.predict_button.config(state=tk.DISABLED)
+        self.worker = threading.Thread(target=self._prediction_worker, args=(request,), daemon=True)
+        self.worker.start()
+        self.root.after(100, self._poll_messages)
+    
+    def _prediction_worker(self, request):
+        """Run the prediction off the Tk thread and post progress and results to the queue"""
         try:
-            # Run prediction in a way that outputs to terminal
-            self._execute_prediction()
-            
-            # Close the GUI after prediction completes
-            self.status_label.config(text="Prediction complete! See terminal for results.")
-            self.root.after(2000, self.root.destroy)  # Close GUI after 2 seconds
-            
+            top3 = self._execute_prediction(request)
+            preview = self._build_preview(request['race']) if top3 is not None else None
+            self.message_queue.put(('result', (top3, preview)))
         except Exception as e:
-            error_msg = f"Error during prediction: {str(e)}"
-            self.status_label.config(text="Error occurred. See terminal for details.")
-            print(f"\nERROR: {error_msg}")
+            print(f"\nERROR: Error during prediction: {str(e)}")
             traceback.print_exc()
-            messagebox.showerror("Prediction Error", error_msg)
+            self.message_queue.put(('error', f"Error during prediction: {str(e)}"))
+    
+    def _poll_messages(self):
+        """Apply worker messages on the Tk thread, polling until the run finishes"""
+        finished = False
+        while True:
+            try:
+                kind, payload = self.message_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'status':
+                self.status_label.config(text=payload)
+            elif kind == 'result':
+                finished = True
+                top3, self.preview = payload
+                self._show_result(top3)
+            elif kind == 'error':
+                finished = True
+                self.status_label.config(text="Error occurred. See terminal for details.")
+                messagebox.showerror("Prediction Error", payload)
+        
+        if finished:
+            self.predict_button.config(state=tk.NORMAL)
+        else:
+            self.root.after(100, self._poll_messages)
+    
+    def _show_result(self, top3):
+        """Show the predicted podium in the window"""
+        if top3 is None:
+            self.status_label.config(text="Prediction failed. See terminal for details.")
+            self.result_label.config(text="")
+            return
+        
+        lines = [f"{i+1}. {driver['DRIVER']} ({driver['CAR']}) - Started P{int(driver['position'])}"
+                 for i, (_, driver) in enumerate(top3.iterrows())]
+        self.result_label.config(text="\n".join(lines))
+        self.status_label.config(text="Prediction complete! See terminal for full results.")
+    
+    def _build_preview(self, race):
+        """Snapshot the loaded grid's rain-independent factors for live rain previews"""
+        data = self.predictor.combined_data
+        return {
+            'race': race,
+            'track': self.predictor.track,
+            'factors': self.predictor._factor_matrix(),
+            'drivers': list(data['DRIVER']),
+            'cars': list(data['CAR']),
+            'positions': data['position'].to_numpy(dtype=float)
+        }
+    
+    def _on_rain_change(self, value):
+        """Debounce rain slider moves into a single preview update"""
+        if self.preview is None:
+            return
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        self._preview_job = self.root.after(50, self._update_preview)
+    
+    def _update_preview(self):
+        """Rescore the last loaded grid at the slider's rain probability and redraw the podium"""
+        self._preview_job = None
+        if self.preview is None or (self.worker is not None and self.worker.is_alive()):
+            return
+        
+        rain_prob = self.rain_value.get() / 100
+        weights = self.predictor._race_weights(self.preview['race'], rain_prob, self.preview['track'])
+        scores = self.preview['factors'] @ weights
+        podium = np.argsort(-scores, kind='stable')[:3]
+        
+        lines = [f"{i+1}. {self.preview['drivers'][idx]} ({self.preview['cars'][idx]}) - "
+                 f"Started P{int(self.preview['positions'][idx])}"
+                 for i, idx in enumerate(podium)]
+        self.result_label.config(text="\n".join(lines))
+        self.status_label.config(
+            text=f"Preview at {rain_prob*100:.0f}% rain. Press Predict Top 3 for full results."
+        )
     
-    def _execute_prediction(self):
+    def _execute_prediction(self, request):
         """Execute prediction and direct output to terminal"""
-        # Save and restore stdout to ensure terminal output
-        race = self.race_var.get()
+        race = request['race']
+        rain_prob = request['rain_prob']
+        quali_path = request['quali_path']
+        practice_path = request['practice_path']
+        sprint_path = request['sprint_path']
+        sprint_quali_path = request['sprint_quali_path']
         
         print(f"\n{'='*50}")
         print(f"RUNNING PREDICTION FOR: {race}")
@@ -1691,38 +4300,30 @@ class F1TerminalFileSelector:
         # Set race, rain probability and load data
         print(f"Race: {race}")
         self.predictor.set_race(race)
-        rain_prob = self.rain_value.get() / 100
         self.predictor.set_rain_probability(rain_prob)
         print(f"Rain probability set to {rain_prob*100:.0f}%")
         
         # Show files being used
         print(f"\nLoading data files...")
-        print(f"Qualifying data: {os.path.basename(self.quali_path)}")
-        print(f"Practice data: {os.path.basename(self.practice_path)}")
+        print(f"Qualifying data: {os.path.basename(quali_path)}")
+        print(f"Practice data: {os.path.basename(practice_path)}")
         
-        if self.is_sprint_weekend:
-            if self.sprint_path:
-                print(f"Sprint race data: {os.path.basename(self.sprint_path)}")
-            if self.sprint_quali_path:
-                print(f"Sprint qualifying data: {os.path.basename(self.sprint_quali_path)}")
+        if sprint_path:
+            print(f"Sprint race data: {os.path.basename(sprint_path)}")
+        if sprint_quali_path:
+            print(f"Sprint qualifying data: {os.path.basename(sprint_quali_path)}")
         
-        # Load data (include sprint data if available)
-        if self.is_sprint_weekend:
-            # For sprint race weekends
-            self.predictor.load_data(
-                self.quali_path, 
-                self.practice_path, 
-                self.sprint_path if self.sprint_path else None,
-                self.sprint_quali_path if self.sprint_quali_path else None
-            )
-        else:
-            # For regular race weekends
-            self.predictor.load_data(self.quali_path, self.practice_path)
+        # Load data (include sprint data if available); files parsed by an
+        # earlier run are reused by the predictor
+        self.message_queue.put(('status', "Loading data..."))
+        self.predictor.load_data(quali_path, practice_path, sprint_path, sprint_quali_path)
         
         # Run prediction
+        self.message_queue.put(('status', "Predicting..."))
         top3 = self.predictor.predict_top3()
         if top3 is None:
             print("\nPrediction failed.")
+        return top3
 
 
 def main():
@@ -0,0 +1,85 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from f1podium import F1RacePredictor  # noqa: E402
+
+GRID = [
+    ("Max Verstappen", "Red Bull Racing"), ("Lando Norris", "McLaren"),
+    ("Oscar Piastri", "McLaren"), ("Charles Leclerc", "Ferrari"),
+    ("Lewis Hamilton", "Ferrari"), ("George Russell", "Mercedes"),
+    ("Andrea Kimi Antonelli", "Mercedes"), ("Fernando Alonso", "Aston Martin"),
+    ("Lance Stroll", "Aston Martin"), ("Pierre Gasly", "Alpine"),
+    ("Jack Doohan", "Alpine"), ("Alexander Albon", "Williams"),
+    ("Carlos Sainz", "Williams"), ("Yuki Tsunoda", "Racing Bulls"),
+    ("Isack Hadjar", "Racing Bulls"), ("Nico Hulkenberg", "Kick Sauber"),
+    ("Gabriel Bortoleto", "Kick Sauber"), ("Esteban Ocon", "Haas"),
+    ("Oliver Bearman", "Haas"), ("Liam Lawson", "Red Bull Racing"),
+]
+
+
+def lap_time(seconds):
+    """Format seconds as m:ss.xxx"""
+    return f"{int(seconds // 60)}:{seconds % 60:06.3f}"
+
+
+@pytest.fixture
+def weekend_files(tmp_path):
+    """Qualifying, practice, sprint qualifying and sprint files for a 20-driver grid"""
+    rng = np.random.default_rng(0)
+    quali = pd.DataFrame({
+        "POS": range(1, 21),
+        "DRIVER": [driver for driver, _ in GRID],
+        "CAR": [team for _, team in GRID],
+        "Q1": [lap_time(75.5 + 0.08 * i) for i in range(20)],
+        "Q2": [lap_time(75.3 + 0.08 * i) for i in range(20)],
+        "Q3": [lap_time(75.0 + 0.08 * i) for i in range(20)],
+    })
+    practice = pd.DataFrame({
+        "DRIVER": [driver for driver, _ in GRID],
+        "CAR": [team for _, team in GRID],
+        "P1": [lap_time(77.0 + rng.uniform(0, 1.5)) for _ in range(20)],
+        "P2": [lap_time(77.0 + rng.uniform(0, 1.5)) for _ in range(20)],
+        "P3": [lap_time(76.0 + rng.uniform(0, 1.5)) for _ in range(20)],
+    })
+    sprint_quali = quali.rename(columns={"Q1": "SQ1", "Q2": "SQ2", "Q3": "SQ3"})
+    sprint = pd.DataFrame({
+        "POS": range(1, 21),
+        "DRIVER": [driver for driver, _ in GRID],
+        "CAR": [team for _, team in GRID],
+        "LAPS": [19] * 19 + [18],
+        "TIME/RETIRED": ["30:12.345"] + [f"+{1.7 * i:.3f}s" for i in range(1, 19)] + ["+1 Lap"],
+    })
+    paths = {}
+    for name, frame in [("quali", quali), ("practice", practice),
+                        ("sprint_quali", sprint_quali), ("sprint", sprint)]:
+        paths[name] = str(tmp_path / f"{name}.csv")
+        frame.to_csv(paths[name], index=False)
+    return paths
+
+
+@pytest.fixture
+def predictor():
+    return F1RacePredictor()
+
+
+@pytest.fixture
+def regular_weekend(predictor, weekend_files):
+    """Predictor with a regular (non-sprint) weekend loaded"""
+    predictor.set_race("Bahrain Grand Prix")
+    predictor.load_data(weekend_files["quali"], weekend_files["practice"])
+    return predictor
+
+
+@pytest.fixture
+def sprint_weekend(predictor, weekend_files):
+    """Predictor with a sprint weekend loaded"""
+    predictor.set_race("Chinese Grand Prix")
+    predictor.load_data(weekend_files["quali"], weekend_files["practice"],
+                        weekend_files["sprint"], weekend_files["sprint_quali"])
+    return predictor
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from f1podium import F1SessionArchive
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return F1SessionArchive(str(tmp_path / "archive"))
+
+
+def test_weekend_round_trip(regular_weekend, archive):
+    regular_weekend.save_to_archive(archive, "2025-bahrain")
+    reopened = F1SessionArchive(archive.archive_dir)
+    frame = reopened.to_frame("2025-bahrain")
+
+    data = regular_weekend.combined_data
+    assert list(frame["DRIVER"].astype(str)) == list(data["DRIVER"].astype(str))
+    assert list(frame["CAR"].astype(str)) == list(data["CAR"].astype(str))
+    numeric = [col for col in data.columns if col not in ("DRIVER", "CAR")]
+    np.testing.assert_array_equal(frame[numeric].to_numpy(), data[numeric].to_numpy(dtype=np.float32))
+
+
+def test_columns_are_read_only_memory_maps(regular_weekend, archive):
+    regular_weekend.save_to_archive(archive, "w1")
+    arrays = archive.read_weekend("w1", ["DRIVER", "position", "missing"])
+    assert set(arrays) == {"DRIVER", "position"}
+    assert arrays["DRIVER"].dtype == np.int16
+    assert isinstance(arrays["position"], np.memmap)
+    with pytest.raises(ValueError):
+        arrays["position"][0] = 1.0
+
+
+def test_dictionary_is_shared_across_weekends(archive):
+    first = pd.DataFrame({"DRIVER": ["A", "B"], "CAR": ["X", "Y"], "position": [1, 2]})
+    second = pd.DataFrame({"DRIVER": ["B", "C"], "CAR": ["Y", "Z"], "position": [1, 2]})
+    archive.write_weekend("w1", first, "Bahrain Grand Prix")
+    archive.write_weekend("w2", second, "Chinese Grand Prix")
+
+    assert archive.drivers == ["A", "B", "C"]
+    assert archive.read_weekend("w2")["DRIVER"].tolist() == [1, 2]
+    assert archive.list_weekends() == ["w1", "w2"]
+    assert archive.list_weekends("Chinese Grand Prix") == ["w2"]
+    assert [weekend for weekend, _ in archive.scan(["position"])] == ["w1", "w2"]
+
+
+def test_rewriting_a_weekend_replaces_it(archive):
+    archive.write_weekend("w1", pd.DataFrame({"DRIVER": ["A"], "position": [3]}))
+    archive.write_weekend("w1", pd.DataFrame({"DRIVER": ["A", "B"], "position": [1, 2]}))
+    assert archive.to_frame("w1")["position"].tolist() == [1.0, 2.0]
+    assert archive.weekends["w1"]["rows"] == 2
+    with pytest.raises(KeyError):
+        archive.read_weekend("w9")
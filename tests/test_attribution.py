@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+
+def test_attribution_sums_to_race_score(regular_weekend):
+    top3 = regular_weekend.predict_top3()
+    attribution = regular_weekend.factor_attribution()
+    scores = regular_weekend.combined_data.set_index("DRIVER")["race_score"]
+    np.testing.assert_allclose(attribution.sum(axis=1).loc[scores.index], scores)
+    assert list(top3["DRIVER"]) == list(scores.sort_values(ascending=False).index[:3])
+
+
+@pytest.mark.parametrize("weekend, other_race", [
+    ("regular_weekend", "Chinese Grand Prix"),
+    ("sprint_weekend", "Bahrain Grand Prix"),
+])
+def test_attribution_for_race_of_other_weekend_type(request, weekend, other_race):
+    predictor = request.getfixturevalue(weekend)
+    factors = predictor.sprint_factors if predictor.is_sprint_weekend else predictor.regular_factors
+
+    attribution = predictor.factor_attribution(rain_probability=0.3, race_name=other_race)
+    assert list(attribution.columns) == factors
+    assert len(attribution) == len(predictor.combined_data)
+
+    batched = predictor.factor_attribution(rain_probability=np.array([0.0, 0.3]), race_name=other_race)
+    assert batched.shape == (2, len(predictor.combined_data), len(factors))
+    np.testing.assert_allclose(batched[1], attribution.to_numpy())
+
+
+def test_attribution_scenarios_match_scalar_calls(sprint_weekend):
+    rain = np.array([0.0, 0.25, 0.8])
+    batched = sprint_weekend.factor_attribution(rain_probability=rain)
+    for i, level in enumerate(rain):
+        np.testing.assert_allclose(batched[i], sprint_weekend.factor_attribution(rain_probability=level).to_numpy())
@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+
+from conftest import GRID
+
+
+@pytest.fixture
+def archive_file(tmp_path):
+    """Two-season lap dump with FastF1-style headers and text positions"""
+    rows = []
+    for year in (2024, 2025):
+        for session in ("Practice 2", "FP3"):
+            for d, (driver, _) in enumerate(GRID[:6]):
+                for lap in range(1, 6):
+                    rows.append({"Year": year, "EventName": "Bahrain Grand Prix", "Session": session,
+                                 "Driver": driver, "LapNumber": lap,
+                                 "LapTime": f"0 days 00:01:{20 + d + 0.1 * lap:06.3f}000",
+                                 "Position": "DNF" if lap == 5 else f"P{d + lap}"})
+    path = tmp_path / "archive.csv"
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return str(path)
+
+
+def test_best_lap_times_per_driver_session(predictor, archive_file):
+    best = predictor.best_lap_times(archive_file)
+    assert list(best.columns) == ["YEAR", "EVENT", "SESSION", "DRIVER", "best_lap", "laps", "best_position"]
+    assert len(best) == 2 * 2 * 6
+    assert set(best["SESSION"]) == {"P2", "P3"}
+
+    leader = best[(best["YEAR"] == 2025) & (best["SESSION"] == "P3") & (best["DRIVER"] == GRID[0][0])].iloc[0]
+    assert leader["best_lap"] == pytest.approx(80.1)
+    assert leader["laps"] == 5
+    assert leader["best_position"] == 1
+
+
+def test_best_lap_times_do_not_depend_on_chunk_size(predictor, archive_file):
+    pd.testing.assert_frame_equal(predictor.best_lap_times(archive_file, chunksize=7),
+                                  predictor.best_lap_times(archive_file, chunksize=1000))
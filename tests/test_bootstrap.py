@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from f1podium import _draw_finishing_positions
+
+
+def test_podium_probabilities_match_simulation(predictor):
+    rng = np.random.default_rng(3)
+    scores = rng.normal(0.8, 0.04, 20)
+    exact = predictor._podium_probabilities(scores, 0.2)
+    positions = _draw_finishing_positions(rng, scores, predictor._score_sigma(0.2), 200000)
+    np.testing.assert_allclose(exact, (positions <= 3).mean(axis=0), atol=0.005)
+    assert exact.sum() == pytest.approx(3.0, abs=1e-3)
+
+
+def test_podium_probabilities_batched(predictor):
+    scores = np.random.default_rng(4).normal(0.8, 0.04, (5, 20))
+    batched = predictor._podium_probabilities(scores, 0.0)
+    for row, expected in zip(scores, batched):
+        np.testing.assert_allclose(predictor._podium_probabilities(row, 0.0), expected)
+
+
+@pytest.mark.parametrize("n_drivers", [1, 2, 3])
+def test_small_grids_are_always_on_the_podium(predictor, n_drivers):
+    scores = np.linspace(0.5, 0.9, n_drivers)
+    np.testing.assert_allclose(predictor._podium_probabilities(scores, 0.0), 1.0)
+
+
+def test_podium_interval_only_reflects_timing_noise(regular_weekend):
+    regular_weekend.timing_noise = {"quali": 0.0, "practice": 0.0}
+    intervals = regular_weekend.bootstrap_intervals(n_replicates=50, seed=1)
+    np.testing.assert_allclose(intervals["podium_low"], intervals["podium_high"])
+    np.testing.assert_allclose(intervals["score_low"], intervals["score_high"])
+
+
+def test_bootstrap_is_reproducible(regular_weekend):
+    first = regular_weekend.bootstrap_intervals(n_replicates=200, seed=7)
+    second = regular_weekend.bootstrap_intervals(n_replicates=200, seed=7)
+    assert first.equals(second)
+    assert first["podium_probability"].sum() == pytest.approx(3.0, abs=1e-3)
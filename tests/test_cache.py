@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+from conftest import GRID, lap_time
+from f1podium import F1PredictionCache
+
+
+@pytest.fixture
+def laps_file(tmp_path):
+    """FP2 long runs for every driver"""
+    rows = [{"Session": "FP2", "Driver": driver, "LapNumber": lap, "Stint": 1, "Compound": "MEDIUM",
+             "LapTime": lap_time(80.0 + 0.05 * d + 0.01 * lap)}
+            for d, (driver, _) in enumerate(GRID) for lap in range(1, 9)]
+    path = tmp_path / "laps.csv"
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def cached_predictor(predictor):
+    predictor.set_race("Bahrain Grand Prix")
+    return predictor
+
+
+def test_lap_file_is_part_of_the_key(cached_predictor, weekend_files, laps_file):
+    cache = F1PredictionCache()
+    files = (weekend_files["quali"], weekend_files["practice"])
+    cached_predictor.predict_cached(cache, *files)
+    cached_predictor.predict_cached(cache, *files, practice_laps_path=laps_file)
+    assert cache.misses == 2 and cache.hits == 0
+    assert cached_predictor.practice_longruns is not None
+
+    cached_predictor.predict_cached(cache, *files, practice_laps_path=laps_file)
+    assert cache.hits == 1
+
+
+def test_miss_keeps_the_callers_rain_probability(cached_predictor, weekend_files):
+    cache = F1PredictionCache(rain_step=0.1)
+    cached_predictor.rain_probability = 0.23
+    cached_predictor.predict_cached(cache, weekend_files["quali"], weekend_files["practice"])
+    assert cached_predictor.rain_probability == 0.23
+
+
+@pytest.mark.parametrize("change", [
+    lambda p: p.tire_compound_offsets.update(SOFT=-0.8),
+    lambda p: p.tire_compound_degradation.update(HARD=0.05),
+    lambda p: setattr(p, "ideal_lap_weight", 0.7),
+    lambda p: p.timing_noise.update(quali=0.1),
+])
+def test_scoring_settings_are_part_of_the_key(cached_predictor, weekend_files, change):
+    cache = F1PredictionCache()
+    files = (weekend_files["quali"], weekend_files["practice"])
+    cached_predictor.predict_cached(cache, *files)
+    change(cached_predictor)
+    cached_predictor.predict_cached(cache, *files)
+    assert cache.misses == 2 and cache.hits == 0
+
+
+def test_hit_restores_the_cached_weekend(cached_predictor, weekend_files, tmp_path):
+    cache = F1PredictionCache()
+    cached_predictor.predict_cached(cache, weekend_files["quali"], weekend_files["practice"])
+    expected = cached_predictor.combined_data.copy()
+    contributions = cached_predictor.factor_contributions.copy()
+
+    quali = pd.read_csv(weekend_files["quali"]).iloc[::-1]
+    quali["POS"] = range(1, len(quali) + 1)
+    other = tmp_path / "other_quali.csv"
+    quali.to_csv(other, index=False)
+    cached_predictor.predict_cached(cache, str(other), weekend_files["practice"])
+    assert not cached_predictor.combined_data.equals(expected)
+
+    cached_predictor.predict_cached(cache, weekend_files["quali"], weekend_files["practice"])
+    assert cache.hits == 1
+    pd.testing.assert_frame_equal(cached_predictor.combined_data, expected)
+    pd.testing.assert_frame_equal(cached_predictor.factor_contributions, contributions)
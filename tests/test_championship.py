@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+RACES = ["Bahrain Grand Prix", "Chinese Grand Prix", "Spanish Grand Prix"]
+
+
+@pytest.fixture
+def season(regular_weekend):
+    assert [regular_weekend._track_for(race).get("is_sprint", False) for race in RACES] == [False, True, False]
+    return regular_weekend
+
+
+def project(predictor, **kwargs):
+    options = {"races": RACES, "n_simulations": 300, "workers": 1, "seed": 11}
+    options.update(kwargs)
+    return predictor.project_championship(**options)
+
+
+def test_seeded_projection_is_reproducible(season):
+    first = project(season)
+    second = project(season)
+    for name in ("drivers", "constructors", "driver_positions"):
+        assert first[name].equals(second[name])
+
+
+def test_points_are_allocated_for_races_and_sprints(season):
+    projection = project(season, current_points={"Max Verstappen": 100},
+                         current_team_points={"McLaren Mercedes": 50})
+    awarded = 3 * sum(season.race_points) + sum(season.sprint_points)
+
+    drivers = projection["drivers"].set_index("DRIVER")
+    assert drivers["expected_points"].sum() == pytest.approx(awarded + 100)
+    assert drivers.loc["Max Verstappen", "current_points"] == 100
+    assert (drivers["points_p95"] <= 3 * 25 + 8 + drivers["current_points"]).all()
+
+    teams = projection["constructors"].set_index("CAR")
+    assert teams["expected_points"].sum() == pytest.approx(awarded + 50)
+    assert teams["title_probability"].sum() == pytest.approx(1.0)
+
+    positions = projection["driver_positions"]
+    np.testing.assert_allclose(positions.sum(axis=1), 1.0)
+    np.testing.assert_allclose(positions.sum(axis=0), 1.0)
+
+
+def test_projection_needs_data(predictor, capsys):
+    assert predictor.project_championship(n_simulations=10) is None
+    assert "No data loaded" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("use_shared_memory", [True, False])
+def test_projection_does_not_depend_on_worker_count(season, use_shared_memory):
+    season.simulation_chunk_size = 64
+    serial = project(season)
+    parallel = project(season, workers=3, use_shared_memory=use_shared_memory)
+    for name in ("drivers", "constructors", "driver_positions"):
+        assert serial[name].equals(parallel[name])
@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+
+FASTF1_LAPS = (
+    "Time,Driver,DriverNumber,LapTime,LapNumber,Stint,PitOutTime,PitInTime,Sector1Time,"
+    "Sector2Time,Sector3Time,Sector1SessionTime,Sector2SessionTime,Sector3SessionTime,SpeedI1,"
+    "SpeedI2,SpeedFL,SpeedST,IsPersonalBest,Compound,TyreLife,FreshTyre,Team,LapStartTime,"
+    "LapStartDate,TrackStatus,Position,Deleted,DeletedReason,FastF1Generated,IsAccurate"
+).split(",")
+
+
+def test_fastf1_lap_export(predictor):
+    resolved = predictor._resolve_columns(FASTF1_LAPS, "practice_laps", exact_first=True)
+    assert resolved == {
+        "DRIVER": "Driver", "LAP_TIME": "LapTime", "LAP": "LapNumber", "SESSION": None,
+        "STINT": "Stint", "COMPOUND": "Compound", "TYRE_LIFE": "TyreLife",
+        "S1": "Sector1Time", "S2": "Sector2Time", "S3": "Sector3Time",
+        "YEAR": None, "EVENT": None, "POSITION": "Position",
+    }
+
+
+def test_short_lap_header_without_compound(predictor):
+    resolved = predictor._resolve_columns(["Driver", "LapTime", "LapNumber", "TyreLife", "Session"],
+                                          "practice_laps", exact_first=True)
+    assert resolved["COMPOUND"] is None
+    assert resolved["TYRE_LIFE"] == "TyreLife"
+    assert resolved["SESSION"] == "Session"
+    assert resolved["LAP"] == "LapNumber"
+
+
+def test_partial_aliases_still_match_unclaimed_columns(predictor):
+    resolved = predictor._resolve_columns(["Driver Name", "Best Lap Time", "Lap No", "Tyre Life (laps)"],
+                                          "practice_laps", exact_first=True)
+    assert resolved["DRIVER"] == "Driver Name"
+    assert resolved["LAP_TIME"] == "Best Lap Time"
+    assert resolved["LAP"] == "Lap No"
+    assert resolved["TYRE_LIFE"] == "Tyre Life (laps)"
+    assert resolved["COMPOUND"] is None
+
+
+def test_event_and_position_need_exact_names(predictor):
+    resolved = predictor._resolve_columns(["Driver", "LapTime", "EventFormat", "GridPosition"],
+                                          "practice_laps", exact_first=True)
+    assert resolved["EVENT"] is None
+    assert resolved["POSITION"] is None
+
+
+def test_official_results_headers(predictor):
+    quali = predictor._resolve_columns(["POS", "NO", "DRIVER", "CAR", "Q1", "Q2", "Q3", "LAPS"], "quali")
+    assert (quali["pos"], quali["driver"], quali["car"]) == ("POS", "DRIVER", "CAR")
+    assert (quali["q1"], quali["q2"], quali["q3"]) == ("Q1", "Q2", "Q3")
+
+    sprint = predictor._resolve_columns(["POS", "NO", "DRIVER", "CAR", "LAPS", "TIME/RETIRED", "PTS"], "sprint")
+    assert (sprint["time"], sprint["laps"]) == ("TIME/RETIRED", "LAPS")
+
+
+@pytest.mark.parametrize("text, seconds", [
+    ("1:32.123", 92.123),
+    ("92.123", 92.123),
+    ("1m32.123s", 92.123),
+    ("0 days 00:01:32.123000", 92.123),
+    ("1:01:32.5", 3692.5),
+])
+def test_time_formats(predictor, text, seconds):
+    assert predictor._time_to_seconds(text) == pytest.approx(seconds)
+
+
+def test_timing_seconds_parses_timedelta_strings(predictor):
+    values = pd.Series(["0 days 00:01:32.123000", "1:33.000", None, "0 days 00:00:28.500000"])
+    seconds = predictor._timing_seconds(values)
+    assert seconds.tolist()[:2] == pytest.approx([92.123, 93.0])
+    assert pd.isna(seconds[2])
+    assert seconds[3] == pytest.approx(28.5)
+
+
+def test_quali_sectors_need_exact_names(predictor):
+    header = ["POS", "DRIVER", "CAR", "Q1", "Q2", "Q3", "Laps1", "Laps2", "Laps3"]
+    resolved = predictor._resolve_columns(header, "quali")
+    assert (resolved["s1"], resolved["s2"], resolved["s3"]) == (None, None, None)
+
+    resolved = predictor._resolve_columns(header + ["Sector 1 Time", "Sector 2 Time", "Sector 3 Time"], "quali")
+    assert (resolved["s1"], resolved["s2"], resolved["s3"]) == ("Sector 1 Time", "Sector 2 Time", "Sector 3 Time")
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def forecast_weekend(regular_weekend, tmp_path):
+    """Regular weekend with a rain forecast that turns wet late in the race"""
+    path = tmp_path / "forecast.csv"
+    pd.DataFrame({"LAP": [1, 30, 45], "RAIN": [0, 70, 100]}).to_csv(path, index=False)
+    regular_weekend.load_weather_forecast(str(path))
+    regular_weekend.predict_top3()
+    return regular_weekend
+
+
+def race_scores(predictor):
+    return predictor.combined_data["race_score"].to_numpy(dtype=float)
+
+
+def test_forecast_differs_from_average_rain(forecast_weekend):
+    average = forecast_weekend._race_weights(rain_probability=forecast_weekend.rain_probability)
+    assert not np.allclose(forecast_weekend._race_weights(), average)
+
+
+def test_head_to_head_uses_forecast(forecast_weekend):
+    matrix = forecast_weekend.head_to_head_matrix().to_numpy()
+    expected = forecast_weekend._pairwise_probabilities(race_scores(forecast_weekend), forecast_weekend.rain_probability)
+    np.testing.assert_allclose(matrix, expected, atol=1e-5)
+
+
+def test_bootstrap_uses_forecast(forecast_weekend):
+    forecast_weekend.timing_noise = {"quali": 0.0, "practice": 0.0}
+    intervals = forecast_weekend.bootstrap_intervals(n_replicates=10, seed=1).set_index("DRIVER")
+    expected = forecast_weekend.combined_data.set_index("DRIVER")["race_score"]
+    np.testing.assert_allclose(intervals["score_median"].loc[expected.index], expected, atol=1e-5)
+
+
+def test_attribution_and_simulation_use_forecast(forecast_weekend):
+    attribution = forecast_weekend.factor_attribution()
+    np.testing.assert_allclose(attribution.sum(axis=1).to_numpy(), race_scores(forecast_weekend), atol=1e-5)
+
+    positions = forecast_weekend.simulate_race(n_simulations=20000, seed=2)
+    winner = forecast_weekend.combined_data["DRIVER"].iloc[np.argmax((positions == 1).mean(axis=0))]
+    assert winner == forecast_weekend.top3_prediction.iloc[0]["DRIVER"]
+
+
+def test_explicit_rain_overrides_forecast(forecast_weekend):
+    np.testing.assert_allclose(forecast_weekend._race_weights(rain_probability=0.0),
+                               forecast_weekend._factor_weights(forecast_weekend.track, 0.0))
+
+
+def test_set_race_clears_forecast_of_another_race(forecast_weekend):
+    forecast_weekend.set_race("Bahrain Grand Prix")
+    assert forecast_weekend.weather_forecast is not None
+    forecast_weekend.set_race("Spanish Grand Prix")
+    assert forecast_weekend.weather_forecast is None
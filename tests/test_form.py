@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from f1podium import F1FormTracker, F1RacePredictor
+
+
+@pytest.fixture
+def results_file(tmp_path):
+    results = pd.DataFrame({
+        "POS": ["1", "2", "3", "NC", "DQ"],
+        "DRIVER": ["Max Verstappen", "Lando Norris", "Charles Leclerc", "Lewis Hamilton", "Pierre Gasly"],
+        "TIME/RETIRED": ["1:31:44.742", "+2.1s", "+5.0s", "DNF", "DSQ"],
+    })
+    path = tmp_path / "race.csv"
+    results.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def form_predictor(predictor, tmp_path):
+    predictor.form_state_path = str(tmp_path / "driver_form.json")
+    return predictor
+
+
+def test_result_positions_leave_retirements_unclassified(predictor, results_file):
+    positions = predictor._result_positions(results_file)
+    assert positions[["Max Verstappen", "Lando Norris", "Charles Leclerc"]].tolist() == [1, 2, 3]
+    assert np.isnan(positions["Lewis Hamilton"])
+    assert np.isnan(positions["Pierre Gasly"])
+
+
+def test_grid_positions_still_default_to_back_of_grid(predictor):
+    assert predictor._safe_convert_position("DNS") == 20
+    assert np.isnan(predictor._safe_convert_position("DNF", unclassified=np.nan))
+
+
+def test_update_form_skips_unclassified_drivers(form_predictor, results_file):
+    before = dict(form_predictor.driver_experience)
+    tracker = form_predictor.update_form(results_file)
+
+    assert set(tracker.ratings["experience"]) == {"Max Verstappen", "Lando Norris", "Charles Leclerc"}
+    assert form_predictor.driver_experience["Lewis Hamilton"] == before["Lewis Hamilton"]
+    assert form_predictor.driver_experience["Pierre Gasly"] == before["Pierre Gasly"]
+
+
+def test_update_form_rejects_repeated_file(form_predictor, results_file):
+    form_predictor.update_form(results_file)
+    ratings = dict(form_predictor.form_tracker.ratings["experience"])
+    form_predictor.update_form(results_file)
+    assert form_predictor.form_tracker.ratings["experience"] == ratings
+    assert form_predictor.form_tracker.results == 1
+
+
+def test_applied_fingerprints_are_bounded(predictor, tmp_path):
+    tracker = F1FormTracker(str(tmp_path / "form.json"))
+    tracker.max_applied = 3
+    for i in range(10):
+        tracker.update(["Max Verstappen"], [1], predictor, fingerprint=f"file{i}")
+    assert tracker.applied == ["file7", "file8", "file9"]
+    tracker.save()
+    assert F1FormTracker(str(tmp_path / "form.json")).applied == ["file7", "file8", "file9"]
+
+
+def test_constructor_does_not_load_form(monkeypatch):
+    def fail(self, state_path=None):
+        raise AssertionError("form loaded in the constructor")
+
+    monkeypatch.setattr(F1RacePredictor, "load_form", fail)
+    monkeypatch.setattr("os.path.exists", lambda path: True)
+    assert F1RacePredictor().form_tracker is None
+
+
+def test_form_state_defaults_to_the_home_directory(monkeypatch, tmp_path, results_file):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    predictor = F1RacePredictor()
+    assert predictor.form_state_path == str(tmp_path / "home" / ".f1podium" / "driver_form.json")
+
+    predictor.update_form(results_file)
+    assert os.path.exists(predictor.form_state_path)
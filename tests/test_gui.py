@@ -0,0 +1,128 @@
+import queue
+
+import pytest
+
+import f1podium
+from f1podium import F1TerminalFileSelector
+
+
+class Widget:
+    """Stand-in for a Tk widget that keeps its last configuration"""
+
+    def __init__(self):
+        self.options = {}
+
+    def config(self, **options):
+        self.options.update(options)
+
+
+class Root:
+    """Stand-in for the Tk root that records scheduled callbacks"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+    def after_cancel(self, job):
+        self.scheduled[job - 1] = None
+
+
+class Value:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+@pytest.fixture
+def app(predictor, monkeypatch):
+    """The file selector without a display: Tk widgets are replaced by stand-ins"""
+    monkeypatch.setattr(f1podium.messagebox, "showerror", lambda *args: None)
+    app = F1TerminalFileSelector.__new__(F1TerminalFileSelector)
+    app.root = Root()
+    app.predictor = predictor
+    app.message_queue = queue.Queue()
+    app.worker = None
+    app.preview = None
+    app._preview_job = None
+    app.rain_value = Value(0)
+    app.status_label = Widget()
+    app.result_label = Widget()
+    app.predict_button = Widget()
+    return app
+
+
+@pytest.fixture
+def request_for(weekend_files):
+    def request_for(race="Bahrain Grand Prix", rain=0.0, quali=None):
+        return {"race": race, "rain_prob": rain, "quali_path": quali or weekend_files["quali"],
+                "practice_path": weekend_files["practice"], "sprint_path": None, "sprint_quali_path": None}
+    return request_for
+
+
+def drain(app):
+    messages = []
+    while not app.message_queue.empty():
+        messages.append(app.message_queue.get_nowait())
+    return messages
+
+
+def test_worker_posts_progress_and_result(app, request_for):
+    app._prediction_worker(request_for())
+    messages = drain(app)
+    assert messages[:2] == [("status", "Loading data..."), ("status", "Predicting...")]
+    kind, (top3, preview) = messages[2]
+    assert kind == "result"
+    assert list(top3["DRIVER"]) == list(app.predictor.top3_prediction["DRIVER"])
+    assert preview["race"] == "Bahrain Grand Prix"
+
+
+def test_poll_applies_result_and_reenables_predict(app, request_for):
+    app._prediction_worker(request_for())
+    app.predict_button.config(state="disabled")
+    app._poll_messages()
+
+    assert app.predict_button.options["state"] == "normal"
+    assert app.result_label.options["text"].startswith("1. " + app.predictor.top3_prediction.iloc[0]["DRIVER"])
+    assert app.preview is not None
+    assert app.root.scheduled == []
+
+
+def test_worker_reports_errors(app, request_for, tmp_path):
+    app._prediction_worker(request_for(quali=str(tmp_path / "missing.csv")))
+    assert drain(app)[-1][0] == "error"
+
+
+def test_poll_keeps_polling_while_running(app):
+    app.message_queue.put(("status", "Loading data..."))
+    app._poll_messages()
+    assert app.status_label.options["text"] == "Loading data..."
+    assert app.root.scheduled == [app._poll_messages]
+
+
+@pytest.mark.parametrize("rain", [0, 40, 100])
+def test_preview_matches_a_full_prediction(app, request_for, rain):
+    app._prediction_worker(request_for())
+    app._poll_messages()
+
+    app.rain_value = Value(rain)
+    app._update_preview()
+    preview = [line.split(" (")[0][3:] for line in app.result_label.options["text"].split("\n")]
+
+    app._prediction_worker(request_for(rain=rain / 100))
+    assert preview == list(app.predictor.top3_prediction["DRIVER"])
+
+
+def test_slider_moves_are_debounced(app, request_for):
+    app._on_rain_change(10)
+    assert app.root.scheduled == []
+
+    app._prediction_worker(request_for())
+    app._poll_messages()
+    app._on_rain_change(10)
+    app._on_rain_change(20)
+    assert app.root.scheduled == [None, app._update_preview]
@@ -0,0 +1,35 @@
+import numpy as np
+
+from f1podium import _draw_finishing_positions
+
+
+def test_matrix_is_complementary(regular_weekend):
+    matrix = regular_weekend.head_to_head_matrix().to_numpy()
+    assert np.isnan(np.diag(matrix)).all()
+    off_diagonal = ~np.eye(len(matrix), dtype=bool)
+    np.testing.assert_allclose((matrix + matrix.T)[off_diagonal], 1.0)
+
+
+def test_matrix_matches_simulated_races(regular_weekend):
+    matrix = regular_weekend.head_to_head_matrix(rain_probability=0.3).to_numpy()
+    scores = regular_weekend._factor_matrix() @ regular_weekend._race_weights(rain_probability=0.3)
+    positions = _draw_finishing_positions(np.random.default_rng(1), scores,
+                                          regular_weekend._score_sigma(0.3), 100000)
+    simulated = (positions[:, :, None] < positions[:, None, :]).mean(axis=0)
+    off_diagonal = ~np.eye(len(matrix), dtype=bool)
+    np.testing.assert_allclose(matrix[off_diagonal], simulated[off_diagonal], atol=0.01)
+
+
+def test_calendar_matches_single_races(regular_weekend):
+    races = ["Bahrain Grand Prix", "Chinese Grand Prix", "Monaco Grand Prix"]
+    calendar = regular_weekend.head_to_head_calendar(races, rain_probability=0.2)
+    assert list(calendar) == races
+    for race in races:
+        np.testing.assert_allclose(calendar[race].to_numpy(),
+                                   regular_weekend.head_to_head_matrix(race, 0.2).to_numpy())
+
+
+def test_head_to_head_needs_data(predictor, capsys):
+    assert predictor.head_to_head_matrix() is None
+    assert predictor.head_to_head_calendar() is None
+    assert "No data loaded" in capsys.readouterr().out
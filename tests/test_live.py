@@ -0,0 +1,64 @@
+import json
+
+import pandas as pd
+import pytest
+
+from f1podium import F1LiveTiming
+
+
+@pytest.fixture
+def live(regular_weekend):
+    regular_weekend.predict_top3()
+    return F1LiveTiming(regular_weekend, race_laps=50)
+
+
+def test_pre_race_podium_matches_prediction(live):
+    podium = [driver for driver, _ in live.podium()]
+    assert podium == list(live.predictor.top3_prediction["DRIVER"])
+
+
+def test_messages_update_the_order(live):
+    last = live.drivers[-1]
+    leader = live.podium()[0][0]
+    live.process({"type": "start", "laps": 50})
+    live.process({"type": "position", "driver": last, "position": 1, "gap": 0.0})
+    live.process({"type": "position", "driver": leader, "position": 20, "gap": 60.0})
+    assert live.process({"type": "gap", "driver": last, "gap": 0.0}) is None
+
+    podium = live.process({"type": "lap", "lap": 50})
+    drivers = [driver for driver, _ in podium]
+    assert drivers[0] == last
+    assert leader not in drivers
+    assert [score for _, score in podium] == sorted((score for _, score in podium), reverse=True)
+    assert live.history == [(50, podium)] and live.messages == 5
+
+
+def test_retired_and_unknown_drivers(live):
+    leader = live.podium()[0][0]
+    assert live.process({"type": "retired", "driver": leader}) is None
+    assert live.process({"type": "pit", "driver": "Nobody Known"}) is None
+    assert leader not in [driver for driver, _ in live.podium()]
+
+
+def test_replay_skips_malformed_lines(live, tmp_path):
+    path = tmp_path / "feed.jsonl"
+    lines = [json.dumps({"type": "start", "laps": 10}), "not json",
+             json.dumps({"type": "lap", "lap": 1}), json.dumps({"type": "lap", "lap": 2})]
+    path.write_text("\n".join(lines))
+    laps = []
+    podium = live.replay(str(path), on_lap=lambda lap, podium: laps.append(lap))
+    assert laps == [1, 2]
+    assert len(podium) == 3
+
+
+@pytest.mark.parametrize("n_drivers", [1, 2])
+def test_partial_grid(predictor, weekend_files, tmp_path, n_drivers):
+    quali = pd.read_csv(weekend_files["quali"]).head(n_drivers)
+    path = tmp_path / "partial_quali.csv"
+    quali.to_csv(path, index=False)
+    predictor.set_race("Bahrain Grand Prix")
+    predictor.load_data(str(path), weekend_files["practice"])
+
+    live = F1LiveTiming(predictor)
+    podium = live.process({"type": "lap", "lap": 1})
+    assert sorted(driver for driver, _ in podium) == sorted(quali["DRIVER"])
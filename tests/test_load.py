@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+
+def test_combined_data_is_compact(regular_weekend):
+    data = regular_weekend.combined_data
+    assert isinstance(data["DRIVER"].dtype, pd.CategoricalDtype)
+    assert isinstance(data["CAR"].dtype, pd.CategoricalDtype)
+    numeric = data.drop(columns=["DRIVER", "CAR"])
+    assert (numeric.dtypes == np.float32).all()
+
+
+def test_raw_session_frames_are_not_kept(sprint_weekend):
+    assert sprint_weekend.quali_data is None
+    assert sprint_weekend.practice_data is None
+    assert sprint_weekend.sprint_data is None
+    assert sprint_weekend.sprint_quali_data is None
+    assert sprint_weekend.combined_data["sprint_position"].notna().all()
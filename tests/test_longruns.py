@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+DRIVERS = {"VER": 92.0, "NOR": 92.3, "LEC": 92.6}
+
+
+def timedelta_text(seconds):
+    return str(pd.Timedelta(seconds=seconds))
+
+
+def fastf1_laps():
+    """FastF1-style lap export: a short soft stint, then a 12-lap medium long run per driver"""
+    rows = []
+    for driver, base in DRIVERS.items():
+        for lap in range(1, 17):
+            long_run = lap >= 5
+            age = lap - 4 if long_run else lap
+            # Medium laps: fuel burn and tire wear cancel out to base + 0.06
+            seconds = base + 0.06 if long_run else base - 1.0
+            rows.append({
+                "Time": timedelta_text(600 + lap * 95),
+                "Driver": driver,
+                "LapTime": timedelta_text(seconds),
+                "LapNumber": float(lap),
+                "Stint": 2.0 if long_run else 1.0,
+                "Sector1SessionTime": timedelta_text(600 + lap * 95 - 60),
+                "Compound": "MEDIUM" if long_run else "SOFT",
+                "TyreLife": float(age),
+                "Team": "Team",
+            })
+    return pd.DataFrame(rows)
+
+
+def test_fastf1_export_long_runs(predictor, tmp_path):
+    path = tmp_path / "laps.csv"
+    fastf1_laps().to_csv(path, index=False)
+
+    runs = predictor.load_practice_laps(str(path), session="P2").set_index("DRIVER")
+    assert set(runs.index) == {predictor._standardize_driver_name(code) for code in DRIVERS}
+    for code, base in DRIVERS.items():
+        run = runs.loc[predictor._standardize_driver_name(code)]
+        assert run["longrun_laps"] == 12
+        assert run["longrun_pace"] == pytest.approx(base, abs=1e-6)
+
+
+def test_tyre_life_is_not_read_as_compound(predictor, tmp_path):
+    laps = pd.DataFrame({
+        "Driver": ["Max Verstappen"] * 10,
+        "LapTime": [f"1:{32 + 0.01 * i:06.3f}" for i in range(10)],
+        "LapNumber": range(1, 11),
+        "TyreLife": range(1, 11),
+        "Session": ["FP2"] * 10,
+    })
+    path = tmp_path / "laps.csv"
+    laps.to_csv(path, index=False)
+
+    runs = predictor.load_practice_laps(str(path), session="P2")
+    assert runs["longrun_laps"].tolist() == [10]
+
+
+def test_long_runs_do_not_depend_on_chunk_size(predictor, tmp_path):
+    path = tmp_path / "laps.csv"
+    frame = fastf1_laps()
+    frame["Session"] = "Practice 2"
+    frame.to_csv(path, index=False)
+
+    small = predictor.load_practice_laps(str(path), session="P2", chunksize=5)
+    large = predictor.load_practice_laps(str(path), session="P2", chunksize=10000)
+    pd.testing.assert_frame_equal(small.sort_values("DRIVER").reset_index(drop=True),
+                                  large.sort_values("DRIVER").reset_index(drop=True))
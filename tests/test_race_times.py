@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def race_times(predictor, times, **kwargs):
+    return predictor._race_times(pd.Series(times), **kwargs)
+
+
+def test_gaps_and_laps_down_are_added_to_the_leader(predictor):
+    seconds = race_times(predictor, ["30:12.345", "+1.700s", "+1:02.000", "+1 Lap", "DNF"],
+                         laps=[19, 19, 19, 18, None])
+    leader = 30 * 60 + 12.345
+    np.testing.assert_allclose(seconds[:4], [leader, leader + 1.7, leader + 62.0, leader + leader / 19])
+    assert np.isnan(seconds[4])
+
+
+def test_gap_without_plus_is_not_the_leader(predictor):
+    seconds = race_times(predictor, ["1:02:03.456", "12.345s", "15"])
+    leader = 3600 + 2 * 60 + 3.456
+    np.testing.assert_allclose(seconds, [leader, leader + 12.345, leader + 15])
+
+
+def test_leader_comes_from_position_one(predictor):
+    seconds = race_times(predictor, ["+0.500s", "1:05.000", "30:00.000"], positions=[2, 3, 1])
+    np.testing.assert_allclose(seconds, [1800.5, 65.0, 1800.0])
+
+
+@pytest.mark.parametrize("text, expected", [("1:23.456", 83.456), ("+2.5", None), ("DNS", None)])
+def test_parse_race_time(predictor, text, expected):
+    assert predictor._parse_race_time(text) == (pytest.approx(expected) if expected else None)
+    assert predictor._parse_race_time("+2.5", leader_time=100.0) == pytest.approx(102.5)
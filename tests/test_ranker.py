@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from f1podium import F1SessionArchive
+
+
+@pytest.fixture
+def ranked_weekend(regular_weekend, tmp_path):
+    """Regular weekend with a ranker trained on archived copies of it"""
+    archive = F1SessionArchive(str(tmp_path / "archive"))
+    drivers = list(regular_weekend.combined_data["DRIVER"])
+    results = {}
+    for i, race in enumerate(["Bahrain Grand Prix", "Spanish Grand Prix"]):
+        regular_weekend.race_name = race
+        regular_weekend.save_to_archive(archive, f"w{i}")
+        # Finishing order reversed against the grid, so the ranker disagrees with the heuristic
+        results[f"w{i}"] = {driver: 20 - j for j, driver in enumerate(drivers)}
+    regular_weekend.set_race("Bahrain Grand Prix")
+    regular_weekend.train_ranker(archive, results)
+    regular_weekend.ranker_blend = 0.6
+    return regular_weekend
+
+
+def test_blended_attribution_sums_to_race_score(ranked_weekend):
+    top3 = ranked_weekend.predict_top3()
+    contributions = ranked_weekend.factor_contributions
+    assert list(contributions.columns) == ranked_weekend.regular_factors + ["ranker"]
+
+    scores = ranked_weekend.combined_data.set_index("DRIVER")["race_score"]
+    np.testing.assert_allclose(contributions.sum(axis=1).loc[scores.index], scores)
+    assert top3.iloc[0]["DRIVER"] == scores.idxmax()
+
+
+def test_blended_scores_match_ensemble(ranked_weekend):
+    ranked_weekend.predict_top3()
+    _, _, blended = ranked_weekend.ensemble_scores(0.0)
+    np.testing.assert_allclose(ranked_weekend.combined_data["race_score"], blended[0])
+
+
+def test_batched_attribution_includes_ranker(ranked_weekend):
+    rain = np.array([0.0, 0.6])
+    batched = ranked_weekend.factor_attribution(rain_probability=rain)
+    _, _, blended = ranked_weekend.ensemble_scores(rain)
+    assert batched.shape[-1] == len(ranked_weekend.regular_factors) + 1
+    np.testing.assert_allclose(batched.sum(axis=-1), blended)
+
+
+def test_no_ranker_column_without_blend(ranked_weekend):
+    ranked_weekend.ranker_blend = 0.0
+    ranked_weekend.predict_top3()
+    assert list(ranked_weekend.factor_contributions.columns) == ranked_weekend.regular_factors
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import GRID, lap_time
+
+
+@pytest.fixture
+def sector_files(weekend_files, tmp_path):
+    """Qualifying with sector times and a lap file with FP2 long runs and FP3 sectors"""
+    rng = np.random.default_rng(5)
+    quali = pd.read_csv(weekend_files["quali"])
+    for i, sector in enumerate(["S1", "S2", "S3"]):
+        quali[sector] = [25.0 + i + rng.uniform(0, 0.4) for _ in range(len(quali))]
+    quali_path = tmp_path / "quali_sectors.csv"
+    quali.to_csv(quali_path, index=False)
+
+    rows = []
+    for d, (driver, _) in enumerate(GRID):
+        for session, laps in (("FP2", 8), ("FP3", 4)):
+            for lap in range(1, laps + 1):
+                sectors = [25.0 + i + rng.uniform(0, 0.5) for i in range(3)]
+                rows.append({"Session": session, "Driver": driver, "LapNumber": lap,
+                             "LapTime": lap_time(sum(sectors) + 0.3 + 0.02 * d),
+                             "Stint": 1, "Compound": "MEDIUM", "TyreLife": lap,
+                             "Sector1Time": sectors[0], "Sector2Time": sectors[1],
+                             "Sector3Time": sectors[2]})
+    laps = pd.DataFrame(rows)
+    laps_path = tmp_path / "laps.csv"
+    laps.to_csv(laps_path, index=False)
+    return {"quali": str(quali_path), "practice": weekend_files["practice"], "laps": str(laps_path)}
+
+
+@pytest.fixture
+def sector_weekend(predictor, sector_files):
+    predictor.set_race("Dutch Grand Prix")
+    predictor.load_data(sector_files["quali"], sector_files["practice"],
+                        practice_laps_path=sector_files["laps"])
+    return predictor
+
+
+def test_sector_data_reaches_the_scores(sector_weekend):
+    data = sector_weekend.combined_data
+    assert data["ideal_quali_time"].notna().all()
+    assert data["p3_ideal_seconds"].notna().all()
+    assert data["p2_longrun_seconds"].notna().all()
+
+
+def test_bootstrap_median_matches_point_prediction(sector_weekend):
+    sector_weekend.timing_noise = {"quali": 0.0, "practice": 0.0}
+    sector_weekend.practice_longruns["longrun_std"] = 0.0
+    sector_weekend.predict_top3()
+    intervals = sector_weekend.bootstrap_intervals(n_replicates=20, seed=1).set_index("DRIVER")
+    scores = sector_weekend.combined_data.set_index("DRIVER")["race_score"]
+    np.testing.assert_allclose(intervals["score_median"].loc[scores.index], scores, atol=1e-5)
+
+
+def test_lap_file_is_streamed_once(predictor, sector_files):
+    calls = []
+    stream = predictor._stream_laps
+
+    def counting_stream(*args, **kwargs):
+        calls.append(args[0])
+        return stream(*args, **kwargs)
+
+    predictor._stream_laps = counting_stream
+    predictor.set_race("Dutch Grand Prix")
+    predictor.load_data(sector_files["quali"], sector_files["practice"], practice_laps_path=sector_files["laps"])
+    assert calls == [sector_files["laps"]]
+
+
+def test_one_pass_matches_separate_loaders(predictor, sector_files):
+    longruns, sectors = predictor._scan_laps(sector_files["laps"], {"longruns": "P2", "sectors": "P3"}, chunksize=17)
+    pd.testing.assert_frame_equal(longruns, predictor.load_practice_laps(sector_files["laps"], "P2"))
+    pd.testing.assert_frame_equal(sectors, predictor.load_sector_laps(sector_files["laps"], "P3"))
+
+
+def test_no_session_column_gives_no_ideal_fp3_laps(predictor, sector_files, tmp_path):
+    laps = pd.read_csv(sector_files["laps"]).drop(columns="Session")
+    path = tmp_path / "laps_no_session.csv"
+    laps.to_csv(path, index=False)
+
+    predictor.set_race("Dutch Grand Prix")
+    predictor.load_data(sector_files["quali"], sector_files["practice"], practice_laps_path=str(path))
+    assert "p3_ideal_seconds" not in predictor.combined_data.columns
+    assert predictor.combined_data["p2_longrun_seconds"].notna().any()
@@ -0,0 +1,26 @@
+import pandas as pd
+
+
+def test_only_resolved_columns_are_parsed_as_text(predictor, weekend_files, tmp_path):
+    quali = pd.read_csv(weekend_files["quali"])
+    quali["NO"] = range(1, 21)
+    quali["NOTES"] = "x" * 50
+    path = tmp_path / "quali_wide.csv"
+    quali.to_csv(path, index=False)
+
+    df, resolved = predictor._read_session_csv(str(path), "quali", use_cache=False)
+    assert list(df.columns) == ["POS", "DRIVER", "CAR", "Q1", "Q2", "Q3"]
+    assert (resolved["pos"], resolved["q3"], resolved["s1"]) == ("POS", "Q3", None)
+    assert df["POS"].tolist()[:3] == ["1", "2", "3"]
+    assert all(isinstance(value, str) for value in df["POS"])
+
+
+def test_latin1_header(predictor, tmp_path):
+    path = tmp_path / "practice_latin1.csv"
+    path.write_bytes("DRIVER,CAR,P1,P2,P3\nNico Hülkenberg,Kick Sauber,1:17.000,1:16.900,1:16.500\n"
+                     .encode("latin1"))
+    columns, encoding = predictor._read_csv_header(str(path), verbose=False)
+    assert columns == ["DRIVER", "CAR", "P1", "P2", "P3"]
+
+    df, _ = predictor._read_session_csv(str(path), "practice", use_cache=False, verbose=False)
+    assert df["DRIVER"].iloc[0] == "Nico Hülkenberg"
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+import f1podium
+from f1podium import F1SharedArrays, _attach_shared_arrays
+
+
+def test_new_descriptor_closes_earlier_attachments():
+    with F1SharedArrays({"scores": np.arange(6.0)}) as first, \
+            F1SharedArrays({"scores": np.arange(4.0)}) as second:
+        np.testing.assert_array_equal(_attach_shared_arrays(first.descriptor)["scores"], np.arange(6.0))
+        block = f1podium._attached_blocks[first.block.name][0]
+        assert _attach_shared_arrays(first.descriptor) is _attach_shared_arrays(first.descriptor)
+
+        np.testing.assert_array_equal(_attach_shared_arrays(second.descriptor)["scores"], np.arange(4.0))
+        assert list(f1podium._attached_blocks) == [second.block.name]
+        assert block.buf is None
+
+        f1podium._attached_blocks.pop(second.block.name)[0].close()
+
+
+class FailingArrays(dict):
+    """Arrays whose values cannot be read back for the copy"""
+
+    def __getitem__(self, name):
+        raise RuntimeError("array unavailable")
+
+
+def test_failed_copy_releases_the_block(monkeypatch):
+    created = []
+    shared_memory = f1podium.shared_memory.SharedMemory
+
+    def recording(*args, **kwargs):
+        block = shared_memory(*args, **kwargs)
+        created.append(block)
+        return block
+
+    monkeypatch.setattr(f1podium.shared_memory, "SharedMemory", recording)
+    with pytest.raises(RuntimeError):
+        F1SharedArrays(FailingArrays(scores=np.arange(3.0)))
+
+    assert len(created) == 1 and created[0].buf is None
+    with pytest.raises(FileNotFoundError):
+        shared_memory(name=created[0].name)
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_simulate_race_without_data(predictor, capsys):
+    assert predictor.simulate_race(n_simulations=10) is None
+    assert "No data loaded" in capsys.readouterr().out
+
+
+def test_simulate_race_draws_every_position_once(regular_weekend):
+    positions = regular_weekend.simulate_race(n_simulations=50, seed=1)
+    assert positions.shape == (50, len(regular_weekend.combined_data))
+    np.testing.assert_array_equal(np.sort(positions, axis=1), np.tile(np.arange(1, positions.shape[1] + 1), (50, 1)))
+
+
+def test_constructor_outlook_without_data(predictor, capsys):
+    assert predictor.constructor_outlook(n_simulations=10) is None
+    assert "No data loaded" in capsys.readouterr().out
+
+
+def test_constructor_outlook_with_a_missing_car(predictor, weekend_files, tmp_path):
+    quali = pd.read_csv(weekend_files["quali"])
+    quali = quali[quali["DRIVER"] != "Oscar Piastri"]
+    path = tmp_path / "quali_19.csv"
+    quali.to_csv(path, index=False)
+    predictor.set_race("Bahrain Grand Prix")
+    predictor.load_data(str(path), weekend_files["practice"])
+
+    outlook = predictor.constructor_outlook(n_simulations=2000, seed=3).set_index("CAR")
+    assert len(outlook) == 10
+    assert outlook["expected_points"].sum() == pytest.approx(sum(predictor.race_points))
+    assert outlook["win_probability"].sum() == pytest.approx(1.0)
+    single = predictor._standardize_team_name("McLaren")
+    assert outlook.loc[single, "double_podium_probability"] == 0.0
+    assert outlook.loc[single, "podium_probability"] > 0.0
@@ -0,0 +1,79 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from f1podium import F1ResultsStore, F1SessionArchive
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = F1ResultsStore(str(tmp_path / "predictions.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def forecast_file(tmp_path):
+    path = tmp_path / "forecast.csv"
+    pd.DataFrame({"LAP": [1, 20, 40], "RAIN": [0, 60, 90]}).to_csv(path, index=False)
+    return str(path)
+
+
+def stored_scores(store, prediction_id):
+    order = store.prediction_order(prediction_id)
+    return order.set_index("driver")["race_score"], order
+
+
+def test_record_stores_forecast_scores(regular_weekend, store, forecast_file):
+    regular_weekend.load_weather_forecast(forecast_file)
+    regular_weekend.results_store = store
+    regular_weekend.predict_top3()
+
+    scores, order = stored_scores(store, 1)
+    expected = regular_weekend.combined_data.set_index("DRIVER")["race_score"].astype(float)
+    np.testing.assert_allclose(scores.loc[expected.index], expected, rtol=1e-6)
+    assert list(order["driver"][:3]) == list(regular_weekend.top3_prediction["DRIVER"])
+
+
+def test_record_stores_ranker_blend(regular_weekend, store, tmp_path):
+    archive = F1SessionArchive(str(tmp_path / "archive"))
+    regular_weekend.save_to_archive(archive, "w0")
+    drivers = list(regular_weekend.combined_data["DRIVER"])
+    regular_weekend.train_ranker(archive, {"w0": {driver: 20 - i for i, driver in enumerate(drivers)}})
+    regular_weekend.ranker_blend = 0.5
+    regular_weekend.results_store = store
+    regular_weekend.predict_top3()
+
+    scores, order = stored_scores(store, 1)
+    expected = regular_weekend.combined_data.set_index("DRIVER")["race_score"].astype(float)
+    np.testing.assert_allclose(scores.loc[expected.index], expected, rtol=1e-6)
+    assert "ranker" in json.loads(order["factor_scores"][0])
+
+
+def test_archive_import_has_no_stale_metrics(regular_weekend, store, tmp_path):
+    archive = F1SessionArchive(str(tmp_path / "archive"))
+    regular_weekend.save_to_archive(archive, "w0")
+    regular_weekend.predict_top3()
+    assert regular_weekend.mse is not None
+
+    assert store.import_archive(archive, regular_weekend) == 1
+    metrics = pd.read_sql_query("SELECT mse, rmse FROM predictions", store.connection)
+    assert metrics.isna().all().all()
+
+
+def test_record_requires_a_prediction(regular_weekend, store):
+    with pytest.raises(ValueError):
+        store.record(regular_weekend)
+
+
+def test_podium_probabilities_match_the_predictor(regular_weekend, store):
+    regular_weekend.results_store = store
+    regular_weekend.predict_top3()
+
+    order = store.prediction_order(1).set_index("driver")
+    scores = regular_weekend.combined_data["race_score"].to_numpy(dtype=float)
+    expected = pd.Series(regular_weekend._podium_probabilities(scores, regular_weekend.rain_probability),
+                         index=list(regular_weekend.combined_data["DRIVER"]))
+    np.testing.assert_allclose(order["podium_probability"].loc[expected.index], expected, atol=1e-6)
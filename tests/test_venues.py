@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+
+def test_renamed_race_matches_the_database(predictor):
+    assert predictor._track_for("Bahrain GP") is predictor.track_database["Bahrain Grand Prix"]
+
+
+def test_add_venue_blends_similar_tracks(predictor):
+    track = predictor.add_venue("Madrid Grand Prix", overtaking_difficulty=6, tire_degradation=8)
+    assert track["overtaking_difficulty"] == 6
+    assert track["tire_degradation"] == 8
+    assert len(track["similar_to"]) == predictor.track_neighbours
+
+    neighbours = [predictor.track_database[race]["start_importance"] for race in track["similar_to"]]
+    assert min(neighbours) <= track["start_importance"] <= max(neighbours)
+
+    predictor.set_race("Madrid Grand Prix")
+    assert predictor.track["similar_to"] == track["similar_to"]
+
+
+def test_add_venue_rejects_unknown_features(predictor):
+    with pytest.raises(ValueError):
+        predictor.add_venue("Madrid Grand Prix", altitude=650)
+
+
+def test_unregistered_venue_gets_the_average_track(predictor):
+    track = predictor._track_for("Atlantis Grand Prix")
+    for key in ("overtaking_difficulty", "tire_degradation", "start_importance"):
+        expected = np.mean([t[key] for t in predictor.track_database.values()])
+        assert track[key] == pytest.approx(expected)
+    assert track["is_sprint"] is False
+
+
+@pytest.mark.parametrize("rain", [0.0, 0.35, 1.0])
+def test_blended_venue_weights(predictor, rain):
+    track = predictor.add_venue("Madrid Grand Prix", overtaking_difficulty=6, tire_degradation=8)
+    np.testing.assert_allclose(predictor._race_weights("Madrid Grand Prix", rain),
+                               predictor._factor_weights(track, rain), atol=1e-6)
+    australia = predictor._race_weights("Australian Grand Prix", rain)
+    assert not np.allclose(predictor._race_weights("Atlantis Grand Prix", rain), australia)
@@ -0,0 +1,33 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+
+@pytest.mark.parametrize("filename, kind", [
+    ("bahrain_fp2.csv", "practice"),
+    ("P3.csv", "practice"),
+    ("practice.csv", "practice"),
+    ("qualifying.csv", "quali"),
+    ("sprint_shootout.csv", "sprint_quali"),
+    ("sprint.csv", "sprint"),
+    ("fp2_laps.csv", None),
+    ("p.csv", None),
+    ("team_p_notes.csv", None),
+])
+def test_classify_session_file(predictor, filename, kind):
+    assert predictor._classify_session_file(filename) == kind
+
+
+def test_workers_standardize_names_like_the_parent(predictor, weekend_files, tmp_path):
+    weekend = tmp_path / "weekends" / "round1"
+    os.makedirs(weekend)
+    shutil.copy(weekend_files["quali"], weekend / "qualifying.csv")
+    practice = pd.read_csv(weekend_files["practice"])
+    practice.loc[0, "DRIVER"] = "Lindblad"
+    practice.to_csv(weekend / "practice.csv", index=False)
+
+    predictor.driver_experience["Arvid Lindblad"] = 0.5
+    loaded = predictor.load_weekends(str(tmp_path / "weekends"), max_threads=1, max_processes=1)
+    assert "Arvid Lindblad" in set(loaded["round1"]["practice"]["DRIVER_STD"])
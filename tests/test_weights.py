@@ -0,0 +1,43 @@
+import numpy as np
+
+
+def test_table_lookup_matches_direct_weights(predictor):
+    for race, track in predictor.track_database.items():
+        for rain in (0.0, 0.37, 1.0):
+            np.testing.assert_allclose(predictor._weights_for(race, rain, track),
+                                       predictor._factor_weights(track, rain))
+
+
+def test_weights_off_table_steps_are_computed(predictor):
+    track = predictor.track_database["Bahrain Grand Prix"]
+    np.testing.assert_allclose(predictor._weights_for("Bahrain Grand Prix", 0.3333, track),
+                               predictor._factor_weights(track, 0.3333))
+
+
+def test_update_track_rebuilds_tables_and_index(predictor):
+    race = "Bahrain Grand Prix"
+    before = predictor._weights_for(race, 0.0)
+    predictor.similar_tracks({"overtaking_difficulty": 2})
+
+    track = predictor.update_track(race, overtaking_difficulty=1, tire_degradation=10)
+    after = predictor._weights_for(race, 0.0)
+    assert not np.allclose(before, after)
+    np.testing.assert_allclose(after, predictor._factor_weights(track, 0.0))
+    assert predictor.similar_tracks({"overtaking_difficulty": 1, "tire_degradation": 10}, k=1)[0][0] == race
+
+
+def test_update_track_adds_new_race(predictor):
+    predictor.update_track("Madrid Grand Prix", name="Madring", overtaking_difficulty=5,
+                           tire_degradation=5, start_importance=6)
+    assert "Madrid Grand Prix" in predictor._similarity_index()["races"]
+    np.testing.assert_allclose(predictor._weights_for("Madrid Grand Prix", 0.5),
+                               predictor._factor_weights(predictor.track_database["Madrid Grand Prix"], 0.5))
+
+
+def test_in_place_edit_needs_invalidation(predictor):
+    race = "Monaco Grand Prix"
+    predictor._weights_for(race, 0.0)
+    predictor.track_database[race]["tire_degradation"] = 10
+    predictor.invalidate_track_tables()
+    np.testing.assert_allclose(predictor._weights_for(race, 0.0),
+                               predictor._factor_weights(predictor.track_database[race], 0.0))